@@ -0,0 +1,94 @@
+"""Write syscalls spent on a burst of binding messages.
+
+Simulates ``--chats`` calls sending a control message at once,
+like a mass pause/resume, and compares one write per message
+with the coalesced writes of :class:`~pytgcalls.binding.Binding`.
+Syscalls are read from ``/proc/self/io`` (Linux only).
+
+    python benchmarks/binding_coalescing.py --chats 200 --rounds 20
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytgcalls.binding import Binding  # noqa: E402
+from pytgcalls.framing import encode_frame  # noqa: E402
+
+SINK = "import sys\nwhile sys.stdin.buffer.read(65536):\n    pass\n"
+
+
+def write_syscalls():
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("syscw:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def message(chat_id: int, i: int):
+    return {
+        "data": {
+            "action": "pause" if i % 2 == 0 else "resume",
+            "chat_id": -1001000000000 - chat_id,
+            "solver_id": f"{chat_id:024d}",
+        },
+    }
+
+
+async def run(mode: str, chats: int, rounds: int):
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        SINK,
+        stdin=subprocess.PIPE,
+    )
+    binding = Binding(False)
+    binding._writer = process.stdin
+
+    async def unbatched(msg: dict):
+        process.stdin.write(encode_frame(binding._serializer.dumps(msg)))
+        await process.stdin.drain()
+
+    send = binding._send if mode == "coalesced" else unbatched
+    start_syscalls = write_syscalls()
+    start = perf_counter()
+    for i in range(rounds):
+        await asyncio.gather(
+            *(send(message(chat_id, i)) for chat_id in range(chats)),
+        )
+    elapsed = perf_counter() - start
+    end_syscalls = write_syscalls()
+    process.stdin.close()
+    await process.wait()
+    syscalls = None
+    if start_syscalls is not None and end_syscalls is not None:
+        syscalls = end_syscalls - start_syscalls
+    return syscalls, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chats", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    total = args.chats * args.rounds
+    for mode in ("per-message", "coalesced"):
+        syscalls, elapsed = asyncio.run(run(mode, args.chats, args.rounds))
+        print(
+            f"{mode:>12}: {total} messages, "
+            f"{syscalls if syscalls is not None else 'n/a'} write syscalls, "
+            f"{elapsed * 1000:.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
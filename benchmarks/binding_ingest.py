@@ -0,0 +1,104 @@
+"""Messages per second a single process ingests from the core.
+
+Feeds ``--messages`` frames from the NodeJS core, a mix of pings,
+logs, call results and update requests, through a pipe into the
+read loop of :class:`~pytgcalls.binding.Binding`.
+
+    python benchmarks/binding_ingest.py --messages 200000 --codec json
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytgcalls.binding import Binding  # noqa: E402
+from pytgcalls.framing import encode_frame  # noqa: E402
+from pytgcalls.serializer import Serializer  # noqa: E402
+
+
+def build_messages(count: int):
+    for i in range(count):
+        kind = i % 10
+        if kind == 0:
+            yield {"ping": True}
+        elif kind == 1:
+            yield {"log_message": f"Message {i}", "verbose_mode": 1}
+        elif kind < 5:
+            yield {"call_id": i, "data": {"result": "PAUSED", "chat_id": -i}}
+        else:
+            yield {
+                "uid": f"{i:012d}",
+                "data": {
+                    "action": "update_request",
+                    "result": "PLAYED_TIME",
+                    "time": i,
+                    "chat_id": -1001000000000 - i,
+                },
+            }
+
+
+async def run(codec: str, count: int):
+    loop = asyncio.get_running_loop()
+    read_fd, write_fd = os.pipe()
+    reader = asyncio.StreamReader(limit=2**20)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader),
+        os.fdopen(read_fd, "rb"),
+    )
+    transport, protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin,
+        os.fdopen(write_fd, "wb"),
+    )
+    writer = asyncio.StreamWriter(transport, protocol, None, loop)
+    serializer = Serializer()
+    serializer.use(codec)
+    frames = [
+        encode_frame(serializer.dumps(message)) for message in build_messages(count)
+    ]
+    total_bytes = sum(len(frame) for frame in frames)
+    binding = Binding(False)
+    binding._reader = reader
+    requests = 0
+
+    @binding.on_update()
+    async def update_handler(_: dict):
+        nonlocal requests
+        requests += 1
+        return {"result": "OK"}
+
+    async def produce():
+        for frame in frames:
+            writer.write(frame)
+        await writer.drain()
+        writer.close()
+
+    start = perf_counter()
+    await asyncio.gather(produce(), binding._read_loop(0, False))
+    elapsed = perf_counter() - start
+    # Let the update requests spawned by the read loop finish
+    while requests < sum(1 for i in range(count) if i % 10 >= 5):
+        await asyncio.sleep(0)
+    print(
+        f"[{codec}] {count} messages, "
+        f"{total_bytes / 1024 / 1024:.1f} MiB in {elapsed:.2f}s -> "
+        f"{count / elapsed:,.0f} msg/s, "
+        f"{total_bytes / 1024 / 1024 / elapsed:.1f} MiB/s",
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument(
+        "--codec",
+        choices=sorted(Serializer.available()),
+        default=Serializer.JSON,
+    )
+    args = parser.parse_args()
+    logging.getLogger("pytgcalls").setLevel(logging.WARNING)
+    asyncio.run(run(args.codec, args.messages))
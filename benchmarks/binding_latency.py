@@ -0,0 +1,75 @@
+"""Latency of control commands sent to the NodeJS core.
+
+Starts the core built into ``pytgcalls/dist`` and sends ``--rounds``
+pause commands to each of ``--chats`` chats at once. No chat is in
+a call, so the time measured is the queueing and dispatching of the
+request inside the core and its round trip through the binding.
+
+    python benchmarks/binding_latency.py --chats 1 100 1000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytgcalls.binding import Binding  # noqa: E402
+
+
+def percentile(samples: list, fraction: float) -> float:
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+async def run(chats: int, rounds: int):
+    loop = asyncio.get_running_loop()
+    binding = Binding(False)
+    started = loop.create_future()
+    connected = loop.create_future()
+
+    @binding.on_connect()
+    async def on_connect():
+        connected.set_result(None)
+
+    core = asyncio.ensure_future(binding.connect(started, 0))
+    await started
+    await connected
+    samples = []
+
+    async def pause(chat_id: int):
+        start = perf_counter()
+        await binding.call("pause", {"chat_id": chat_id})
+        samples.append((perf_counter() - start) * 1000)
+
+    for _ in range(rounds):
+        await asyncio.gather(
+            *(pause(-1001000000000 - chat_id) for chat_id in range(chats)),
+        )
+    await binding.stop()
+    await core
+    samples.sort()
+    print(
+        f"{chats:>5} chats: {len(samples)} commands, "
+        f"p50 {percentile(samples, 0.5):.2f} ms, "
+        f"p99 {percentile(samples, 0.99):.2f} ms, "
+        f"max {samples[-1]:.2f} ms",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chats", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    core = os.path.join(os.path.dirname(__file__), "..", "pytgcalls", "dist")
+    if not os.path.isfile(os.path.join(core, "index.js")):
+        # The binding would keep respawning a core that can't start
+        sys.exit("Build the NodeJS core into pytgcalls/dist first")
+    for chats in args.chats:
+        asyncio.run(run(chats, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
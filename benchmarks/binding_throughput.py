@@ -0,0 +1,101 @@
+"""Throughput of the framed binding protocol.
+
+Simulates ``--chats`` concurrent calls each sending progress
+and control messages through a pipe, decoded the same way
+:class:`~pytgcalls.binding.Binding` does it.
+
+    python benchmarks/binding_throughput.py --chats 1000 --rounds 50 --codec json
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytgcalls.framing import FrameDecoder, encode_frame  # noqa: E402
+from pytgcalls.serializer import Serializer  # noqa: E402
+
+
+def build_messages(chats: int, rounds: int):
+    for i in range(rounds):
+        for chat_id in range(chats):
+            if i % 10 == 0:
+                data = {
+                    "action": "pause" if i % 20 == 0 else "resume",
+                    "chat_id": -1001000000000 - chat_id,
+                    "solver_id": f"{chat_id:024d}",
+                }
+            else:
+                data = {
+                    "action": "update_request",
+                    "result": "PLAYED_TIME",
+                    "time": i,
+                    "chat_id": -1001000000000 - chat_id,
+                }
+            yield {"data": data}
+
+
+async def run(codec: str, chats: int, rounds: int):
+    loop = asyncio.get_running_loop()
+    read_fd, write_fd = os.pipe()
+    reader = asyncio.StreamReader(limit=2**20)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader),
+        os.fdopen(read_fd, "rb"),
+    )
+    transport, protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin,
+        os.fdopen(write_fd, "wb"),
+    )
+    writer = asyncio.StreamWriter(transport, protocol, None, loop)
+    serializer = Serializer()
+    serializer.use(codec)
+    messages = list(build_messages(chats, rounds))
+    total_bytes = 0
+
+    async def produce():
+        nonlocal total_bytes
+        for message in messages:
+            frame = encode_frame(serializer.dumps(message))
+            total_bytes += len(frame)
+            writer.write(frame)
+            await writer.drain()
+        writer.close()
+
+    async def consume():
+        decoder = FrameDecoder()
+        received = 0
+        while True:
+            chunk = await reader.read(256 * 1024)
+            if not chunk:
+                return received
+            for frame in decoder.feed(chunk):
+                Serializer.loads(frame)
+                received += 1
+
+    start = perf_counter()
+    _, received = await asyncio.gather(produce(), consume())
+    elapsed = perf_counter() - start
+    assert received == len(messages)
+    print(
+        f"[{codec}] {chats} chats x {rounds} rounds: {received} messages, "
+        f"{total_bytes / 1024 / 1024:.1f} MiB in {elapsed:.2f}s -> "
+        f"{received / elapsed:,.0f} msg/s, "
+        f"{total_bytes / 1024 / 1024 / elapsed:.1f} MiB/s",
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chats", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument(
+        "--codec",
+        choices=sorted(Serializer.available()),
+        default=Serializer.JSON,
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.codec, args.chats, args.rounds))
@@ -0,0 +1,75 @@
+"""Time spent by ``import pytgcalls`` in a fresh interpreter.
+
+Runs ``python -X importtime -c "import pytgcalls"`` ``--runs`` times
+and reports the best cumulative time of the package, with the slowest
+modules it pulled in. Exits with an error if the best run is over
+``--budget`` milliseconds or if any of the modules that must be loaded
+on first use, like aiohttp, has been imported.
+
+    python benchmarks/import_time.py --runs 10 --budget 150
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+LAZY_MODULES = (
+    "aiohttp",
+    "psutil",
+    "screeninfo",
+    "pytgcalls.custom_api",
+    "pytgcalls.media_devices.media_devices",
+)
+CHECK = (
+    "import sys\n"
+    "import pytgcalls\n"
+    f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))\n"
+)
+
+
+def import_times():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECK],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # import time:  <self us> | <cumulative us> | <module>
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(cumulative_us), int(self_us))
+    loaded = [module for module in result.stdout.strip().split(",") if module]
+    return times, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=150)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    runs = [import_times() for _ in range(args.runs)]
+    times, loaded = min(runs, key=lambda run: run[0]["pytgcalls"][0])
+    total = times["pytgcalls"][0] / 1000
+    print(f"import pytgcalls: {total:.1f} ms (best of {args.runs})")
+    slowest = sorted(times.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (_, self_us) in slowest[: args.top]:
+        print(f"  {self_us / 1000:7.2f} ms  {name}")
+    failed = False
+    if loaded:
+        print(f"Loaded at import time: {', '.join(loaded)}")
+        failed = True
+    if total > args.budget:
+        print(f"Over the budget of {args.budget:.0f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
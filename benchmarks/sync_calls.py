@@ -0,0 +1,70 @@
+"""Latency of sync API calls made from many threads.
+
+Runs ``--calls`` calls of a trivial coroutine from ``--threads``
+threads at once, against a loop running on its own thread, once with
+a ``run_coroutine_threadsafe`` per call and once through the batched
+submissions of :class:`~pytgcalls.sync.LoopThread`.
+
+    python benchmarks/sync_calls.py --threads 1 16 64 --calls 20000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytgcalls.sync import LoopThread  # noqa: E402
+
+
+async def noop(i: int) -> int:
+    return i
+
+
+def percentile(samples: list, fraction: float) -> float:
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+def run(mode: str, threads: int, calls: int):
+    loop_thread = LoopThread(asyncio.new_event_loop())
+    loop_thread.start()
+    loop = loop_thread.loop
+
+    def call(i: int) -> float:
+        start = perf_counter()
+        if mode == "batched":
+            loop_thread.run(noop(i))
+        else:
+            asyncio.run_coroutine_threadsafe(noop(i), loop).result()
+        return perf_counter() - start
+
+    start = perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        samples = sorted(executor.map(call, range(calls)))
+    elapsed = perf_counter() - start
+    loop_thread.stop()
+    loop.close()
+    return samples, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+    for threads in args.threads:
+        for mode in ("per-call", "batched"):
+            samples, elapsed = run(mode, threads, args.calls)
+            print(
+                f"{threads:>3} threads {mode:>8}: "
+                f"{args.calls / elapsed:,.0f} calls/s, "
+                f"p50 {percentile(samples, 0.5) * 1e6:.0f} us, "
+                f"p99 {percentile(samples, 0.99) * 1e6:.0f} us",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,24 @@
-from .custom_api import CustomApi
+from typing import TYPE_CHECKING
+
 from .pytgcalls import PyTgCalls
 from .stream_type import StreamType
 from .sync import idle
 
+if TYPE_CHECKING:
+    from .custom_api import CustomApi
+
 __all__ = (
     "idle",
     "CustomApi",
     "PyTgCalls",
     "StreamType",
 )
+
+
+def __getattr__(name: str):
+    # CustomApi pulls in aiohttp.web, it is only loaded when used
+    if name == "CustomApi":
+        from .custom_api import CustomApi
+
+        return CustomApi
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
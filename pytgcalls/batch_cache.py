@@ -0,0 +1,39 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+# Results of the probes made while a batch is running, the tasks
+# of the batch inherit the context and share the same dictionary
+_cache: ContextVar[Optional[Dict[Hashable, asyncio.Future]]] = ContextVar(
+    "pytgcalls_batch_cache",
+    default=None,
+)
+
+
+@contextmanager
+def batch_cache():
+    token = _cache.set({})
+    try:
+        yield
+    finally:
+        _cache.reset(token)
+
+
+async def cached(
+    key: Hashable,
+    factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    cache = _cache.get()
+    if cache is None:
+        return await factory()
+    future = cache.get(key)
+    if future is None:
+        future = cache[key] = asyncio.ensure_future(factory())
+    return await asyncio.shield(future)
+
+
+def headers_key(headers: Optional[Dict[str, str]]) -> Optional[tuple]:
+    if not headers:
+        return None
+    return tuple(sorted(headers.items()))
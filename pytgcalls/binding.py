@@ -1,33 +1,83 @@
 import asyncio
-import json
 import logging
 import os
 import signal
+import socket
 import subprocess
 import sys
-from asyncio import Future
+import tempfile
+from asyncio import Future, StreamReader, StreamWriter
 from asyncio.subprocess import Process
-from json import JSONDecodeError
+from itertools import count
 from time import time
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from .types.session import Session
+from .exceptions import InvalidTransport, NodeJSNotRunning, NodeJSTimeout
+from .framing import FrameDecoder, encode_frame
+from .metrics import Histogram, Throughput
+from .serializer import Serializer
+from .types.binding_stats import ActionStats, BindingStats
+from .types.update_solver import UpdateSolver
 
 py_logger = logging.getLogger("pytgcalls")
 
 
 class Binding:
+    STDIO = "stdio"
+    UDS = "uds"
+
+    _READ_SIZE = 256 * 1024
+    _SOCKET_TIMEOUT = 10
+    _WATCHDOG_INTERVAL = 2
+    _WATCHDOG_TIMEOUT = 5
+    _LOG_LEVEL_INTERVAL = 2
+    _STABLE_TIME = 30
+    _MAX_RESTART_DELAY = 30
+    CALL_TIMEOUT = 30
+
     def __init__(
         self,
         overload_quiet_mode: bool,
+        transport: str = STDIO,
+        socket_buffer_size: Optional[int] = None,
+        threads: int = 0,
+        progress_interval: float = 1.0,
     ):
+        if transport not in (self.STDIO, self.UDS):
+            raise InvalidTransport(transport)
+        if transport == self.UDS and not hasattr(socket, "AF_UNIX"):
+            raise InvalidTransport(transport)
         self._js_process: Optional[Process] = None
+        self._transport = transport
+        self._socket_buffer_size = socket_buffer_size
+        self._threads = threads
+        self._progress_interval = progress_interval
+        self._socket_path: Optional[str] = None
+        self._reader: Optional[StreamReader] = None
+        self._writer: Optional[StreamWriter] = None
+        self._write_queue: List[bytes] = []
+        self._flush_task: Optional[Future] = None
+        self._call_ids = count(1)
+        self._pending_calls = UpdateSolver()
         self._ssid = ""
         self._on_request: Optional[Callable] = None
         self._on_connect: Optional[Callable] = None
+        self._on_restart: Optional[Callable] = None
+        self._on_progress: Optional[Callable] = None
+        self._user_id: Union[int, Future] = 0
+        self._restarted = False
+        self._log_level = 0
+        self._stopped = False
+        self._watchdog_task: Optional[asyncio.Task] = None
+        self.restarts = 0
         self._last_ping = 0
-        self._waiting_ping: Dict[str, Future] = {}
+        self._waiting_ping: Dict[int, Future] = {}
         self._overload_quiet = overload_quiet_mode
+        self._serializer = Serializer()
+        self._rtt = Histogram()
+        self._actions: Dict[str, Dict[str, Histogram]] = {}
+        self._sent = Throughput()
+        self._received = Throughput()
 
         """
         def cleanup():
@@ -75,13 +125,29 @@ class Binding:
 
         return decorator
 
+    def on_restart(self):
+        def decorator(func: Callable) -> Callable:
+            if self is not None:
+                self._on_restart = func
+            return func
+
+        return decorator
+
+    def on_progress(self):
+        def decorator(func: Callable) -> Callable:
+            if self is not None:
+                self._on_progress = func
+            return func
+
+        return decorator
+
     def is_alive(self):
         return int(time()) - self._last_ping < 15
 
     @property
     async def ping(self) -> float:
         start_time = time()
-        session = Session.generate_session_id(15)
+        session = next(self._call_ids)
         loop = asyncio.get_event_loop()
         self._waiting_ping[session] = loop.create_future()
         await self._send(
@@ -90,9 +156,13 @@ class Binding:
                 "sid": session,
             }
         )
-        await self._waiting_ping[session]
-        del self._waiting_ping[session]
-        return (time() - start_time) * 1000.0
+        try:
+            await self._waiting_ping[session]
+        finally:
+            del self._waiting_ping[session]
+        rtt = (time() - start_time) * 1000.0
+        self._rtt.add(rtt)
+        return rtt
 
     @property
     def _run_folder(self):
@@ -101,103 +171,275 @@ class Binding:
     async def connect(
         self,
         event: Future,
-        user_id: int,
+        user_id: Union[int, Future],
     ):
-        if self._js_process is None:
+        # The user id is only needed by the handshake, so it can
+        # be a future and the core can start before the client
+        if self._js_process is not None:
+            return
+        loop = asyncio.get_event_loop()
+        self._stopped = False
+        failures = 0
+        while True:
+            started_at = loop.time()
+            try:
+                await self._spawn()
+            except Exception as e:
+                if not event.done():
+                    event.set_exception(e)
+                    return
+                py_logger.error(f"Unable to restart the Node.js core: {e}")
+            else:
+                if not event.done():
+                    event.set_result(None)
+                log_level_sync = asyncio.ensure_future(self._log_level_sync())
+                await self._read_loop(user_id, self.restarts > 0)
+                log_level_sync.cancel()
+                if self._watchdog_task is not None:
+                    self._watchdog_task.cancel()
+                    self._watchdog_task = None
+            # The core is gone, nobody is going to answer the pending calls
+            self._pending_calls.reject_all(NodeJSNotRunning)
+            if self._stopped:
+                break
+            await self._terminate()
+            # Respawn right away, backing off if the core keeps crashing
+            if loop.time() - started_at < self._STABLE_TIME:
+                failures += 1
+            else:
+                failures = 0
+            self.restarts += 1
+            py_logger.warning(
+                "Node.js core stopped, restarting it " f"(restart #{self.restarts})",
+            )
+            if failures > 1:
+                await asyncio.sleep(
+                    min(2 ** (failures - 2), self._MAX_RESTART_DELAY),
+                )
+
+    async def _spawn(self):
+        args = [
+            "node",
+            os.path.join(self._run_folder, "dist", "index.js"),
+        ]
+        if self._threads > 0:
+            args += ["--threads", str(self._threads)]
+        # A new core always starts talking json
+        self._serializer = Serializer()
+        if self._transport == self.UDS:
+            # Control traffic goes through the socket, the stdout of
+            # the core is inherited and left to its diagnostics
+            self._socket_path = os.path.join(
+                tempfile.gettempdir(),
+                f"pytgcalls-{os.getpid()}-{id(self)}.sock",
+            )
+            self._js_process = await asyncio.create_subprocess_exec(
+                *args,
+                "--socket",
+                self._socket_path,
+            )
+            self._reader, self._writer = await self._open_socket()
+        else:
             self._js_process = await asyncio.create_subprocess_exec(
-                "node",
-                os.path.join(self._run_folder, "dist", "index.js"),
+                *args,
                 stdout=subprocess.PIPE,
                 stdin=subprocess.PIPE,
             )
-            event.set_result(None)
-            while True:
+            self._reader = self._js_process.stdout
+            self._writer = self._js_process.stdin
+
+    async def _watchdog(self):
+        # Exits are noticed as soon as the stream ends, this catches
+        # a core that is still running but stopped answering
+        while True:
+            await asyncio.sleep(self._WATCHDOG_INTERVAL)
+            try:
+                await asyncio.wait_for(self.ping, self._WATCHDOG_TIMEOUT)
+            except asyncio.TimeoutError:
+                # stop() may have terminated the core during the ping
+                process = self._js_process
+                if self._stopped or process is None:
+                    return
+                py_logger.warning("Node.js core isn't answering, killing it")
                 try:
-                    if self._js_process.stdout is None:
-                        break
-                    out = (
-                        (await self._js_process.stdout.readline())
-                        .decode()
-                        .replace("\r", "")
-                    )
-                    if not out:
-                        break
-                    list_data = out.split("\n")
-                    for update in list_data:
-                        try:
-                            json_out = json.loads(update)
-                            if "ping_with_response" in json_out:
-                                session_id = json_out["sid"]
-                                if session_id in self._waiting_ping:
-                                    self._waiting_ping[session_id].set_result(
-                                        None,
-                                    )
-                            if "ping" in json_out:
-                                self._last_ping = int(time())
-                            if "try_connect" in json_out:
-                                self._ssid = json_out["try_connect"]
-                                asyncio.ensure_future(
-                                    self._send(
-                                        {
-                                            "try_connect": "connected",
-                                            "user_id": user_id,
-                                            "overload_quiet": self._overload_quiet,
-                                        }
-                                    ),
-                                )
-                                if self._on_connect is not None:
-                                    asyncio.ensure_future(self._on_connect())
-                            elif "ssid" in json_out and "uid" in json_out:
-                                if json_out["ssid"] == self._ssid:
-                                    if self._on_request is not None:
-
-                                        async def future_response(
-                                            future_json_out: dict,
-                                        ):
-                                            if self._on_request is None:
-                                                return
-                                            result = await self._on_request(
-                                                future_json_out["data"],
-                                            )
-                                            if isinstance(result, dict):
-                                                await self._send_response(
-                                                    result,
-                                                    future_json_out["uid"],
-                                                )
-                                            else:
-                                                await self._send_error(
-                                                    "INVALID_RESPONSE",
-                                                    future_json_out["uid"],
-                                                )
-
-                                        asyncio.ensure_future(
-                                            future_response(json_out),
-                                        )
-                            elif (
-                                "log_message" in json_out and "verbose_mode" in json_out
-                            ):
-                                if json_out["verbose_mode"] == 1:
-                                    py_logger.debug(json_out["log_message"])
-                                elif json_out["verbose_mode"] == 2:
-                                    py_logger.info(json_out["log_message"])
-                                elif json_out["verbose_mode"] == 3:
-                                    py_logger.warning(json_out["log_message"])
-                                elif json_out["verbose_mode"] == 4:
-                                    py_logger.error(json_out["log_message"])
-                        except JSONDecodeError:
-                            if update:
-                                if ":replace_line:" in update:
-                                    print(
-                                        update.replace(
-                                            ":replace_line:",
-                                            "",
-                                        ),
-                                        end="\r",
-                                    )
-                                else:
-                                    print(update)
-                except TimeoutError:
+                    process.kill()
+                except OSError:
                     pass
+                return
+
+    async def _read_loop(self, user_id: Union[int, Future], restarted: bool):
+        self._user_id = user_id
+        self._restarted = restarted
+        decoder = FrameDecoder()
+        handlers = self._handlers
+        loads = Serializer.loads
+        while True:
+            if self._reader is None:
+                break
+            chunk = await self._reader.read(self._READ_SIZE)
+            if not chunk:
+                break
+            try:
+                frames = decoder.feed(chunk)
+            except ValueError as e:
+                py_logger.error(f"Invalid frame from Node.js core: {e}")
+                break
+            self._received.add(len(chunk), len(frames))
+            for frame in frames:
+                try:
+                    json_out = loads(frame)
+                except ValueError:
+                    py_logger.error("Invalid message from Node.js core")
+                    continue
+                # Every message carries a single key telling its type
+                for key in json_out:
+                    handler = handlers.get(key)
+                    if handler is not None:
+                        handler(self, json_out)
+                        break
+
+    def _on_ping_response(self, json_out: dict):
+        future = self._waiting_ping.get(json_out["sid"])
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def _on_ping(self, _: dict):
+        self._last_ping = int(time())
+
+    def _on_try_connect(self, json_out: dict):
+        self._ssid = json_out["try_connect"]
+        asyncio.ensure_future(self._handshake(json_out))
+
+    async def _handshake(self, json_out: dict):
+        user_id = self._user_id
+        if isinstance(user_id, Future):
+            user_id = await user_id
+        codec = self._serializer.negotiate(
+            json_out.get("codecs", [Serializer.JSON]),
+        )
+        await self._send(
+            {
+                "try_connect": "connected",
+                "user_id": user_id,
+                "overload_quiet": self._overload_quiet,
+                "codec": codec,
+                "log_level": self._core_log_level(),
+                "progress_interval": round(self._progress_interval * 1000),
+            }
+        )
+        # Loading wrtc may take a while, the core is only expected
+        # to answer the pings once the handshake is done
+        if self._watchdog_task is None:
+            self._watchdog_task = asyncio.ensure_future(self._watchdog())
+        if self._restarted:
+            if self._on_restart is not None:
+                await self._on_restart()
+        elif self._on_connect is not None:
+            await self._on_connect()
+
+    def _core_log_level(self) -> int:
+        # Lowest level of the core that the pytgcalls logger
+        # doesn't filter out, the core drops everything below it
+        self._log_level = len(self._LOG_LEVELS) + 1
+        for level, py_level in self._LOG_LEVELS.items():
+            if py_logger.isEnabledFor(py_level):
+                self._log_level = level
+                break
+        return self._log_level
+
+    async def _log_level_sync(self):
+        # logging has no hook for level changes, the level of the
+        # pytgcalls logger is checked on a timer and sent on change
+        while True:
+            await asyncio.sleep(self._LOG_LEVEL_INTERVAL)
+            try:
+                await self._sync_log_level()
+            except Exception as e:
+                py_logger.debug(f"Unable to send the log level: {e}")
+
+    async def _sync_log_level(self):
+        log_level = self._log_level
+        if self._ssid and log_level != self._core_log_level():
+            await self._send(
+                {
+                    "log_level": self._log_level,
+                }
+            )
+
+    def _on_call_result(self, json_out: dict):
+        self._pending_calls.resolve_future_update(
+            json_out["call_id"],
+            json_out,
+        )
+
+    def _on_core_request(self, json_out: dict):
+        if self._on_request is not None:
+            asyncio.ensure_future(self._solve_core_request(json_out))
+
+    async def _solve_core_request(self, json_out: dict):
+        if self._on_request is None:
+            return
+        result = await self._on_request(json_out["data"])
+        if isinstance(result, dict):
+            await self._send_response(result, json_out["uid"])
+        else:
+            await self._send_error("INVALID_RESPONSE", json_out["uid"])
+
+    def _on_progress_update(self, json_out: dict):
+        if self._on_progress is not None:
+            self._on_progress(json_out["progress"])
+
+    def _on_log_message(self, json_out: dict):
+        level = self._LOG_LEVELS.get(json_out.get("verbose_mode"))
+        if level is not None:
+            py_logger.log(level, json_out["log_message"])
+
+    _LOG_LEVELS = {
+        1: logging.DEBUG,
+        2: logging.INFO,
+        3: logging.WARNING,
+        4: logging.ERROR,
+    }
+
+    _handlers: Dict[str, Callable] = {
+        "ping_with_response": _on_ping_response,
+        "ping": _on_ping,
+        "try_connect": _on_try_connect,
+        "call_id": _on_call_result,
+        "uid": _on_core_request,
+        "log_message": _on_log_message,
+        "progress": _on_progress_update,
+    }
+
+    async def _open_socket(self):
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self._SOCKET_TIMEOUT
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    self._socket_path,
+                    limit=self._READ_SIZE,
+                )
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                if self._js_process.returncode is not None:
+                    raise NodeJSNotRunning()
+                if loop.time() > deadline:
+                    raise NodeJSNotRunning()
+                await asyncio.sleep(0.05)
+        if self._socket_buffer_size is not None:
+            sock = writer.get_extra_info("socket")
+            sock.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_SNDBUF,
+                self._socket_buffer_size,
+            )
+            sock.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_RCVBUF,
+                self._socket_buffer_size,
+            )
+        return reader, writer
 
     async def _send_response(self, json_data: dict, uid: str):
         if self._ssid:
@@ -205,7 +447,6 @@ class Binding:
                 {
                     "data": json_data,
                     "uid": uid,
-                    "ssid": self._ssid,
                 }
             )
 
@@ -215,7 +456,6 @@ class Binding:
                 {
                     "err_mess": err_mess,
                     "uid": uid,
-                    "ssid": self._ssid,
                 }
             )
 
@@ -223,39 +463,164 @@ class Binding:
         await self._send(
             {
                 "data": json_data,
-                "ssid": self._ssid,
             }
         )
 
-    async def _send(self, json_data: dict):
+    async def call(
+        self,
+        action: str,
+        payload: dict,
+        timeout: Optional[float] = CALL_TIMEOUT,
+    ) -> Any:
+        if self._writer is None:
+            raise NodeJSNotRunning()
+        call_id = next(self._call_ids)
+        future = self._pending_calls.create_future_update(
+            call_id,
+            timeout,
+            NodeJSTimeout(action),
+        )
+        start_time = time()
         try:
-            if self._js_process is not None:
-                if self._js_process.stdin is not None:
-                    self._js_process.stdin.write(
-                        json.dumps(json_data).encode(),
+            await self._send(
+                {
+                    "data": {
+                        **payload,
+                        "action": action,
+                        "call_id": call_id,
+                    },
+                }
+            )
+            sent_time = time()
+            reply = await future
+        finally:
+            self._pending_calls.discard_future_update(call_id)
+        histograms = self._actions.get(action)
+        if histograms is None:
+            histograms = self._actions[action] = {
+                "total": Histogram(),
+                "send": Histogram(),
+                "core": Histogram(),
+            }
+        histograms["total"].add((time() - start_time) * 1000.0)
+        histograms["send"].add((sent_time - start_time) * 1000.0)
+        if "core_time" in reply:
+            histograms["core"].add(reply["core_time"])
+        return reply.get("data")
+
+    def binding_stats(self) -> BindingStats:
+        return self._build_stats(
+            [self._rtt],
+            [self._actions],
+            [self._sent],
+            [self._received],
+            [self._pending_calls],
+            self.restarts,
+        )
+
+    @staticmethod
+    def _build_stats(
+        rtt: List[Histogram],
+        actions: List[Dict[str, Dict[str, Histogram]]],
+        sent: List[Throughput],
+        received: List[Throughput],
+        pending_calls: List[UpdateSolver],
+        restarts: int,
+    ) -> BindingStats:
+        sent_total = Throughput.merge(sent)
+        received_total = Throughput.merge(received)
+        names = sorted({name for histograms in actions for name in histograms})
+        return BindingStats(
+            Histogram.merge(rtt).stats(),
+            {
+                name: ActionStats(
+                    *(
+                        Histogram.merge(
+                            histograms[name][kind]
+                            for histograms in actions
+                            if name in histograms
+                        ).stats()
+                        for kind in ("total", "send", "core")
                     )
-                    await self._js_process.stdin.drain()
-        except ConnectionResetError:
-            pass
+                )
+                for name in names
+            },
+            sent_total.bytes_per_second(),
+            sent_total.messages_per_second(),
+            received_total.bytes_per_second(),
+            received_total.messages_per_second(),
+            sum(len(solver) for solver in pending_calls),
+            max(
+                (solver.oldest_age() * 1000.0 for solver in pending_calls),
+                default=0.0,
+            ),
+            sum(solver.expired for solver in pending_calls),
+            restarts,
+        )
+
+    async def _send(self, json_data: dict):
+        if self._writer is None:
+            return
+        self._write_queue.append(
+            encode_frame(self._serializer.dumps(json_data)),
+        )
+        # Frames queued during the same loop iteration are written
+        # together by a single flush, which also owns the drain
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush())
+        await asyncio.shield(self._flush_task)
+
+    async def _flush(self):
+        try:
+            while self._write_queue and self._writer is not None:
+                data = b"".join(self._write_queue)
+                self._sent.add(len(data), len(self._write_queue))
+                self._write_queue.clear()
+                self._writer.write(data)
+                await self._writer.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            self._write_queue.clear()
+        finally:
+            self._flush_task = None
 
     async def stop(self):
+        self._stopped = True
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+        self._pending_calls.reject_all(NodeJSNotRunning)
+        if self._js_process is not None:
+            await self._terminate()
+            py_logger.info("Node.js subprocess dihentikan manual")
+
+    async def _terminate(self):
+        if self._transport == self.UDS and self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+        self._write_queue.clear()
         if self._js_process is not None:
+            # The read loop owns the stdout of the core, so only wait
+            # for the exit instead of communicating with it
             try:
                 if not sys.platform.startswith("win"):
                     self._js_process.send_signal(signal.SIGINT)
                     await asyncio.wait_for(
-                        self._js_process.communicate(),
+                        self._js_process.wait(),
                         timeout=3,
                     )
                 else:
                     self._js_process.kill()
-                    await self._js_process.communicate()
-            except subprocess.TimeoutExpired:
+                    await self._js_process.wait()
+            except asyncio.TimeoutError:
                 py_logger.warning("Node.js tidak mati bersih, paksa kill...")
                 self._js_process.kill()
-                await self._js_process.communicate()
+                await self._js_process.wait()
             except ProcessLookupError:
                 pass
-
-            py_logger.info("Node.js subprocess dihentikan manual")
             self._js_process = None
+        if self._socket_path is not None:
+            try:
+                os.unlink(self._socket_path)
+            except FileNotFoundError:
+                pass
+            self._socket_path = None
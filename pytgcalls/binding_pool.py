@@ -0,0 +1,261 @@
+import asyncio
+from asyncio import Future
+from bisect import bisect
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+from zlib import crc32
+
+from .binding import Binding
+from .types.binding_stats import BindingStats
+
+
+class BindingPool:
+    # Each core owns several points of the hash ring, so chats
+    # spread evenly and only move if the number of cores changes
+    _VIRTUAL_NODES = 64
+
+    def __init__(
+        self,
+        workers: int,
+        overload_quiet_mode: bool,
+        transport: str = Binding.STDIO,
+        socket_buffer_size: Optional[int] = None,
+        threads: int = 0,
+        progress_interval: float = 1.0,
+    ):
+        self._bindings = [
+            Binding(
+                overload_quiet_mode,
+                transport,
+                socket_buffer_size,
+                threads,
+                progress_interval,
+            )
+            for _ in range(workers)
+        ]
+        ring = sorted(
+            (crc32(f"{index}:{node}".encode()), index)
+            for index in range(workers)
+            for node in range(self._VIRTUAL_NODES)
+        )
+        self._ring_keys = [key for key, _ in ring]
+        self._ring_values = [index for _, index in ring]
+        self._pinned: Dict[int, int] = {}
+        self._load = [0] * workers
+        self._connected: Set[int] = set()
+        self._on_connect: Optional[Callable] = None
+
+    def on_update(self) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            for binding in self._bindings:
+                binding.on_update()(func)
+            return func
+
+        return decorator
+
+    def on_connect(self):
+        def decorator(func: Callable) -> Callable:
+            self._on_connect = func
+            return func
+
+        return decorator
+
+    def on_progress(self):
+        def decorator(func: Callable) -> Callable:
+            for binding in self._bindings:
+                binding.on_progress()(func)
+            return func
+
+        return decorator
+
+    def on_restart(self):
+        def decorator(func: Callable) -> Callable:
+            for index, binding in enumerate(self._bindings):
+                binding.on_restart()(self._restart_handler(index, func))
+            return func
+
+        return decorator
+
+    def _restart_handler(self, index: int, func: Callable) -> Callable:
+        async def on_restart():
+            # Only the calls pinned to the restarted core are gone
+            await func(
+                [chat_id for chat_id, pin in self._pinned.items() if pin == index],
+            )
+
+        return on_restart
+
+    @property
+    def restarts(self) -> int:
+        return sum(binding.restarts for binding in self._bindings)
+
+    def binding_stats(self) -> BindingStats:
+        bindings = self._bindings
+        return Binding._build_stats(
+            [binding._rtt for binding in bindings],
+            [binding._actions for binding in bindings],
+            [binding._sent for binding in bindings],
+            [binding._received for binding in bindings],
+            [binding._pending_calls for binding in bindings],
+            self.restarts,
+        )
+
+    def is_alive(self):
+        return all(binding.is_alive() for binding in self._bindings)
+
+    @property
+    async def ping(self) -> float:
+        pings = await asyncio.gather(
+            *(binding.ping for binding in self._bindings),
+        )
+        return max(pings)
+
+    async def connect(
+        self,
+        event: Future,
+        user_id: Union[int, Future],
+    ):
+        loop = asyncio.get_event_loop()
+        started = [loop.create_future() for _ in self._bindings]
+        tasks = []
+        for index, binding in enumerate(self._bindings):
+            binding.on_connect()(self._connect_handler(index))
+            task = asyncio.ensure_future(
+                binding.connect(started[index], user_id),
+            )
+            task.add_done_callback(self._start_failed(started[index]))
+            tasks.append(task)
+        try:
+            await asyncio.gather(*started)
+        except Exception as e:
+            event.set_exception(e)
+        else:
+            event.set_result(None)
+        await asyncio.gather(*tasks)
+
+    def _connect_handler(self, index: int) -> Callable:
+        async def on_connect():
+            # on_connect is fired once every core is connected
+            was_connected = len(self._connected) == len(self._bindings)
+            self._connected.add(index)
+            if was_connected or len(self._connected) != len(self._bindings):
+                return
+            if self._on_connect is not None:
+                await self._on_connect()
+
+        return on_connect
+
+    @staticmethod
+    def _start_failed(started: Future) -> Callable:
+        def callback(task: Future):
+            if started.done() or task.cancelled():
+                return
+            if task.exception() is not None:
+                started.set_exception(task.exception())
+
+        return callback
+
+    def _route(self, action: Optional[str], chat_id: Optional[int]) -> int:
+        index = self._pinned.get(chat_id)
+        if index is not None:
+            return index
+        if action == "join_call":
+            index = min(
+                range(len(self._bindings)),
+                key=self._load.__getitem__,
+            )
+            self._pinned[chat_id] = index
+            self._load[index] += 1
+            return index
+        position = bisect(self._ring_keys, crc32(str(chat_id).encode()))
+        return self._ring_values[position % len(self._ring_values)]
+
+    def _unpin(self, chat_id: Optional[int]):
+        index = self._pinned.pop(chat_id, None)
+        if index is not None:
+            self._load[index] -= 1
+
+    async def call(
+        self,
+        action: str,
+        payload: dict,
+        timeout: Optional[float] = Binding.CALL_TIMEOUT,
+    ) -> Any:
+        if action == "batch":
+            return await self._call_batch(payload, timeout)
+        chat_id = payload.get("chat_id")
+        binding = self._bindings[self._route(action, chat_id)]
+        try:
+            result = await binding.call(action, payload, timeout)
+        except Exception:
+            if action == "join_call":
+                self._unpin(chat_id)
+            raise
+        if action == "leave_call" or (
+            action == "join_call"
+            and isinstance(result, dict)
+            and result.get("result") not in ("JOINED_VOICE_CHAT", "ALREADY_JOINED")
+        ):
+            self._unpin(chat_id)
+        return result
+
+    async def _call_batch(
+        self,
+        payload: dict,
+        timeout: Optional[float],
+    ) -> Any:
+        # Every core gets one batch with the requests of its chats,
+        # the results are put back in the order they were given
+        requests = payload.get("requests", [])
+        indexes: Dict[int, List[int]] = {}
+        for i, request in enumerate(requests):
+            index = self._route(request.get("action"), request.get("chat_id"))
+            indexes.setdefault(index, []).append(i)
+        replies = await asyncio.gather(
+            *(
+                self._bindings[index].call(
+                    "batch",
+                    {
+                        "requests": [requests[i] for i in positions],
+                    },
+                    timeout,
+                )
+                for index, positions in indexes.items()
+            ),
+            return_exceptions=True,
+        )
+        # Chats of a core that failed get the exception of that core,
+        # unless no core answered at all
+        if replies and all(isinstance(reply, Exception) for reply in replies):
+            raise replies[0]
+        results: List[Any] = [None] * len(requests)
+        for positions, reply in zip(indexes.values(), replies):
+            if isinstance(reply, Exception):
+                for i in positions:
+                    results[i] = reply
+                continue
+            if not isinstance(reply, dict):
+                continue
+            for i, result in zip(positions, reply.get("results", [])):
+                results[i] = result
+        return {
+            "results": results,
+        }
+
+    async def send(self, json_data: dict):
+        chat_id = json_data.get("chat_id")
+        if chat_id is None:
+            await asyncio.gather(
+                *(binding.send(json_data) for binding in self._bindings),
+            )
+            return
+        action = json_data.get("action")
+        binding = self._bindings[self._route(action, chat_id)]
+        if action == "leave_call":
+            self._unpin(chat_id)
+        await binding.send(json_data)
+
+    async def stop(self):
+        self._connected.clear()
+        await asyncio.gather(
+            *(binding.stop() for binding in self._bindings),
+        )
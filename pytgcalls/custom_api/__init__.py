@@ -1,3 +1,6 @@
+from ..sync import wrap
 from .custom_api import CustomApi
 
+wrap(CustomApi)
+
 __all__ = ("CustomApi",)
@@ -1,4 +1,10 @@
+import asyncio
+import json
 import os
+import shutil
+import subprocess
+from asyncio import Future
+from typing import Dict, Optional
 
 from .exceptions import (
     NodeJSNotInstalled,
@@ -22,15 +28,93 @@ class Environment:
         self._REQUIRED_TELETHON_VERSION = min_telethon_version
         self._client_name = client_name
 
-    def check_environment(self):
-        def get_version(package_check):
-            result_cmd = os.popen(f"{package_check} -v").read()
-            result_cmd = result_cmd.replace("v", "")
-            if len(result_cmd) == 0:
-                return None
-            return result_cmd
+    # NodeJS versions by binary path and mtime, shared by every
+    # client of the process and kept on disk across restarts
+    _CACHE_FILE = os.path.join(
+        os.environ.get(
+            "XDG_CACHE_HOME",
+            os.path.join(os.path.expanduser("~"), ".cache"),
+        ),
+        "pytgcalls",
+        "environment.json",
+    )
+    _node_versions: Dict[str, Optional[str]] = {}
+    _node_probes: Dict[str, Future] = {}
 
-        node_result = get_version("node")
+    @classmethod
+    async def _node_version(cls) -> Optional[str]:
+        node_path = shutil.which("node")
+        if node_path is None:
+            return None
+        try:
+            key = f"{node_path}:{os.stat(node_path).st_mtime_ns}"
+        except OSError:
+            return None
+        if key in cls._node_versions:
+            return cls._node_versions[key]
+        disk_cache = cls._read_cache()
+        if key in disk_cache:
+            cls._node_versions[key] = disk_cache[key]
+            return disk_cache[key]
+        # Clients starting together wait for the same probe
+        loop = asyncio.get_running_loop()
+        probe = cls._node_probes.get(key)
+        if probe is None or probe.get_loop() is not loop:
+            probe = cls._node_probes[key] = asyncio.ensure_future(
+                cls._probe_node(node_path),
+            )
+        try:
+            version = await asyncio.shield(probe)
+        finally:
+            if probe.done() and cls._node_probes.get(key) is probe:
+                del cls._node_probes[key]
+        cls._node_versions[key] = version
+        if version is not None:
+            disk_cache[key] = version
+            cls._write_cache(disk_cache)
+        return version
+
+    @staticmethod
+    async def _probe_node(node_path: str) -> Optional[str]:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                node_path,
+                "-v",
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        stdout, _ = await process.communicate()
+        result_cmd = stdout.decode().strip().replace("v", "")
+        if len(result_cmd) == 0:
+            return None
+        return result_cmd
+
+    @classmethod
+    def _read_cache(cls) -> Dict[str, str]:
+        try:
+            with open(cls._CACHE_FILE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    @classmethod
+    def _write_cache(cls, cache: Dict[str, str]):
+        # Written aside and renamed, concurrent processes never
+        # read a partial file
+        tmp_file = f"{cls._CACHE_FILE}.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(cls._CACHE_FILE), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, cls._CACHE_FILE)
+        except OSError:
+            pass
+
+    async def check_environment(self):
+        node_result = await self._node_version()
         if node_result is None:
             raise NodeJSNotInstalled(
                 self._REQUIRED_NODEJS_VERSION,
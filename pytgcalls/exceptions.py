@@ -278,3 +278,59 @@ class UnMuteNeeded(Exception):
         super().__init__(
             "Needed to unmute the userbot",
         )
+
+
+class InvalidTransport(Exception):
+    """The binding transport isn't supported, raised by
+    :meth:`~pytgcalls.PyTgCalls`
+    """
+
+    def __init__(self, transport: str):
+        super().__init__(
+            f"Transport {transport!r} isn't supported on this platform",
+        )
+
+
+class InvalidOverflowPolicy(Exception):
+    """The overflow policy of the handlers queue doesn't exist,
+    raised by :meth:`~pytgcalls.PyTgCalls`
+    """
+
+    def __init__(self, policy: str):
+        super().__init__(
+            f"Overflow policy {policy!r} doesn't exist",
+        )
+
+
+class NodeJSTimeout(Exception):
+    """The NodeJS core didn't answer in time, raised by
+    the methods waiting for an answer of the NodeJS core
+    """
+
+    def __init__(self, action: str):
+        super().__init__(
+            f"NodeJS core didn't answer to {action} in time",
+        )
+
+
+class NodeJSNoReply(Exception):
+    """The NodeJS core handled a request of a batch without
+    answering it, raised by the bulk methods like
+    :meth:`~pytgcalls.PyTgCalls.pause_streams`
+    """
+
+    def __init__(self, action: str):
+        super().__init__(
+            f"NodeJS core handled {action} without answering",
+        )
+
+
+class NodeJSRequestError(Exception):
+    """The NodeJS core failed to handle a request, raised by
+    the methods waiting for an answer of the NodeJS core
+    """
+
+    def __init__(self, action: str, error: str):
+        super().__init__(
+            f"NodeJS core failed to handle {action}: {error}",
+        )
@@ -3,6 +3,7 @@ import json
 from json import JSONDecodeError
 from typing import Dict, List, Optional, Tuple, Union
 
+from .batch_cache import cached, headers_key
 from .exceptions import (
     FFmpegNotInstalled,
     InvalidVideoProportion,
@@ -30,6 +31,34 @@ class FFprobe:
         needed_image: bool = False,
         headers: Optional[Dict[str, str]] = None,
         timeout: int = 10,
+    ) -> Union[Tuple[int, int, bool], bool, None]:
+        return await cached(
+            (
+                "ffprobe",
+                path,
+                needed_audio,
+                needed_video,
+                needed_image,
+                headers_key(headers),
+            ),
+            lambda: FFprobe._check_file(
+                path,
+                needed_audio,
+                needed_video,
+                needed_image,
+                headers,
+                timeout,
+            ),
+        )
+
+    @staticmethod
+    async def _check_file(
+        path: str,
+        needed_audio: bool,
+        needed_video: bool,
+        needed_image: bool,
+        headers: Optional[Dict[str, str]],
+        timeout: int,
     ) -> Union[Tuple[int, int, bool], bool, None]:
         ffmpeg_params: List[str] = []
         have_header = False
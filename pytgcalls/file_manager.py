@@ -4,8 +4,7 @@ import os
 from stat import S_ISFIFO
 from typing import Dict, Optional
 
-from aiohttp import ClientConnectorError, ClientResponse, ClientSession
-
+from .batch_cache import cached, headers_key
 from .types.input_stream.video_tools import check_support
 
 py_logger = logging.getLogger("pytgcalls")
@@ -16,11 +15,24 @@ class FileManager:
     async def check_file_exist(
         path: str,
         headers: Optional[Dict[str, str]] = None,
+    ):
+        await cached(
+            ("file_exist", path, headers_key(headers)),
+            lambda: FileManager._check_file_exist(path, headers),
+        )
+
+    @staticmethod
+    async def _check_file_exist(
+        path: str,
+        headers: Optional[Dict[str, str]],
     ):
         if check_support(path):
+            # aiohttp is slow to import, only remote files need it
+            from aiohttp import ClientConnectorError, ClientSession
+
             session = ClientSession()
             try:
-                response: ClientResponse = await session.get(
+                response = await session.get(
                     path,
                     timeout=5,
                     headers=headers,
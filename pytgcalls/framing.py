@@ -0,0 +1,47 @@
+from struct import Struct
+from typing import List
+
+# Every message exchanged with the NodeJS core is prefixed by
+# its payload length as an unsigned 32 bit big endian integer
+HEADER = Struct(">I")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+class FrameDecoder:
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        buffer = self._buffer
+        if buffer:
+            buffer += data
+            source = buffer
+        else:
+            # Nothing left over from the previous chunk, frames are
+            # sliced straight out of the chunk without buffering it
+            source = data
+        frames: List[bytes] = []
+        offset = 0
+        available = len(source)
+        with memoryview(source) as view:
+            while available - offset >= HEADER.size:
+                (size,) = HEADER.unpack_from(view, offset)
+                if size > MAX_FRAME_SIZE:
+                    raise ValueError(
+                        f"Frame of {size} bytes exceeds the maximum frame size",
+                    )
+                end = offset + HEADER.size + size
+                if end > available:
+                    break
+                frames.append(bytes(view[offset + HEADER.size : end]))
+                offset = end
+        if source is buffer:
+            if offset:
+                del buffer[:offset]
+        elif offset < available:
+            buffer += data[offset:]
+        return frames
+
+
+def encode_frame(payload: bytes) -> bytes:
+    return HEADER.pack(len(payload)) + payload
@@ -1,3 +1,7 @@
+from .event_dispatcher import EventDispatcher
 from .handlers_holder import HandlersHolder
 
-__all__ = ("HandlersHolder",)
+__all__ = (
+    "EventDispatcher",
+    "HandlersHolder",
+)
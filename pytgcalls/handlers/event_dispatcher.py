@@ -0,0 +1,184 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from ..exceptions import InvalidOverflowPolicy
+
+py_logger = logging.getLogger("pytgcalls")
+
+_Job = Tuple[List[Callable], tuple, dict]
+
+
+class EventDispatcher:
+    """Runs the handlers on a fixed number of workers
+
+    Events of the same chat are handled one at a time in the
+    order they were propagated, events of different chats run
+    concurrently. The handlers of an event run one after the
+    other too, so a handler that awaits something long delays
+    the next handlers and events of its chat, it can start a task
+    of its own to keep them running. Once ``max_queue`` events
+    are waiting, the overflow policy decides what happens to the
+    next one:
+
+    - ``drop_oldest`` drops the oldest event waiting for the same
+      chat, or the new one if that chat has none waiting
+    - ``drop_new`` drops the new event
+    - ``wait`` makes the caller wait until there is room. Events
+      coming from a request of the NodeJS core have to be sent
+      with :meth:`submit_later`, the core waits for the answer of
+      the request and the handlers waiting for it would never
+      make room
+
+    The workers are started by the first event and stopped by
+    :meth:`stop`, the next event starts them again
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEW = "drop_new"
+    WAIT = "wait"
+
+    def __init__(
+        self,
+        workers: int = 32,
+        max_queue: int = 10000,
+        overflow: str = DROP_OLDEST,
+    ):
+        if overflow not in (self.DROP_OLDEST, self.DROP_NEW, self.WAIT):
+            raise InvalidOverflowPolicy(overflow)
+        self._workers = max(workers, 1)
+        self._max_queue = max(max_queue, 1)
+        self._overflow = overflow
+        # Chats with events waiting or running, a chat is in the
+        # ready queue only while none of its events is running
+        self._pending: Dict[Hashable, Deque[_Job]] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._not_full: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queued = 0
+        self.running = 0
+        self.dropped = 0
+        self.handled = 0
+
+    def _start(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        for task in self._tasks:
+            task.cancel()
+        self._loop = loop
+        self._pending.clear()
+        self.queued = 0
+        self.running = 0
+        self._ready = asyncio.Queue()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._tasks = [
+            asyncio.ensure_future(self._worker(self._ready))
+            for _ in range(self._workers)
+        ]
+
+    async def stop(self):
+        """Cancel the workers and drop the events still waiting"""
+        tasks = self._tasks
+        current = asyncio.current_task()
+        self._tasks = []
+        self._loop = None
+        self._ready = None
+        self._pending.clear()
+        self.queued = 0
+        # A worker stopping the dispatcher from a handler ends
+        # once the handler returns
+        tasks = [task for task in tasks if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._not_full is not None:
+            self._not_full.set()
+
+    async def submit(
+        self,
+        key: Optional[Hashable],
+        handlers: List[Callable],
+        args: tuple,
+        kwargs: dict,
+    ):
+        self._start()
+        if key is None:
+            # Events of no chat don't need to wait for each other
+            key = object()
+        while self.queued >= self._max_queue:
+            if self._overflow == self.WAIT:
+                self._not_full.clear()
+                await self._not_full.wait()
+                self._start()
+                continue
+            jobs = self._pending.get(key)
+            if self._overflow == self.DROP_OLDEST and jobs:
+                jobs.popleft()
+                self.queued -= 1
+                self.dropped += 1
+                break
+            self.dropped += 1
+            return
+        jobs = self._pending.get(key)
+        if jobs is None:
+            self._pending[key] = deque([(handlers, args, kwargs)])
+            self._ready.put_nowait(key)
+        else:
+            jobs.append((handlers, args, kwargs))
+        self.queued += 1
+
+    def submit_later(
+        self,
+        key: Optional[Hashable],
+        handlers: List[Callable],
+        args: tuple,
+        kwargs: dict,
+    ):
+        """Like :meth:`submit`, without waiting for room in the
+        queue with the ``wait`` policy"""
+        task = asyncio.ensure_future(self.submit(key, handlers, args, kwargs))
+        task.add_done_callback(self._log_error)
+
+    @staticmethod
+    def _log_error(task: asyncio.Future):
+        if not task.cancelled() and task.exception() is not None:
+            py_logger.error(
+                "Error while dispatching an event: %s",
+                task.exception(),
+            )
+
+    async def _worker(self, ready: asyncio.Queue):
+        while ready is self._ready:
+            key = await ready.get()
+            jobs = self._pending.get(key)
+            if not jobs:
+                self._pending.pop(key, None)
+                continue
+            handlers, args, kwargs = jobs.popleft()
+            self.queued -= 1
+            self._not_full.set()
+            self.running += 1
+            try:
+                for handler in handlers:
+                    try:
+                        await handler(*args, **kwargs)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        py_logger.exception(
+                            "Unhandled error in handler %s",
+                            getattr(handler, "__name__", handler),
+                        )
+            finally:
+                self.running -= 1
+                self.handled += 1
+            if ready is not self._ready:
+                break
+            if jobs:
+                ready.put_nowait(key)
+            else:
+                del self._pending[key]
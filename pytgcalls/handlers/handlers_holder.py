@@ -1,18 +1,125 @@
-import asyncio
-from typing import Callable, Dict, List
+import heapq
+import logging
+from itertools import count
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .event_dispatcher import EventDispatcher
+
+py_logger = logging.getLogger("pytgcalls")
+
+
+class _Handler:
+    __slots__ = ("func", "updates", "predicate", "order")
+
+    def __init__(
+        self,
+        func: Callable,
+        updates: Optional[Tuple[Type, ...]],
+        predicate: Optional[Callable[..., bool]],
+        order: int,
+    ):
+        self.func = func
+        self.updates = updates
+        self.predicate = predicate
+        self.order = order
+
+    def __lt__(self, other: "_Handler") -> bool:
+        return self.order < other.order
+
+    def matches(self, args: tuple) -> bool:
+        update = args[1] if len(args) > 1 else None
+        if self.updates is not None and not isinstance(update, self.updates):
+            return False
+        if self.predicate is None:
+            return True
+        try:
+            return bool(self.predicate(*args))
+        except Exception:
+            py_logger.exception(
+                "Unhandled error in the filter of %s",
+                getattr(self.func, "__name__", self.func),
+            )
+            return False
 
 
 class HandlersHolder:
-    def __init__(self):
-        self._on_event_update: Dict[str, List[Callable]] = {
-            "RAW_UPDATE_HANDLER": [],
-            "STREAM_END_HANDLER": [],
-            "INVITE_HANDLER": [],
-            "KICK_HANDLER": [],
-            "CLOSED_HANDLER": [],
-            "LEFT_HANDLER": [],
-            "PARTICIPANTS_LIST": [],
+    def __init__(
+        self,
+        workers: int = 32,
+        max_queue: int = 10000,
+        overflow: str = EventDispatcher.DROP_OLDEST,
+    ):
+        events = (
+            "RAW_UPDATE_HANDLER",
+            "STREAM_END_HANDLER",
+            "INVITE_HANDLER",
+            "KICK_HANDLER",
+            "CLOSED_HANDLER",
+            "LEFT_HANDLER",
+            "PARTICIPANTS_LIST",
+            "CORE_RECOVERED_HANDLER",
+        )
+        # Handlers with a chats filter are indexed by chat, the
+        # other ones get every event
+        self._on_event_update: Dict[str, List[_Handler]] = {
+            event: [] for event in events
+        }
+        self._on_chat_update: Dict[str, Dict[int, List[_Handler]]] = {
+            event: {} for event in events
         }
+        self._order = count()
+        self.dispatcher = EventDispatcher(
+            workers,
+            max_queue,
+            overflow,
+        )
+
+    @staticmethod
+    def _event_key(args: tuple) -> Optional[Hashable]:
+        # Handlers get the client first, then the chat id or an
+        # update of the chat
+        if len(args) < 2:
+            return None
+        update = args[1]
+        if isinstance(update, int):
+            return update
+        return getattr(update, "chat_id", None)
+
+    def _handlers(
+        self,
+        event_name: str,
+        key: Optional[Hashable],
+    ) -> Iterable[_Handler]:
+        handlers = self._on_event_update[event_name]
+        chat_handlers = self._on_chat_update[event_name].get(key)
+        if not chat_handlers:
+            return handlers
+        # Handlers run in the order they were added
+        return heapq.merge(handlers, chat_handlers)
+
+    def _matching(
+        self,
+        event_name: str,
+        args: tuple,
+    ) -> Tuple[Optional[Hashable], List[Callable]]:
+        key = self._event_key(args)
+        handlers = [
+            handler.func
+            for handler in self._handlers(event_name, key)
+            if handler.matches(args)
+        ]
+        return key, handlers
 
     async def propagate(
         self,
@@ -20,12 +127,61 @@ class HandlersHolder:
         *args,
         **kwargs,
     ):
-        for event in self._on_event_update[event_name]:
-            asyncio.ensure_future(event(*args, **kwargs))
+        key, handlers = self._matching(event_name, args)
+        if not handlers:
+            return
+        await self.dispatcher.submit(
+            key,
+            handlers,
+            args,
+            kwargs,
+        )
+
+    def propagate_later(
+        self,
+        event_name: str,
+        *args,
+        **kwargs,
+    ):
+        # Used while the NodeJS core waits for an answer, it must
+        # not wait for room in the queue of the dispatcher
+        key, handlers = self._matching(event_name, args)
+        if not handlers:
+            return
+        self.dispatcher.submit_later(
+            key,
+            handlers,
+            args,
+            kwargs,
+        )
+
+    async def stop(self):
+        await self.dispatcher.stop()
 
     def add_handler(
         self,
         event_name: str,
         func: Callable,
+        chats: Optional[Union[int, Iterable[int]]] = None,
+        updates: Optional[Union[Type, Tuple[Type, ...]]] = None,
+        predicate: Optional[Callable[..., bool]] = None,
     ):
-        self._on_event_update[event_name].append(func)
+        if updates is not None and not isinstance(updates, tuple):
+            updates = (updates,)
+        handler = _Handler(
+            func,
+            updates,
+            predicate,
+            next(self._order),
+        )
+        if chats is None:
+            self._on_event_update[event_name].append(handler)
+            return
+        chat_ids: FrozenSet[int] = frozenset(
+            (chats,) if isinstance(chats, int) else chats,
+        )
+        for chat_id in chat_ids:
+            self._on_chat_update[event_name].setdefault(
+                chat_id,
+                [],
+            ).append(handler)
@@ -1,9 +1,25 @@
+from typing import TYPE_CHECKING
+
 from .device_info import DeviceInfo
-from .media_devices import MediaDevices
 from .screen_info import ScreenInfo
 
+if TYPE_CHECKING:
+    from .media_devices import MediaDevices
+
 __all__ = (
     "DeviceInfo",
     "MediaDevices",
     "ScreenInfo",
 )
+
+
+def __getattr__(name: str):
+    # MediaDevices pulls in screeninfo, it is only loaded when used
+    if name == "MediaDevices":
+        from ..sync import wrap
+        from .media_devices import MediaDevices
+
+        wrap(MediaDevices)
+        globals()[name] = MediaDevices
+        return MediaDevices
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
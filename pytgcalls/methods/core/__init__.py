@@ -1,13 +1,21 @@
 from .binding_runner import BindingRunner
+from .bulk_request import BulkRequest
 from .join_voice_call import JoinVoiceCall
 from .leave_voice_call import LeaveVoiceCall
+from .recover_calls import RecoverCalls
 from .set_video_call_status import SetVideoCallStatus
+from .solve_request import SolveRequest
+from .update_call_status import UpdateCallStatus
 
 
 class Core(
     BindingRunner,
+    BulkRequest,
     JoinVoiceCall,
     LeaveVoiceCall,
+    RecoverCalls,
     SetVideoCallStatus,
+    SolveRequest,
+    UpdateCallStatus,
 ):
     pass
@@ -1,11 +1,13 @@
 import asyncio
+from asyncio import Future
+from typing import List, Optional, Union
 
 from ...pytgcalls_session import PyTgCallsSession
 from ...scaffold import Scaffold
 
 
 class BindingRunner(Scaffold):
-    async def _start_binding(self):
+    async def _start_binding(self, user_id: Union[int, Future]):
         @self._binding.on_update()
         async def update_handler(data: dict):
             if "action" in data:
@@ -21,6 +23,15 @@ class BindingRunner(Scaffold):
                     return await self._set_video_call_status(data)
                 elif data["action"] == "update_request":
                     return await self._raw_update_handler(data)
+                elif data["action"] == "media_worker_restarted":
+                    # Joining again goes through the core, that is
+                    # waiting for this answer
+                    asyncio.ensure_future(
+                        self._recover_calls(data["chat_ids"]),
+                    )
+                    return {
+                        "result": "OK",
+                    }
             return {
                 "result": "INVALID_REQUEST",
             }
@@ -32,13 +43,21 @@ class BindingRunner(Scaffold):
             except Exception as e:
                 print(e)
 
+        @self._binding.on_progress()
+        def progress(entries: list):
+            self._call_holder.set_progress(entries)
+
+        @self._binding.on_restart()
+        async def restart(chat_ids: Optional[List[int]] = None):
+            await self._recover_calls(chat_ids)
+
         await PyTgCallsSession().start()
         loop = asyncio.get_event_loop()
         started_core = loop.create_future()
         self._async_core = asyncio.ensure_future(
             self._binding.connect(
                 started_core,
-                self._my_id,
+                user_id,
             ),
         )
         try:
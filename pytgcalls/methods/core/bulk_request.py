@@ -0,0 +1,62 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional, Union
+
+from ...batch_cache import batch_cache
+from ...exceptions import NodeJSNotRunning, NoMtProtoClientSet, NotInGroupCallError
+from ...scaffold import Scaffold
+from ...types import NotInGroupCall, StreamDeleted
+
+
+class BulkRequest(Scaffold):
+    async def _solve_bulk_request(
+        self,
+        action: str,
+        chats: Dict[Union[int, str], Any],
+        build_request: Optional[Callable] = None,
+    ) -> Dict[Union[int, str], Optional[Exception]]:
+        if self._app is None:
+            raise NoMtProtoClientSet()
+        if self._wait_until_run is None:
+            raise NodeJSNotRunning()
+        results: Dict[Union[int, str], Optional[Exception]] = {}
+
+        async def resolve(chat: Union[int, str]) -> int:
+            try:
+                return int(chat)
+            except ValueError:
+                return await self._app.resolve_chat_id(chat)
+
+        async def prepare(chat: Union[int, str], value: Any) -> dict:
+            chat_id = await resolve(chat)
+            if build_request is None:
+                return {
+                    "chat_id": chat_id,
+                }
+            return await build_request(chat_id, value)
+
+        with batch_cache():
+            requests = await asyncio.gather(
+                *(prepare(chat, value) for chat, value in chats.items()),
+                return_exceptions=True,
+            )
+        ready = []
+        for chat, request in zip(chats, requests):
+            if isinstance(request, Exception):
+                results[chat] = request
+            else:
+                ready.append((chat, request))
+        if ready:
+            solved = await self._solve_requests(
+                action,
+                [request for _, request in ready],
+            )
+            for (chat, _), result in zip(ready, solved):
+                if isinstance(result, Exception):
+                    results[chat] = result
+                elif isinstance(result, NotInGroupCall):
+                    results[chat] = NotInGroupCallError()
+                elif isinstance(result, StreamDeleted):
+                    results[chat] = FileNotFoundError()
+                else:
+                    results[chat] = None
+        return {chat: results[chat] for chat in chats}
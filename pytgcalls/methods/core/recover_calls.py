@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import os
+from time import monotonic
+from typing import List, Optional
+
+from ...scaffold import Scaffold
+from ...types import CoreRecovered
+from ...types.call_holder import CallHolder
+from ...types.groups import JoinedVoiceChat
+
+py_logger = logging.getLogger("pytgcalls")
+
+
+def _seek_parameters(parameters: str, seconds: float) -> str:
+    # Split like the core does: without markers the parameters are
+    # used by both the audio and the video input, with a marker a
+    # section left out is empty. Both sections are written back with
+    # the seek in front, so it goes before -i whatever was given
+    seek = f"-ss:_cmd_:{seconds:.3f}"
+    has_audio = "--audio" in parameters
+    has_video = "--video" in parameters
+    if not has_audio and not has_video:
+        audio = video = parameters
+    else:
+        audio = ""
+        video = ""
+        if has_audio:
+            audio = parameters.split("--audio")[1].split("--video")[0]
+        if has_video:
+            video = parameters.split("--video")[1].split("--audio")[0]
+    return ":_cmd_:".join(
+        (
+            "--audio",
+            seek,
+            audio,
+            "--video",
+            seek,
+            video,
+        ),
+    )
+
+
+def _is_seekable(path: str) -> bool:
+    # Only local files can be resumed from the played time, live
+    # sources like URLs, radios, devices and pipes restart as they are
+    if not path.startswith("fifo://") or path.startswith("fifo://image:"):
+        return False
+    source = path[len("fifo://") :]
+    if "://" in source:
+        return False
+    return os.path.isfile(source)
+
+
+def _seek_request(request: dict, seconds: float) -> dict:
+    request = dict(request)
+    if seconds <= 0:
+        return request
+    for key in ("stream_audio", "stream_video"):
+        stream = request.get(key)
+        if stream is not None and _is_seekable(stream["path"]):
+            request[key] = {
+                **stream,
+                "ffmpeg_parameters": _seek_parameters(
+                    stream["ffmpeg_parameters"],
+                    seconds,
+                ),
+            }
+    return request
+
+
+class RecoverCalls(Scaffold):
+    async def _recover_calls(
+        self,
+        chat_ids: Optional[List[int]] = None,
+    ):
+        start_time = monotonic()
+        if chat_ids is None:
+            chat_ids = self._call_holder.streams
+        recovered: List[int] = []
+        failed: List[int] = []
+
+        async def recover(chat_id: int):
+            request = self._call_holder.get_stream(chat_id)
+            status = self._call_holder.get_status(chat_id)
+            if request is None:
+                return
+            if status == CallHolder.IDLE:
+                self._call_holder.remove_call(chat_id)
+                return
+            played_time = self._call_holder.played_time(chat_id)
+            seek_request = _seek_request(request, played_time)
+            try:
+                result = await self._solve_request(
+                    "join_call",
+                    seek_request,
+                )
+                if not isinstance(result, JoinedVoiceChat):
+                    raise Exception(result)
+                self._call_holder.set_stream(
+                    chat_id,
+                    request,
+                    played_time,
+                    played_time if seek_request != request else 0,
+                )
+                if status == CallHolder.PAUSED:
+                    await self._solve_request(
+                        "pause",
+                        {
+                            "chat_id": chat_id,
+                        },
+                    )
+                recovered.append(chat_id)
+            except Exception as e:
+                py_logger.warning(f"Unable to recover the call of {chat_id}: {e}")
+                self._call_holder.remove_call(chat_id)
+                failed.append(chat_id)
+
+        await asyncio.gather(*(recover(chat_id) for chat_id in chat_ids))
+        self._on_event_update.propagate_later(
+            "CORE_RECOVERED_HANDLER",
+            self,
+            CoreRecovered(
+                self._binding.restarts,
+                recovered,
+                failed,
+                monotonic() - start_time,
+            ),
+        )
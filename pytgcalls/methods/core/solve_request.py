@@ -0,0 +1,83 @@
+from typing import List, Union
+
+from ...exceptions import NodeJSNoReply, NodeJSRequestError
+from ...scaffold import Scaffold
+from ...types.groups import JoinedVoiceChat
+from ...types.object import Object
+from ...types.stream import ChangedStream
+
+
+class SolveRequest(Scaffold):
+    async def _solve_request(
+        self,
+        action: str,
+        payload: dict,
+    ):
+        if not self._wait_until_run.done():
+            await self._wait_until_run
+        result = await self._binding.call(
+            action,
+            payload,
+        )
+        obj = self._solved_request(action, payload, result)
+        if isinstance(obj, NodeJSRequestError):
+            raise obj
+        return obj
+
+    async def _solve_requests(
+        self,
+        action: str,
+        payloads: List[dict],
+    ) -> List[Union[object, Exception]]:
+        if not self._wait_until_run.done():
+            await self._wait_until_run
+        # All the requests leave with a single batch, that the core
+        # runs concurrently and answers once every chat is done
+        result = await self._binding.call(
+            "batch",
+            {
+                "requests": [
+                    {
+                        **payload,
+                        "action": action,
+                    }
+                    for payload in payloads
+                ],
+            },
+        )
+        # A core of the pool that failed leaves its exception, a
+        # request the core didn't answer is left empty
+        return [
+            result
+            if isinstance(result, Exception)
+            else NodeJSNoReply(action)
+            if result is None
+            else self._solved_request(action, payload, result)
+            for payload, result in zip(payloads, result["results"])
+        ]
+
+    def _solved_request(
+        self,
+        action: str,
+        payload: dict,
+        result: dict,
+    ):
+        if result["result"] == "REQUEST_ERROR":
+            return NodeJSRequestError(action, result.get("error"))
+        obj = Object.from_dict(result)
+        # Keep the last stream descriptor of every call, so it can
+        # be joined again if the NodeJS core has to be restarted
+        if isinstance(obj, JoinedVoiceChat):
+            self._call_holder.set_stream(obj.chat_id, payload)
+        elif isinstance(obj, ChangedStream):
+            request = {
+                key: value
+                for key, value in (
+                    self._call_holder.get_stream(obj.chat_id) or {}
+                ).items()
+                if key not in ("stream_audio", "stream_video")
+            }
+            request.update(payload)
+            self._call_holder.set_stream(obj.chat_id, request)
+        self._update_call_status(obj)
+        return obj
@@ -0,0 +1,44 @@
+import asyncio
+
+from ...scaffold import Scaffold
+from ...types.call_holder import CallHolder
+from ...types.groups import JoinedVoiceChat, LeftVoiceChat
+from ...types.stream import ChangedStream, PausedStream, ResumedStream, StreamDeleted
+
+
+class UpdateCallStatus(Scaffold):
+    def _update_call_status(
+        self,
+        obj,
+    ):
+        if isinstance(obj, PausedStream):
+            self._call_holder.set_status(
+                obj.chat_id,
+                CallHolder.PAUSED,
+            )
+        elif (
+            isinstance(obj, ResumedStream)
+            or isinstance(obj, ChangedStream)
+            or isinstance(obj, JoinedVoiceChat)
+        ):
+            self._call_holder.set_status(
+                obj.chat_id,
+                CallHolder.PLAYING,
+            )
+        elif isinstance(obj, LeftVoiceChat):
+            self._call_holder.remove_call(
+                obj.chat_id,
+            )
+        elif isinstance(obj, StreamDeleted):
+            self._call_holder.remove_call(
+                obj.chat_id,
+            )
+            asyncio.ensure_future(
+                self._binding.send(
+                    {
+                        "action": "leave_call",
+                        "chat_id": obj.chat_id,
+                        "type": "file_deleted",
+                    }
+                ),
+            )
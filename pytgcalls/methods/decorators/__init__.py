@@ -1,4 +1,5 @@
 from .on_closed_voice_chat import OnClosedVoiceChat
+from .on_core_recovered import OnCoreRecovered
 from .on_group_call_invite import OnGroupCallInvite
 from .on_kicked import OnKicked
 from .on_left import OnLeft
@@ -9,6 +10,7 @@ from .on_stream_end import OnStreamEnd
 
 class Decorators(
     OnClosedVoiceChat,
+    OnCoreRecovered,
     OnGroupCallInvite,
     OnKicked,
     OnLeft,
@@ -1,15 +1,28 @@
-from typing import Callable
+from typing import Callable, Iterable, Optional, Union
 
 from ...scaffold import Scaffold
 
 
 class OnClosedVoiceChat(Scaffold):
-    def on_closed_voice_chat(self) -> Callable:
+    def on_closed_voice_chat(
+        self,
+        chats: Optional[Union[int, Iterable[int]]] = None,
+        predicate: Optional[Callable[..., bool]] = None,
+    ) -> Callable:
         """Decorator for handling closed voice chat event.
 
         When a video chat closes, this decorator will
         be raised
 
+        Parameters:
+            chats (``int`` | ``Iterable[int]``, **optional**):
+                Unique identifiers of the chats whose updates
+                are handled, by default all of them
+
+            predicate (``Callable``, **optional**):
+                Called with the client and the update, the
+                handler runs only if it returns ``True``
+
         Example:
             .. code-block:: python
                 :emphasize-lines: 4-5
@@ -31,6 +44,8 @@ class OnClosedVoiceChat(Scaffold):
                 self._on_event_update.add_handler(
                     method,
                     func,
+                    chats=chats,
+                    predicate=predicate,
                 )
             return func
 
@@ -0,0 +1,49 @@
+from typing import Callable, Optional
+
+from ...scaffold import Scaffold
+
+
+class OnCoreRecovered(Scaffold):
+    def on_core_recovered(
+        self,
+        predicate: Optional[Callable[..., bool]] = None,
+    ) -> Callable:
+        """Decorator for handling when the NodeJS
+        core has been restarted
+
+        When the NodeJS core crashes or stops answering,
+        it is restarted and every call is joined again,
+        then this decorator will be raised
+
+        Parameters:
+            predicate (``Callable``, **optional**):
+                Called with the client and the update, the
+                handler runs only if it returns ``True``
+
+        Example:
+            .. code-block:: python
+                :emphasize-lines: 4-5
+
+                ...
+                app = PyTgCalls(client)
+                ...
+                @app.on_core_recovered()
+                async def handler(client: PyTgCalls, update: CoreRecovered):
+                    print(update)
+                ...
+                app.run()
+
+        """
+
+        method = "CORE_RECOVERED_HANDLER"
+
+        def decorator(func: Callable) -> Callable:
+            if self is not None:
+                self._on_event_update.add_handler(
+                    method,
+                    func,
+                    predicate=predicate,
+                )
+            return func
+
+        return decorator
@@ -1,16 +1,24 @@
-from typing import Callable
+from typing import Callable, Optional
 
 from ...scaffold import Scaffold
 
 
 class OnGroupCallInvite(Scaffold):
-    def on_group_call_invite(self) -> Callable:
+    def on_group_call_invite(
+        self,
+        predicate: Optional[Callable[..., bool]] = None,
+    ) -> Callable:
         """Decorator for handling when invited
         from voice chat event.
 
         When your userbot will be invited on voice
         chat, this decorator will be raised
 
+        Parameters:
+            predicate (``Callable``, **optional**):
+                Called with the client and the update, the
+                handler runs only if it returns ``True``
+
         Example:
             .. code-block:: python
                 :emphasize-lines: 4-5
@@ -32,6 +40,7 @@ class OnGroupCallInvite(Scaffold):
                 self._on_event_update.add_handler(
                     method,
                     func,
+                    predicate=predicate,
                 )
             return func
 
@@ -1,10 +1,14 @@
-from typing import Callable
+from typing import Callable, Iterable, Optional, Union
 
 from ...scaffold import Scaffold
 
 
 class OnKicked(Scaffold):
-    def on_kicked(self) -> Callable:
+    def on_kicked(
+        self,
+        chats: Optional[Union[int, Iterable[int]]] = None,
+        predicate: Optional[Callable[..., bool]] = None,
+    ) -> Callable:
         """Decorator for handling when kicked
         from a group/channel
 
@@ -12,6 +16,15 @@ class OnKicked(Scaffold):
         a group/channel, this decorator will be
         raised
 
+        Parameters:
+            chats (``int`` | ``Iterable[int]``, **optional**):
+                Unique identifiers of the chats whose updates
+                are handled, by default all of them
+
+            predicate (``Callable``, **optional**):
+                Called with the client and the update, the
+                handler runs only if it returns ``True``
+
         Example:
             .. code-block:: python
                 :emphasize-lines: 4-5
@@ -34,6 +47,8 @@ class OnKicked(Scaffold):
                 self._on_event_update.add_handler(
                     method,
                     func,
+                    chats=chats,
+                    predicate=predicate,
                 )
             return func
 
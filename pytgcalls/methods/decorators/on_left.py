@@ -1,16 +1,29 @@
-from typing import Callable
+from typing import Callable, Iterable, Optional, Union
 
 from ...scaffold import Scaffold
 
 
 class OnLeft(Scaffold):
-    def on_left(self) -> Callable:
+    def on_left(
+        self,
+        chats: Optional[Union[int, Iterable[int]]] = None,
+        predicate: Optional[Callable[..., bool]] = None,
+    ) -> Callable:
         """Decorator for handling when the userbot
         left a group/channel
 
         When your userbot leave a group/channel,
         this decorator will be raised
 
+        Parameters:
+            chats (``int`` | ``Iterable[int]``, **optional**):
+                Unique identifiers of the chats whose updates
+                are handled, by default all of them
+
+            predicate (``Callable``, **optional**):
+                Called with the client and the update, the
+                handler runs only if it returns ``True``
+
         Example:
             .. code-block:: python
                 :emphasize-lines: 4-5
@@ -32,6 +45,8 @@ class OnLeft(Scaffold):
                 self._on_event_update.add_handler(
                     method,
                     func,
+                    chats=chats,
+                    predicate=predicate,
                 )
             return func
 
@@ -1,15 +1,35 @@
-from typing import Callable
+from typing import Callable, Iterable, Optional, Tuple, Type, Union
 
 from ...scaffold import Scaffold
 
 
 class OnParticipantsChange(Scaffold):
-    def on_participants_change(self) -> Callable:
+    def on_participants_change(
+        self,
+        chats: Optional[Union[int, Iterable[int]]] = None,
+        updates: Optional[Union[Type, Tuple[Type, ...]]] = None,
+        predicate: Optional[Callable[..., bool]] = None,
+    ) -> Callable:
         """Decorator for handling when the participant
         list of a group call is changed
 
         When the participant list changes, this decorator
-        will be raised
+        will be raised, with a
+        :obj:`~pytgcalls.types.ParticipantsBatch` when
+        ``participants_window`` is set
+
+        Parameters:
+            chats (``int`` | ``Iterable[int]``, **optional**):
+                Unique identifiers of the chats whose updates
+                are handled, by default all of them
+
+            updates (``type`` | ``Tuple[type]``, **optional**):
+                Classes of the updates handled, by default
+                all of them
+
+            predicate (``Callable``, **optional**):
+                Called with the client and the update, the
+                handler runs only if it returns ``True``
 
         Example:
             .. code-block:: python
@@ -33,6 +53,9 @@ class OnParticipantsChange(Scaffold):
                 self._on_event_update.add_handler(
                     method,
                     func,
+                    chats=chats,
+                    updates=updates,
+                    predicate=predicate,
                 )
             return func
 
@@ -1,16 +1,34 @@
-from typing import Callable
+from typing import Callable, Iterable, Optional, Tuple, Type, Union
 
 from ...scaffold import Scaffold
 
 
 class OnStreamEnd(Scaffold):
-    def on_stream_end(self) -> Callable:
+    def on_stream_end(
+        self,
+        chats: Optional[Union[int, Iterable[int]]] = None,
+        updates: Optional[Union[Type, Tuple[Type, ...]]] = None,
+        predicate: Optional[Callable[..., bool]] = None,
+    ) -> Callable:
         """Decorator for handling when a stream playing
         is ended
 
         When a streaming will end, this decorator will
         be raised
 
+        Parameters:
+            chats (``int`` | ``Iterable[int]``, **optional**):
+                Unique identifiers of the chats whose updates
+                are handled, by default all of them
+
+            updates (``type`` | ``Tuple[type]``, **optional**):
+                Classes of the updates handled, by default
+                all of them
+
+            predicate (``Callable``, **optional**):
+                Called with the client and the update, the
+                handler runs only if it returns ``True``
+
         Example:
             .. code-block:: python
                 :emphasize-lines: 4-5
@@ -33,6 +51,9 @@ class OnStreamEnd(Scaffold):
                 self._on_event_update.add_handler(
                     method,
                     func,
+                    chats=chats,
+                    updates=updates,
+                    predicate=predicate,
                 )
             return func
 
@@ -5,6 +5,7 @@ from .get_active_call import GetActiveCall
 from .get_call import GetCall
 from .get_participants import GetParticipants
 from .join_group_call import JoinGroupCall
+from .join_group_calls import JoinGroupCalls
 from .leave_group_call import LeaveGroupCall
 
 
@@ -16,6 +17,7 @@ class Groups(
     GetCall,
     GetParticipants,
     JoinGroupCall,
+    JoinGroupCalls,
     LeaveGroupCall,
 ):
     pass
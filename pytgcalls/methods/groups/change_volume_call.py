@@ -1,7 +1,6 @@
 from typing import Union
 
 from ...exceptions import NoActiveGroupCall, NodeJSNotRunning, NoMtProtoClientSet
-from ...mtproto import BridgedClient
 from ...scaffold import Scaffold
 
 
@@ -56,9 +55,7 @@ class ChangeVolumeCall(Scaffold):
                 try:
                     chat_id = int(chat_id)
                 except ValueError:
-                    chat_id = BridgedClient.chat_id(
-                        await self._app.resolve_peer(chat_id),
-                    )
+                    chat_id = await self._app.resolve_chat_id(chat_id)
                 if not self._wait_until_run.done():
                     await self._wait_until_run
                 chat_call = await self._app.get_full_chat(
@@ -1,6 +1,5 @@
 from typing import Union
 
-from ...mtproto import BridgedClient
 from ...scaffold import Scaffold
 
 
@@ -49,9 +48,7 @@ class GetActiveCall(Scaffold):
         try:
             chat_id = int(chat_id)
         except ValueError:
-            chat_id = BridgedClient.chat_id(
-                await self._app.resolve_peer(chat_id),
-            )
+            chat_id = await self._app.resolve_chat_id(chat_id)
         return self._call_holder.get_active_call(
             chat_id,
         )
@@ -1,6 +1,5 @@
 from typing import List, Optional, Union
 
-from ...mtproto import BridgedClient
 from ...scaffold import Scaffold
 from ...types.groups.group_call_participant import GroupCallParticipant
 
@@ -45,9 +44,7 @@ class GetParticipants(Scaffold):
         try:
             chat_id = int(chat_id)
         except ValueError:
-            chat_id = BridgedClient.chat_id(
-                await self._app.resolve_peer(chat_id),
-            )
+            chat_id = await self._app.resolve_chat_id(chat_id)
         self._call_holder.get_call(
             chat_id,
         )
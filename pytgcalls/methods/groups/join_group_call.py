@@ -1,6 +1,3 @@
-import asyncio
-import logging
-import shlex
 from typing import Union
 
 from ...exceptions import (
@@ -13,25 +10,10 @@ from ...exceptions import (
     TelegramServerError,
     UnMuteNeeded,
 )
-from ...file_manager import FileManager
-from ...mtproto import BridgedClient
 from ...scaffold import Scaffold
 from ...stream_type import StreamType
-from ...types import (
-    AlreadyJoined,
-    CaptureAudioDevice,
-    CaptureAVDesktop,
-    CaptureAVDeviceDesktop,
-    CaptureVideoDesktop,
-    ErrorDuringJoin,
-    MutedCall,
-    UpgradeNeeded,
-)
-from ...types.input_stream import AudioPiped, AudioVideoPiped, InputStream, VideoPiped
-from ...types.input_stream.audio_image_piped import AudioImagePiped
-from ...types.session import Session
-
-py_logger = logging.getLogger("pytgcalls")
+from ...types import AlreadyJoined, ErrorDuringJoin, MutedCall, UpgradeNeeded
+from ...types.input_stream import InputStream
 
 
 class JoinGroupCall(Scaffold):
@@ -133,119 +115,9 @@ class JoinGroupCall(Scaffold):
         try:
             chat_id = int(chat_id)
         except ValueError:
-            chat_id = BridgedClient.chat_id(
-                await self._app.resolve_peer(chat_id),
-            )
+            chat_id = await self._app.resolve_chat_id(chat_id)
         self._cache_user_peer.put(chat_id, join_as)
-        headers = None
-        if (
-            isinstance(
-                stream,
-                AudioImagePiped,
-            )
-            or isinstance(
-                stream,
-                AudioPiped,
-            )
-            or isinstance(
-                stream,
-                AudioVideoPiped,
-            )
-            or isinstance(
-                stream,
-                VideoPiped,
-            )
-        ):
-            headers = stream.raw_headers
-        if stream.stream_video is not None:
-            if not stream.stream_video.path.startswith("screen://"):
-                await FileManager.check_file_exist(
-                    stream.stream_video.path.replace(
-                        "fifo://",
-                        "",
-                    ).replace(
-                        "image:",
-                        "",
-                    ),
-                    headers,
-                )
-        if stream.stream_audio is not None:
-            if not stream.stream_audio.path.startswith("device://"):
-                await FileManager.check_file_exist(
-                    stream.stream_audio.path.replace(
-                        "fifo://",
-                        "",
-                    ).replace(
-                        "image:",
-                        "",
-                    ),
-                    headers,
-                )
-        audio_f_parameters = ""
-        video_f_parameters = ""
-        if (
-            isinstance(
-                stream,
-                AudioImagePiped,
-            )
-            or isinstance(
-                stream,
-                AudioPiped,
-            )
-            or isinstance(
-                stream,
-                AudioVideoPiped,
-            )
-            or isinstance(
-                stream,
-                VideoPiped,
-            )
-            or isinstance(
-                stream,
-                CaptureVideoDesktop,
-            )
-            or isinstance(
-                stream,
-                CaptureAudioDevice,
-            )
-        ):
-            await stream.check_pipe()
-            if stream.stream_audio:
-                if stream.stream_audio.header_enabled:
-                    audio_f_parameters = stream.headers
-            audio_f_parameters += ":_cmd_:".join(
-                shlex.split(stream.ffmpeg_parameters),
-            )
-            if stream.stream_video:
-                if stream.stream_video.header_enabled:
-                    video_f_parameters = stream.headers
-            video_f_parameters += ":_cmd_:".join(
-                shlex.split(stream.ffmpeg_parameters),
-            )
-        elif isinstance(
-            stream,
-            CaptureAVDeviceDesktop,
-        ):
-            audio_f_parameters += ":_cmd_:".join(
-                shlex.split(stream.audio_ffmpeg),
-            )
-            video_f_parameters += ":_cmd_:".join(
-                shlex.split(stream.video_ffmpeg),
-            )
-        elif isinstance(
-            stream,
-            CaptureAVDesktop,
-        ):
-            await stream.check_pipe()
-            if stream.stream_audio:
-                if stream.stream_audio.header_enabled:
-                    audio_f_parameters = stream.headers
-            audio_f_parameters += ":_cmd_:".join(
-                shlex.split(stream.audio_ffmpeg),
-            )
-            video_f_parameters += ":_cmd_:".join(
-                shlex.split(stream.video_ffmpeg),
-            )
+        plan = await self._stream_plans.compile(stream)
         if self._app is not None:
             if self._wait_until_run is not None:
                 if not self._wait_until_run.done():
@@ -253,47 +125,15 @@ class JoinGroupCall(Scaffold):
                 chat_call = await self._app.get_full_chat(
                     chat_id,
                 )
-                stream_audio = stream.stream_audio
-                stream_video = stream.stream_video
                 if chat_call is not None:
-                    solver_id = Session.generate_session_id(24)
-
-                    async def internal_sender():
-                        request = {
-                            "action": "join_call",
-                            "chat_id": chat_id,
-                            "invite_hash": invite_hash,
-                            "buffer_long": stream_type.stream_mode,
-                            "lip_sync": stream.lip_sync,
-                            "solver_id": solver_id,
-                        }
-                        if stream_audio is not None:
-                            request["stream_audio"] = {
-                                "path": stream_audio.path,
-                                "bitrate": stream_audio.parameters.bitrate,
-                                "ffmpeg_parameters": audio_f_parameters,
-                            }
-                        if stream_video is not None:
-                            video_parameters = stream_video.parameters
-                            if video_parameters.frame_rate % 5 != 0 and not isinstance(
-                                stream, AudioImagePiped
-                            ):
-                                py_logger.warning(
-                                    "For better experience the "
-                                    "video frame rate must be a multiple of 5",
-                                )
-                            request["stream_video"] = {
-                                "path": stream_video.path,
-                                "width": video_parameters.width,
-                                "height": video_parameters.height,
-                                "framerate": video_parameters.frame_rate,
-                                "ffmpeg_parameters": video_f_parameters,
-                            }
-                        await self._binding.send(request)
-
-                    asyncio.ensure_future(internal_sender())
-                    result = await self._wait_result.wait_future_update(
-                        solver_id,
+                    request = plan.request(
+                        chat_id,
+                        invite_hash=invite_hash,
+                        buffer_long=stream_type.stream_mode,
+                    )
+                    result = await self._solve_request(
+                        "join_call",
+                        request,
                     )
                     if isinstance(result, AlreadyJoined):
                         raise AlreadyJoinedError()
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from ...batch_cache import batch_cache
+from ...exceptions import NoMtProtoClientSet
+from ...scaffold import Scaffold
+from ...stream_type import StreamType
+from ...types.input_stream import InputStream
+
+
+class JoinGroupCalls(Scaffold):
+    async def join_group_calls(
+        self,
+        calls: Iterable[Tuple[Union[int, str], InputStream]],
+        concurrency: int = 10,
+        invite_hash: str = None,
+        join_as=None,
+        stream_type: StreamType = None,
+    ) -> Dict[Union[int, str], Optional[Exception]]:
+        """Join many group calls at once
+
+        This method joins every group call like
+        :meth:`~pytgcalls.PyTgCalls.join_group_call`, running
+        up to ``concurrency`` joins at the same time. Sources
+        shared by many chats are checked only once
+
+        Parameters:
+            calls (Iterable of (``int`` | ``str``, :obj:`~pytgcalls.types.InputStream()`)):
+                Pairs of chat and Input Stream descriptor to play
+                in it, like the items of a dictionary
+            concurrency (``int``, **optional**):
+                Max number of group calls joined at the same time
+            invite_hash (``str``, **optional**):
+                Unique identifier for the invite in a group call
+                in form of a t.me link
+            join_as (`InputPeer (P)`_ | `InputPeer (T)`_, **optional**):
+                InputPeer of join as channel or profile
+            stream_type (:obj:`~pytgcalls.StreamType`, **optional**)
+                The type of Stream
+
+        Raises:
+            NoMtProtoClientSet: In case you try
+                to call this method without any MtProto client
+
+        Returns:
+            ``Dict[int | str, Exception | None]`` - Error raised
+            joining each chat, or ``None`` if it has been joined
+
+        Example:
+            .. code-block:: python
+                :emphasize-lines: 10-16
+
+                from pytgcalls import Client
+                from pytgcalls import idle
+                ...
+
+                app = PyTgCalls(client)
+                app.start()
+
+                ...  # Call API methods
+
+                errors = app.join_group_calls(
+                    {
+                        chat_id: AudioPiped('test.mp4')
+                        for chat_id in chats
+                    }.items(),
+                    concurrency=20,
+                )
+
+                idle()
+        """
+        if self._app is None:
+            raise NoMtProtoClientSet()
+        calls = list(calls)
+        joins = asyncio.Semaphore(max(concurrency, 1))
+        results: Dict[Union[int, str], Optional[Exception]] = {}
+
+        async def join(chat_id: Union[int, str], stream: InputStream):
+            async with joins:
+                try:
+                    await self.join_group_call(
+                        chat_id,
+                        stream,
+                        invite_hash,
+                        join_as,
+                        stream_type,
+                    )
+                except Exception as e:
+                    results[chat_id] = e
+                else:
+                    results[chat_id] = None
+
+        with batch_cache():
+            await asyncio.gather(
+                *(join(chat_id, stream) for chat_id, stream in calls),
+            )
+        return {chat_id: results[chat_id] for chat_id, _ in calls}
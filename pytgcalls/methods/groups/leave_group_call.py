@@ -1,4 +1,3 @@
-import asyncio
 from typing import Union
 
 from ...exceptions import (
@@ -7,10 +6,8 @@ from ...exceptions import (
     NoMtProtoClientSet,
     NotInGroupCallError,
 )
-from ...mtproto import BridgedClient
 from ...scaffold import Scaffold
 from ...types import NotInGroupCall
-from ...types.session import Session
 
 
 class LeaveGroupCall(Scaffold):
@@ -62,30 +59,17 @@ class LeaveGroupCall(Scaffold):
                 try:
                     chat_id = int(chat_id)
                 except ValueError:
-                    chat_id = BridgedClient.chat_id(
-                        await self._app.resolve_peer(chat_id),
-                    )
+                    chat_id = await self._app.resolve_chat_id(chat_id)
                 chat_call = await self._app.get_full_chat(
                     chat_id,
                 )
                 if chat_call is not None:
-                    solver_id = Session.generate_session_id(24)
-
-                    async def internal_sender():
-                        if not self._wait_until_run.done():
-                            await self._wait_until_run
-                        await self._binding.send(
-                            {
-                                "action": "leave_call",
-                                "chat_id": chat_id,
-                                "type": "requested",
-                                "solver_id": solver_id,
-                            }
-                        )
-
-                    asyncio.ensure_future(internal_sender())
-                    result = await self._wait_result.wait_future_update(
-                        solver_id,
+                    result = await self._solve_request(
+                        "leave_call",
+                        {
+                            "chat_id": chat_id,
+                            "type": "requested",
+                        },
                     )
                     if isinstance(result, NotInGroupCall):
                         raise NotInGroupCallError()
@@ -14,7 +14,7 @@ class StreamEndedHandler(Scaffold):
             chat_id,
             CallHolder.IDLE,
         )
-        await self._on_event_update.propagate(
+        self._on_event_update.propagate_later(
             "STREAM_END_HANDLER",
             self,
             (
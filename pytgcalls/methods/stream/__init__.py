@@ -1,17 +1,29 @@
 from .change_stream import ChangeStream
+from .change_streams import ChangeStreams
 from .mute_stream import MuteStream
+from .mute_streams import MuteStreams
 from .pause_stream import PauseStream
+from .pause_streams import PauseStreams
 from .played_time import PlayedTime
 from .resume_stream import ResumeStream
+from .resume_streams import ResumeStreams
+from .stream_progress import GetStreamProgress
 from .unmute_stream import UnMuteStream
+from .unmute_streams import UnMuteStreams
 
 
 class Stream(
     ChangeStream,
+    ChangeStreams,
+    GetStreamProgress,
     MuteStream,
+    MuteStreams,
     PauseStream,
+    PauseStreams,
     PlayedTime,
     ResumeStream,
+    ResumeStreams,
     UnMuteStream,
+    UnMuteStreams,
 ):
     pass
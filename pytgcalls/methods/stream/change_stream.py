@@ -1,25 +1,9 @@
-import asyncio
-import logging
-import shlex
 from typing import Union
 
 from ...exceptions import NodeJSNotRunning, NoMtProtoClientSet, NotInGroupCallError
-from ...file_manager import FileManager
-from ...mtproto import BridgedClient
 from ...scaffold import Scaffold
-from ...types import (
-    CaptureAudioDevice,
-    CaptureAVDesktop,
-    CaptureAVDeviceDesktop,
-    CaptureVideoDesktop,
-    NotInGroupCall,
-    StreamDeleted,
-)
-from ...types.input_stream import AudioPiped, AudioVideoPiped, InputStream, VideoPiped
-from ...types.input_stream.audio_image_piped import AudioImagePiped
-from ...types.session import Session
-
-py_logger = logging.getLogger("pytgcalls")
+from ...types import NotInGroupCall, StreamDeleted
+from ...types.input_stream import InputStream
 
 
 class ChangeStream(Scaffold):
@@ -96,160 +80,16 @@ class ChangeStream(Scaffold):
         try:
             chat_id = int(chat_id)
         except ValueError:
-            chat_id = BridgedClient.chat_id(
-                await self._app.resolve_peer(chat_id),
-            )
+            chat_id = await self._app.resolve_chat_id(chat_id)
         if self._app is not None:
             if self._wait_until_run is not None:
-                headers = None
-                if (
-                    isinstance(
-                        stream,
-                        AudioImagePiped,
-                    )
-                    or isinstance(
-                        stream,
-                        AudioPiped,
-                    )
-                    or isinstance(
-                        stream,
-                        AudioVideoPiped,
-                    )
-                    or isinstance(
-                        stream,
-                        VideoPiped,
-                    )
-                ):
-                    headers = stream.raw_headers
-                if stream.stream_video is not None:
-                    if not stream.stream_video.path.startswith("screen://"):
-                        await FileManager.check_file_exist(
-                            stream.stream_video.path.replace(
-                                "fifo://",
-                                "",
-                            ).replace(
-                                "image:",
-                                "",
-                            ),
-                            headers,
-                        )
-                if stream.stream_audio is not None:
-                    if not stream.stream_audio.path.startswith("device://"):
-                        await FileManager.check_file_exist(
-                            stream.stream_audio.path.replace(
-                                "fifo://",
-                                "",
-                            ).replace(
-                                "image:",
-                                "",
-                            ),
-                            headers,
-                        )
-                audio_f_parameters = ""
-                video_f_parameters = ""
-                if (
-                    isinstance(
-                        stream,
-                        AudioImagePiped,
-                    )
-                    or isinstance(
-                        stream,
-                        AudioPiped,
-                    )
-                    or isinstance(
-                        stream,
-                        AudioVideoPiped,
-                    )
-                    or isinstance(
-                        stream,
-                        VideoPiped,
-                    )
-                    or isinstance(
-                        stream,
-                        CaptureVideoDesktop,
-                    )
-                    or isinstance(
-                        stream,
-                        CaptureAudioDevice,
-                    )
-                ):
-                    await stream.check_pipe()
-                    if stream.stream_audio:
-                        if stream.stream_audio.header_enabled:
-                            audio_f_parameters = stream.headers
-                    audio_f_parameters += ":_cmd_:".join(
-                        shlex.split(stream.ffmpeg_parameters),
-                    )
-                    if stream.stream_video:
-                        if stream.stream_video.header_enabled:
-                            video_f_parameters = stream.headers
-                    video_f_parameters += ":_cmd_:".join(
-                        shlex.split(stream.ffmpeg_parameters),
-                    )
-                elif isinstance(
-                    stream,
-                    CaptureAVDeviceDesktop,
-                ):
-                    audio_f_parameters += ":_cmd_:".join(
-                        shlex.split(stream.audio_ffmpeg),
-                    )
-                    video_f_parameters += ":_cmd_:".join(
-                        shlex.split(stream.video_ffmpeg),
-                    )
-                elif isinstance(
+                request = await self._change_stream_request(
+                    chat_id,
                     stream,
-                    CaptureAVDesktop,
-                ):
-                    await stream.check_pipe()
-                    if stream.stream_audio:
-                        if stream.stream_audio.header_enabled:
-                            audio_f_parameters = stream.headers
-                    audio_f_parameters += ":_cmd_:".join(
-                        shlex.split(stream.audio_ffmpeg),
-                    )
-                    video_f_parameters += ":_cmd_:".join(
-                        shlex.split(stream.video_ffmpeg),
-                    )
-                solver_id = Session.generate_session_id(24)
-
-                async def internal_sender():
-                    if not self._wait_until_run.done():
-                        await self._wait_until_run
-                    stream_audio = stream.stream_audio
-                    stream_video = stream.stream_video
-                    request = {
-                        "action": "change_stream",
-                        "chat_id": chat_id,
-                        "lip_sync": stream.lip_sync,
-                        "solver_id": solver_id,
-                    }
-                    if stream_audio is not None:
-                        request["stream_audio"] = {
-                            "path": stream_audio.path,
-                            "bitrate": stream_audio.parameters.bitrate,
-                            "ffmpeg_parameters": audio_f_parameters,
-                        }
-                    if stream.stream_video is not None:
-                        video_parameters = stream_video.parameters
-                        if video_parameters.frame_rate % 5 != 0 and not isinstance(
-                            stream, AudioImagePiped
-                        ):
-                            py_logger.warning(
-                                "For better experience the "
-                                "video frame rate must be a multiple of 5",
-                            )
-                        request["stream_video"] = {
-                            "path": stream_video.path,
-                            "width": video_parameters.width,
-                            "height": video_parameters.height,
-                            "framerate": video_parameters.frame_rate,
-                            "ffmpeg_parameters": video_f_parameters,
-                        }
-                    await self._binding.send(request)
-
-                asyncio.ensure_future(internal_sender())
-                result = await self._wait_result.wait_future_update(
-                    solver_id,
+                )
+                result = await self._solve_request(
+                    "change_stream",
+                    request,
                 )
                 if isinstance(result, NotInGroupCall):
                     raise NotInGroupCallError()
@@ -259,3 +99,11 @@ class ChangeStream(Scaffold):
                 raise NodeJSNotRunning()
         else:
             raise NoMtProtoClientSet()
+
+    async def _change_stream_request(
+        self,
+        chat_id: int,
+        stream: InputStream,
+    ) -> dict:
+        plan = await self._stream_plans.compile(stream)
+        return plan.request(chat_id)
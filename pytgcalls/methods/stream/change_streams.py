@@ -0,0 +1,62 @@
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from ...scaffold import Scaffold
+from ...types.input_stream import InputStream
+
+
+class ChangeStreams(Scaffold):
+    async def change_streams(
+        self,
+        streams: Iterable[Tuple[Union[int, str], InputStream]],
+    ) -> Dict[Union[int, str], Optional[Exception]]:
+        """Change the streaming files of many chats
+
+        This method changes the streaming file of every chat
+        like :meth:`~pytgcalls.PyTgCalls.change_stream`, sending
+        all of them to the core with a single request. Sources
+        shared by many chats are checked only once
+
+        Parameters:
+            streams (Iterable of (``int`` | ``str``, :obj:`~pytgcalls.types.InputStream()`)):
+                Pairs of chat and Input Stream descriptor to play
+                in it, like the items of a dictionary
+
+        Raises:
+            NoMtProtoClientSet: In case you try
+                to call this method without any MtProto client
+            NodeJSNotRunning: In case you try
+                to call this method without do
+                :meth:`~pytgcalls.PyTgCalls.start` before
+
+        Returns:
+            ``Dict[int | str, Exception | None]`` - Error raised
+            for each chat, like ``FileNotFoundError``, or
+            ``None`` if its stream has been changed
+
+        Example:
+            .. code-block:: python
+                :emphasize-lines: 10-15
+
+                from pytgcalls import Client
+                from pytgcalls import idle
+                ...
+
+                app = PyTgCalls(client)
+                app.start()
+
+                ...  # Call API methods
+
+                errors = app.change_streams(
+                    {
+                        chat_id: AudioPiped('test.mp4')
+                        for chat_id in chats
+                    }.items(),
+                )
+
+                idle()
+        """
+        return await self._solve_bulk_request(
+            "change_stream",
+            dict(streams),
+            self._change_stream_request,
+        )
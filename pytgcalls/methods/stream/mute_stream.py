@@ -1,11 +1,8 @@
-import asyncio
 from typing import Union
 
 from ...exceptions import NodeJSNotRunning, NoMtProtoClientSet, NotInGroupCallError
-from ...mtproto import BridgedClient
 from ...scaffold import Scaffold
 from ...types import NotInGroupCall
-from ...types.session import Session
 
 
 class MuteStream(Scaffold):
@@ -53,27 +50,14 @@ class MuteStream(Scaffold):
         try:
             chat_id = int(chat_id)
         except ValueError:
-            chat_id = BridgedClient.chat_id(
-                await self._app.resolve_peer(chat_id),
-            )
+            chat_id = await self._app.resolve_chat_id(chat_id)
         if self._app is not None:
             if self._wait_until_run is not None:
-                solver_id = Session.generate_session_id(24)
-
-                async def internal_sender():
-                    if not self._wait_until_run.done():
-                        await self._wait_until_run
-                    await self._binding.send(
-                        {
-                            "action": "mute_stream",
-                            "chat_id": chat_id,
-                            "solver_id": solver_id,
-                        }
-                    )
-
-                asyncio.ensure_future(internal_sender())
-                result = await self._wait_result.wait_future_update(
-                    solver_id,
+                result = await self._solve_request(
+                    "mute_stream",
+                    {
+                        "chat_id": chat_id,
+                    },
                 )
                 if isinstance(result, NotInGroupCall):
                     raise NotInGroupCallError()
@@ -0,0 +1,59 @@
+from typing import Dict, Iterable, Optional, Union
+
+from ...scaffold import Scaffold
+
+
+class PauseStreams(Scaffold):
+    async def pause_streams(
+        self,
+        chat_ids: Iterable[Union[int, str]],
+    ) -> Dict[Union[int, str], Optional[Exception]]:
+        """Pause the playing streams of many chats
+
+        This method pauses the stream of every chat like
+        :meth:`~pytgcalls.PyTgCalls.pause_stream`, sending all
+        of them to the core with a single request
+
+        Parameters:
+            chat_ids (Iterable of ``int`` | ``str``):
+                Unique identifiers of the target chats.
+                Can be direct ids (int) or usernames (str)
+
+        Raises:
+            NoMtProtoClientSet: In case you try
+                to call this method without any MtProto client
+            NodeJSNotRunning: In case you try
+                to call this method without do
+                :meth:`~pytgcalls.PyTgCalls.start` before
+
+        Returns:
+            ``Dict[int | str, Exception | None]`` - Error raised
+            for each chat, like ``NotInGroupCallError``, or
+            ``None`` if it has been paused
+
+        Example:
+            .. code-block:: python
+                :emphasize-lines: 10-15
+
+                from pytgcalls import Client
+                from pytgcalls import idle
+                ...
+
+                app = PyTgCalls(client)
+                app.start()
+
+                ...  # Call API methods
+
+                errors = app.pause_streams(
+                    [
+                        -1001185324811,
+                        -1001185324812,
+                    ],
+                )
+
+                idle()
+        """
+        return await self._solve_bulk_request(
+            "pause",
+            dict.fromkeys(chat_ids),
+        )
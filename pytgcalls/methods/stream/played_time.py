@@ -1,11 +1,8 @@
-import asyncio
 from typing import Union
 
 from ...exceptions import NodeJSNotRunning, NoMtProtoClientSet, NotInGroupCallError
-from ...mtproto import BridgedClient
 from ...scaffold import Scaffold
 from ...types import NotInGroupCall
-from ...types.session import Session
 from ...types.stream import StreamTime
 
 
@@ -16,7 +13,8 @@ class PlayedTime(Scaffold):
     ):
         """Get the played time of the stream
 
-        This method allow to get the played time of the stream
+        This method allow to get the played time of the stream,
+        from the progress pushed by the NodeJS core when available
 
         Parameters:
             chat_id (``int`` | ``str``):
@@ -35,31 +33,24 @@ class PlayedTime(Scaffold):
         try:
             chat_id = int(chat_id)
         except ValueError:
-            chat_id = BridgedClient.chat_id(
-                await self._app.resolve_peer(chat_id),
-            )
+            chat_id = await self._app.resolve_chat_id(chat_id)
         if self._app is not None:
             if self._wait_until_run is not None:
-                solver_id = Session.generate_session_id(24)
-
-                async def internal_sender():
-                    if not self._wait_until_run.done():
-                        await self._wait_until_run
-                    request = {
-                        "action": "played_time",
+                progress = self._call_holder.get_progress(chat_id)
+                if progress is not None:
+                    return round(progress.played / 1000)
+                result = await self._solve_request(
+                    "played_time",
+                    {
                         "chat_id": chat_id,
-                        "solver_id": solver_id,
-                    }
-                    await self._binding.send(request)
-
-                asyncio.ensure_future(internal_sender())
-                result = await self._wait_result.wait_future_update(
-                    solver_id,
+                    },
                 )
                 if isinstance(result, NotInGroupCall):
                     raise NotInGroupCallError()
                 elif isinstance(result, StreamTime):
-                    return result.time
+                    return result.time + round(
+                        self._call_holder.seek_offset(chat_id),
+                    )
             else:
                 raise NodeJSNotRunning()
         else:
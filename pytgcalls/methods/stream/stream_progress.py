@@ -0,0 +1,68 @@
+from typing import Optional, Union
+
+from ...exceptions import NodeJSNotRunning, NoMtProtoClientSet, NotInGroupCallError
+from ...scaffold import Scaffold
+from ...types import StreamProgress
+
+
+class GetStreamProgress(Scaffold):
+    async def stream_progress(
+        self,
+        chat_id: Union[int, str],
+    ) -> Optional[StreamProgress]:
+        """Get the playback progress of the stream
+
+        This method returns the last progress pushed by the
+        NodeJS core, without asking anything to it
+
+        Parameters:
+            chat_id (``int`` | ``str``):
+                Unique identifier of the target chat.
+                Can be a direct id (int) or a username (str)
+
+        Raises:
+            NoMtProtoClientSet: In case you try
+                to call this method without any MtProto client
+            NodeJSNotRunning: In case you try
+                to call this method without do
+                :meth:`~pytgcalls.PyTgCalls.start` before
+            NotInGroupCallError: In case you try
+                to get the progress of a non-joined group call
+
+        Returns:
+            :obj:`~pytgcalls.types.StreamProgress` - Played and
+            buffered time of the stream, or ``None`` if the core
+            didn't push it yet
+
+        Example:
+            .. code-block:: python
+                :emphasize-lines: 10-12
+
+                from pytgcalls import Client
+                from pytgcalls import idle
+                ...
+
+                app = PyTgCalls(client)
+                app.start()
+
+                ...  # Call API methods
+
+                progress = app.stream_progress(
+                    -1001185324811,
+                )
+
+                idle()
+        """
+        try:
+            chat_id = int(chat_id)
+        except ValueError:
+            chat_id = await self._app.resolve_chat_id(chat_id)
+        if self._app is not None:
+            if self._wait_until_run is not None:
+                if self._call_holder.get_status(chat_id) is None:
+                    raise NotInGroupCallError()
+                return self._call_holder.get_progress(chat_id)
+            else:
+                raise NodeJSNotRunning()
+        else:
+            raise NoMtProtoClientSet()
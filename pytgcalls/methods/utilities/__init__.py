@@ -1,19 +1,25 @@
+from .binding_stats import GetBindingStats
 from .cache_peer import CachePeer
+from .dispatcher_stats import GetDispatcherStats
 from .get_max_voice_chat import GetMaxVoiceChat
 from .is_connected import IsConnected
 from .mtproto_handler import MtProtoHandler
 from .ping import Ping
 from .run import Run
 from .start import Start
+from .stop import Stop
 
 
 class Utilities(
     CachePeer,
+    GetBindingStats,
+    GetDispatcherStats,
     GetMaxVoiceChat,
     IsConnected,
     Ping,
     MtProtoHandler,
     Run,
     Start,
+    Stop,
 ):
     pass
@@ -0,0 +1,28 @@
+from ...scaffold import Scaffold
+from ...types import BindingStats
+
+
+class GetBindingStats(Scaffold):
+    def binding_stats(self) -> BindingStats:
+        """Get the metrics of the NodeJS core connection
+
+        Latency of the pings and of the requests by action,
+        split between Python and the NodeJS core, together
+        with the traffic in both directions
+
+        Returns:
+            :obj:`~pytgcalls.types.BindingStats` - Metrics of
+            the latest requests, merged across every core
+
+        Example:
+            .. code-block:: python
+                :emphasize-lines: 5
+
+                from pytgcalls import Client
+                ...
+                app = Client(client)
+                app.start()
+                print(app.binding_stats())
+
+        """
+        return self._binding.binding_stats()
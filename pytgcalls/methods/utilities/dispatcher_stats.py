@@ -0,0 +1,34 @@
+from ...scaffold import Scaffold
+from ...types import DispatcherStats
+
+
+class GetDispatcherStats(Scaffold):
+    def dispatcher_stats(self) -> DispatcherStats:
+        """Get the counters of the handlers dispatcher
+
+        Events waiting and running in the workers of the
+        handlers, together with the ones dropped because
+        the queue was full
+
+        Returns:
+            :obj:`~pytgcalls.types.DispatcherStats` - Current
+            counters of the dispatcher
+
+        Example:
+            .. code-block:: python
+                :emphasize-lines: 5
+
+                from pytgcalls import Client
+                ...
+                app = Client(client)
+                app.start()
+                print(app.dispatcher_stats())
+
+        """
+        dispatcher = self._on_event_update.dispatcher
+        return DispatcherStats(
+            dispatcher.queued,
+            dispatcher.running,
+            dispatcher.dropped,
+            dispatcher.handled,
+        )
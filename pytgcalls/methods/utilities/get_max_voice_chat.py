@@ -1,5 +1,3 @@
-import psutil
-
 from ...scaffold import Scaffold
 
 
@@ -29,5 +27,7 @@ class GetMaxVoiceChat(Scaffold):
                 app.run()
 
         """
+        import psutil
+
         core_count = psutil.cpu_count()
         return int((100 / consumption) * core_count)
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import signal
+import threading
 from signal import SIGABRT, SIGINT, SIGTERM
 from signal import signal as signal_fn
 
@@ -16,6 +17,17 @@ signals = {
 }
 
 
+def signal_handler(signum, __):
+    global is_idling
+    py_logger.info(f"Stop signal received ({signals[signum]}). Exiting...")
+    is_idling = False
+
+
+def handle_signals():
+    for s in (SIGINT, SIGTERM, SIGABRT):
+        signal_fn(s, signal_handler)
+
+
 async def idle():
     """Block the main script execution until a signal is received.
 
@@ -53,13 +65,10 @@ async def idle():
     """
     global is_idling
 
-    def signal_handler(signum, __):
-        global is_idling
-        py_logger.info(f"Stop signal received ({signals[signum]}). Exiting...")
-        is_idling = False
-
-    for s in (SIGINT, SIGTERM, SIGABRT):
-        signal_fn(s, signal_handler)
+    # The sync API may run this on its loop thread, then the
+    # handlers are set by the main thread before waiting for it
+    if threading.current_thread() is threading.main_thread():
+        handle_signals()
     is_idling = True
     while is_idling:
         await asyncio.sleep(1)
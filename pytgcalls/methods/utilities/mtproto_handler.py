@@ -1,9 +1,12 @@
+from typing import List, Tuple
+
 from ...scaffold import Scaffold
 from ...types import Update
 from ...types.groups import (
     GroupCallParticipant,
     JoinedGroupCallParticipant,
     LeftGroupCallParticipant,
+    ParticipantsBatch,
     UpdatedGroupCallParticipant,
 )
 
@@ -78,22 +81,61 @@ class MtProtoHandler(Scaffold):
         ):
             if participant.user_id == self._my_id:
                 return
-            update_participant: Update = UpdatedGroupCallParticipant(
-                chat_id,
-                participant,
-            )
-            if just_joined:
-                update_participant = JoinedGroupCallParticipant(
+            await self._on_event_update.propagate(
+                "PARTICIPANTS_LIST",
+                self,
+                self._participant_update(
                     chat_id,
                     participant,
-                )
-            elif just_left:
-                update_participant = LeftGroupCallParticipant(
+                    just_joined,
+                    just_left,
+                ),
+            )
+
+        @self._app.on_participants_batch()
+        async def participants_batch_handler(
+            chat_id: int,
+            changes: List[Tuple[GroupCallParticipant, bool, bool]],
+        ):
+            updates = [
+                self._participant_update(
                     chat_id,
                     participant,
+                    just_joined,
+                    just_left,
                 )
+                for participant, just_joined, just_left in changes
+                if participant.user_id != self._my_id
+            ]
+            if not updates:
+                return
             await self._on_event_update.propagate(
                 "PARTICIPANTS_LIST",
                 self,
-                update_participant,
+                ParticipantsBatch(
+                    chat_id,
+                    updates,
+                ),
             )
+
+    @staticmethod
+    def _participant_update(
+        chat_id: int,
+        participant: GroupCallParticipant,
+        just_joined: bool,
+        just_left: bool,
+    ) -> Update:
+        if just_joined:
+            return JoinedGroupCallParticipant(
+                chat_id,
+                participant,
+            )
+        elif just_left:
+            return LeftGroupCallParticipant(
+                chat_id,
+                participant,
+            )
+        return UpdatedGroupCallParticipant(
+            chat_id,
+            participant,
+        )
@@ -32,9 +32,37 @@ class Start(Scaffold):
             self._is_running = True
             loop = asyncio.get_running_loop()
             self._wait_until_run = loop.create_future()
-            self._env_checker.check_environment()
-            await self._init_mtproto()
-            self._handle_mtproto()
-            await self._start_binding()
+            user_id = loop.create_future()
+
+            async def start_mtproto():
+                await self._init_mtproto()
+                self._handle_mtproto()
+                if not user_id.done():
+                    user_id.set_result(self._my_id)
+
+            async def start_core():
+                await self._env_checker.check_environment()
+                await self._start_binding(user_id)
+
+            # The NodeJS core is spawned, and loads wrtc, while the
+            # MTProto client starts, the handshake waits for the user id
+            tasks = [
+                asyncio.ensure_future(start_mtproto()),
+                asyncio.ensure_future(start_core()),
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # The other branch is stopped before the core, so it
+                # can't spawn one after the cleanup
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if not user_id.done():
+                    user_id.cancel()
+                await self._binding.stop()
+                self._wait_until_run = None
+                self._is_running = False
+                raise
         else:
             raise PyTgCallsAlreadyRunning()
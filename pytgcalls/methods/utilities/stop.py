@@ -0,0 +1,35 @@
+import asyncio
+
+from ...scaffold import Scaffold
+
+
+class Stop(Scaffold):
+    async def stop(self):
+        """Stop the client.
+
+        This method stops the NodeJS cores and the workers of the
+        handlers, the events still waiting for a handler are
+        dropped. The MtProto client is left running, a stopped
+        client can't be started again
+
+        Example:
+            .. code-block:: python
+                :emphasize-lines: 7
+
+                from pytgcalls import Client
+                ...
+                app = Client(client)
+                app.start()
+
+                ...  # Call API methods
+
+                app.stop()
+        """
+        if not self._is_running:
+            return
+        self._wait_until_run = None
+        await self._binding.stop()
+        if self._async_core is not None:
+            await asyncio.gather(self._async_core, return_exceptions=True)
+            self._async_core = None
+        await self._on_event_update.stop()
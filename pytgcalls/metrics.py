@@ -0,0 +1,84 @@
+from collections import deque
+from time import monotonic
+from typing import Deque, Iterable, List
+
+from .types.binding_stats import LatencyStats
+
+
+class Histogram:
+    # Only the latest samples are kept, so the percentiles
+    # follow the current behaviour of the binding
+    SIZE = 1024
+
+    def __init__(self):
+        self._samples: Deque[float] = deque(maxlen=self.SIZE)
+
+    def add(self, value: float):
+        self._samples.append(value)
+
+    @classmethod
+    def merge(cls, histograms: Iterable["Histogram"]) -> "Histogram":
+        merged = cls()
+        merged._samples = deque(
+            (value for histogram in histograms for value in histogram._samples),
+        )
+        return merged
+
+    def stats(self) -> LatencyStats:
+        samples: List[float] = sorted(self._samples)
+        if not samples:
+            return LatencyStats(0, 0, 0, 0, 0, 0)
+
+        def percentile(fraction: float) -> float:
+            return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+        return LatencyStats(
+            len(samples),
+            sum(samples) / len(samples),
+            percentile(0.5),
+            percentile(0.9),
+            percentile(0.99),
+            samples[-1],
+        )
+
+
+class Throughput:
+    # Totals of the last WINDOW seconds, bucketed by second
+    WINDOW = 10
+
+    def __init__(self):
+        self._buckets: Deque[List[float]] = deque()
+
+    def add(self, size: int, messages: int = 1):
+        second = int(monotonic())
+        if self._buckets and self._buckets[-1][0] == second:
+            bucket = self._buckets[-1]
+            bucket[1] += size
+            bucket[2] += messages
+        else:
+            self._buckets.append([second, size, messages])
+            self._expire(second)
+
+    def _expire(self, second: int):
+        while self._buckets and self._buckets[0][0] <= second - self.WINDOW:
+            self._buckets.popleft()
+
+    def bytes_per_second(self) -> float:
+        self._expire(int(monotonic()))
+        return sum(bucket[1] for bucket in self._buckets) / self.WINDOW
+
+    def messages_per_second(self) -> float:
+        self._expire(int(monotonic()))
+        return sum(bucket[2] for bucket in self._buckets) / self.WINDOW
+
+    @classmethod
+    def merge(cls, counters: Iterable["Throughput"]) -> "Throughput":
+        merged = cls()
+        totals = {}
+        for counter in counters:
+            for second, size, messages in counter._buckets:
+                bucket = totals.setdefault(second, [second, 0, 0])
+                bucket[1] += size
+                bucket[2] += messages
+        merged._buckets = deque(totals[second] for second in sorted(totals))
+        return merged
@@ -89,6 +89,9 @@ class BridgedClient:
     def on_kicked(self) -> Callable:
         pass
 
+    def on_peer_update(self) -> Callable:
+        pass
+
     def on_receive_invite(self) -> Callable:
         pass
 
@@ -101,5 +104,8 @@ class BridgedClient:
     def on_participants_change(self) -> Callable:
         pass
 
+    def on_participants_batch(self) -> Callable:
+        pass
+
     async def get_full_chat(self, chat_id: int):
         pass
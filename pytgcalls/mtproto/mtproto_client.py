@@ -1,8 +1,9 @@
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Union
 
 from ..exceptions import InvalidMtProtoClient
 from ..types.groups.group_call_participant import GroupCallParticipant
 from .bridged_client import BridgedClient
+from .peer_cache import PeerCache
 
 
 class MtProtoClient:
@@ -10,6 +11,7 @@ class MtProtoClient:
         self,
         cache_duration: int,
         client: Any,
+        participants_window: float = 0,
     ):
         self._bind_client: Optional[BridgedClient] = None
         if client.__class__.__module__ == "pyrogram.client":
@@ -18,6 +20,7 @@ class MtProtoClient:
             self._bind_client = PyrogramClient(
                 cache_duration,
                 client,
+                participants_window,
             )
         elif client.__class__.__module__ == "telethon.client.telegramclient":
             from .telethon_client import TelethonClient
@@ -25,9 +28,21 @@ class MtProtoClient:
             self._bind_client = TelethonClient(
                 cache_duration,
                 client,
+                participants_window,
             )
         else:
             raise InvalidMtProtoClient()
+        # Usernames are resolved once, a chat is resolved again
+        # as soon as it changes
+        self._peer_cache = PeerCache()
+
+        @self._bind_client.on_peer_update()
+        async def peer_update_handler(chat_id: int):
+            self._peer_cache.drop(chat_id)
+
+    @property
+    def peer_cache(self) -> PeerCache:
+        return self._peer_cache
 
     @property
     def client(self):
@@ -132,6 +147,26 @@ class MtProtoClient:
             )
         raise InvalidMtProtoClient()
 
+    async def resolve_chat_id(
+        self,
+        chat_id: Union[int, str],
+    ) -> int:
+        try:
+            return int(chat_id)
+        except ValueError:
+            return await self._peer_cache.resolve(
+                chat_id,
+                self._resolve_chat_id,
+            )
+
+    async def _resolve_chat_id(
+        self,
+        username: str,
+    ) -> int:
+        return BridgedClient.chat_id(
+            await self.resolve_peer(username),
+        )
+
     async def get_id(self) -> int:
         if self._bind_client is not None:
             return await self._bind_client.get_id()
@@ -173,3 +208,8 @@ class MtProtoClient:
         if self._bind_client is not None:
             return self._bind_client.on_participants_change()
         raise InvalidMtProtoClient()
+
+    def on_participants_batch(self) -> Callable:
+        if self._bind_client is not None:
+            return self._bind_client.on_participants_batch()
+        raise InvalidMtProtoClient()
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from typing import Callable, Dict, Tuple
+
+from ..types.groups.group_call_participant import GroupCallParticipant
+
+py_logger = logging.getLogger("pytgcalls")
+
+_Change = Tuple[GroupCallParticipant, bool, bool]
+
+
+class ParticipantsBatcher:
+    """Collects the participant changes of a chat for ``window``
+    seconds, then hands them to ``on_batch`` at once
+
+    Only the latest state of every user is kept, a user who joined
+    and left within the same window is not reported at all
+    """
+
+    def __init__(
+        self,
+        window: float,
+        on_batch: Callable,
+    ):
+        self._window = window
+        self._on_batch = on_batch
+        self._pending: Dict[int, Dict[int, _Change]] = {}
+
+    def add(
+        self,
+        chat_id: int,
+        participant: GroupCallParticipant,
+        just_joined: bool,
+        just_left: bool,
+    ):
+        changes = self._pending.get(chat_id)
+        if changes is None:
+            changes = self._pending[chat_id] = {}
+            asyncio.get_event_loop().call_later(
+                self._window,
+                self._flush,
+                chat_id,
+            )
+        user_id = participant.user_id
+        previous = changes.pop(user_id, None)
+        if previous is not None:
+            _, was_joined, _ = previous
+            if was_joined and just_left:
+                return
+            just_joined = just_joined or was_joined
+        changes[user_id] = (participant, just_joined, just_left)
+
+    def _flush(self, chat_id: int):
+        changes = self._pending.pop(chat_id, None)
+        if changes:
+            task = asyncio.ensure_future(
+                self._on_batch(chat_id, list(changes.values())),
+            )
+            task.add_done_callback(self._log_error)
+
+    @staticmethod
+    def _log_error(task: asyncio.Future):
+        if not task.cancelled() and task.exception() is not None:
+            py_logger.error(
+                "Error while delivering participants batch: %s",
+                task.exception(),
+            )
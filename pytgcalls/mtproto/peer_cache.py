@@ -0,0 +1,89 @@
+import asyncio
+from asyncio import Future
+from collections import OrderedDict
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+class PeerCache:
+    """Chat ids of the usernames already resolved
+
+    The least recently used usernames are evicted first once
+    ``max_size`` is reached, and every entry expires after ``ttl``
+    seconds, so renamed chats are eventually resolved again even
+    if their update is missed
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttl: float = 3600,
+    ):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._store: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._resolving: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(username: str) -> str:
+        return username.lstrip("@").lower()
+
+    def get(self, username: str) -> Optional[int]:
+        key = self._key(username)
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        chat_id, expiry_time = entry
+        if expiry_time < monotonic():
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return chat_id
+
+    def put(self, username: str, chat_id: int):
+        key = self._key(username)
+        self._store[key] = (chat_id, monotonic() + self._ttl)
+        self._store.move_to_end(key)
+        while len(self._store) > self._max_size:
+            self._store.popitem(last=False)
+
+    def drop(self, chat_id: int):
+        for key in [
+            key for key, (value, _) in self._store.items() if value == chat_id
+        ]:
+            del self._store[key]
+
+    def clear(self):
+        self._store.clear()
+
+    async def resolve(
+        self,
+        username: str,
+        resolver: Callable[[str], Awaitable[int]],
+    ) -> int:
+        chat_id = self.get(username)
+        if chat_id is not None:
+            self.hits += 1
+            return chat_id
+        self.misses += 1
+        # Methods called together with the same username wait
+        # for the same resolution
+        key = self._key(username)
+        loop = asyncio.get_running_loop()
+        future = self._resolving.get(key)
+        if future is None or future.get_loop() is not loop:
+            future = self._resolving[key] = asyncio.ensure_future(
+                resolver(username),
+            )
+        try:
+            chat_id = await asyncio.shield(future)
+        finally:
+            if future.done() and self._resolving.get(key) is future:
+                del self._resolving[key]
+        self.put(username, chat_id)
+        return chat_id
+
+    def __len__(self) -> int:
+        return len(self._store)
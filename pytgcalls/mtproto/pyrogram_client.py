@@ -1,5 +1,5 @@
 import json
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import pyrogram
 from pyrogram import Client, ContinuePropagation
@@ -35,11 +35,14 @@ from pyrogram.raw.types import (
     UpdateNewChannelMessage,
     UpdateNewMessage,
     Updates,
+    UpdateUserName,
 )
 
+from ..types.groups.group_call_participant import GroupCallParticipant
 from ..version_manager import VersionManager
 from .bridged_client import BridgedClient
 from .client_cache import ClientCache
+from .participants_batcher import ParticipantsBatcher
 
 
 class PyrogramClient(BridgedClient):
@@ -47,6 +50,7 @@ class PyrogramClient(BridgedClient):
         self,
         cache_duration: int,
         client: Client,
+        participants_window: float = 0,
     ):
         self._app: Client = client
         if VersionManager.version_tuple(
@@ -60,6 +64,12 @@ class PyrogramClient(BridgedClient):
             cache_duration,
             self,
         )
+        self._participants_batcher: Optional[ParticipantsBatcher] = None
+        if participants_window > 0:
+            self._participants_batcher = ParticipantsBatcher(
+                participants_window,
+                self._on_participants_batch,
+            )
 
         @self._app.on_raw_update()
         async def on_update(_, update, __, data2):
@@ -83,7 +93,14 @@ class PyrogramClient(BridgedClient):
                         participant.left,
                     )
                     if result is not None:
-                        if "PARTICIPANTS_HANDLER" in self._handler:
+                        if self._participants_batcher is not None:
+                            self._participants_batcher.add(
+                                self._cache.get_chat_id(update.call.id),
+                                result,
+                                participant.just_joined,
+                                participant.left,
+                            )
+                        elif "PARTICIPANTS_HANDLER" in self._handler:
                             await self._handler["PARTICIPANTS_HANDLER"](
                                 self._cache.get_chat_id(update.call.id),
                                 result,
@@ -121,6 +138,10 @@ class PyrogramClient(BridgedClient):
                 UpdateChannel,
             ):
                 chat_id = self.chat_id(update)
+                if "PEER_UPDATE_HANDLER" in self._handler:
+                    await self._handler["PEER_UPDATE_HANDLER"](
+                        chat_id,
+                    )
                 if len(data2) > 0:
                     if isinstance(
                         data2[update.channel_id],
@@ -131,6 +152,14 @@ class PyrogramClient(BridgedClient):
                             await self._handler["KICK_HANDLER"](
                                 chat_id,
                             )
+            if isinstance(
+                update,
+                UpdateUserName,
+            ):
+                if "PEER_UPDATE_HANDLER" in self._handler:
+                    await self._handler["PEER_UPDATE_HANDLER"](
+                        update.user_id,
+                    )
             if isinstance(
                 update,
                 UpdateNewChannelMessage,
@@ -234,6 +263,14 @@ class PyrogramClient(BridgedClient):
 
         return decorator
 
+    def on_peer_update(self) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            if self is not None:
+                self._handler["PEER_UPDATE_HANDLER"] = func
+            return func
+
+        return decorator
+
     def on_participants_change(self) -> Callable:
         def decorator(func: Callable) -> Callable:
             if self is not None:
@@ -242,6 +279,25 @@ class PyrogramClient(BridgedClient):
 
         return decorator
 
+    def on_participants_batch(self) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            if self is not None:
+                self._handler["PARTICIPANTS_BATCH_HANDLER"] = func
+            return func
+
+        return decorator
+
+    async def _on_participants_batch(
+        self,
+        chat_id: int,
+        changes: List[Tuple[GroupCallParticipant, bool, bool]],
+    ):
+        if "PARTICIPANTS_BATCH_HANDLER" in self._handler:
+            await self._handler["PARTICIPANTS_BATCH_HANDLER"](
+                chat_id,
+                changes,
+            )
+
     async def get_call(
         self,
         chat_id: int,
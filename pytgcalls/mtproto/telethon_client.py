@@ -1,5 +1,5 @@
 import json
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from telethon import TelegramClient
 from telethon.errors import ChannelPrivateError
@@ -33,10 +33,13 @@ from telethon.tl.types import (
     UpdateNewChannelMessage,
     UpdateNewMessage,
     Updates,
+    UpdateUserName,
 )
 
+from ..types.groups.group_call_participant import GroupCallParticipant
 from .bridged_client import BridgedClient
 from .client_cache import ClientCache
+from .participants_batcher import ParticipantsBatcher
 
 
 class TelethonClient(BridgedClient):
@@ -44,6 +47,7 @@ class TelethonClient(BridgedClient):
         self,
         cache_duration: int,
         client: TelegramClient,
+        participants_window: float = 0,
     ):
         self._app: TelegramClient = client
         self._handler: Dict[str, Callable] = {}
@@ -51,6 +55,12 @@ class TelethonClient(BridgedClient):
             cache_duration,
             self,
         )
+        self._participants_batcher: Optional[ParticipantsBatcher] = None
+        if participants_window > 0:
+            self._participants_batcher = ParticipantsBatcher(
+                participants_window,
+                self._on_participants_batch,
+            )
 
         @self._app.on(Raw())
         async def on_update(update):
@@ -74,7 +84,14 @@ class TelethonClient(BridgedClient):
                         participant.left,
                     )
                     if result is not None:
-                        if "PARTICIPANTS_HANDLER" in self._handler:
+                        if self._participants_batcher is not None:
+                            self._participants_batcher.add(
+                                self._cache.get_chat_id(update.call.id),
+                                result,
+                                participant.just_joined,
+                                participant.left,
+                            )
+                        elif "PARTICIPANTS_HANDLER" in self._handler:
                             await self._handler["PARTICIPANTS_HANDLER"](
                                 self._cache.get_chat_id(update.call.id),
                                 result,
@@ -116,6 +133,10 @@ class TelethonClient(BridgedClient):
                 UpdateChannel,
             ):
                 chat_id = self.chat_id(update)
+                if "PEER_UPDATE_HANDLER" in self._handler:
+                    await self._handler["PEER_UPDATE_HANDLER"](
+                        chat_id,
+                    )
                 try:
                     await self._app.get_entity(chat_id)
                 except ChannelPrivateError:
@@ -125,6 +146,14 @@ class TelethonClient(BridgedClient):
                             chat_id,
                         )
 
+            if isinstance(
+                update,
+                UpdateUserName,
+            ):
+                if "PEER_UPDATE_HANDLER" in self._handler:
+                    await self._handler["PEER_UPDATE_HANDLER"](
+                        update.user_id,
+                    )
             if isinstance(
                 update,
                 UpdateNewChannelMessage,
@@ -334,6 +363,14 @@ class TelethonClient(BridgedClient):
 
         return decorator
 
+    def on_peer_update(self) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            if self is not None:
+                self._handler["PEER_UPDATE_HANDLER"] = func
+            return func
+
+        return decorator
+
     def on_participants_change(self) -> Callable:
         def decorator(func: Callable) -> Callable:
             if self is not None:
@@ -342,6 +379,25 @@ class TelethonClient(BridgedClient):
 
         return decorator
 
+    def on_participants_batch(self) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            if self is not None:
+                self._handler["PARTICIPANTS_BATCH_HANDLER"] = func
+            return func
+
+        return decorator
+
+    async def _on_participants_batch(
+        self,
+        chat_id: int,
+        changes: List[Tuple[GroupCallParticipant, bool, bool]],
+    ):
+        if "PARTICIPANTS_BATCH_HANDLER" in self._handler:
+            await self._handler["PARTICIPANTS_BATCH_HANDLER"](
+                chat_id,
+                changes,
+            )
+
     async def leave_group_call(
         self,
         chat_id: int,
@@ -2,14 +2,16 @@ import atexit
 from typing import Any
 
 from .binding import Binding
+from .binding_pool import BindingPool
 from .environment import Environment
-from .handlers import HandlersHolder
+from .handlers import EventDispatcher, HandlersHolder
 from .methods import Methods
 from .mtproto import MtProtoClient
 from .scaffold import Scaffold
+from .stream_plan import StreamPlanCache
+from .sync import loop_thread
 from .types import Cache
 from .types.call_holder import CallHolder
-from .types.update_solver import UpdateSolver
 
 
 class PyTgCalls(Methods, Scaffold):
@@ -27,6 +29,10 @@ class PyTgCalls(Methods, Scaffold):
             Ping of NodeJS core
         is_connected (``bool``):
             Check if is alive the NodeJS connection
+        binding_stats (:obj:`~pytgcalls.types.BindingStats`):
+            Latency and traffic of the NodeJS connection
+        dispatcher_stats (:obj:`~pytgcalls.types.DispatcherStats`):
+            Counters of the handlers dispatcher
 
     Parameters:
         app (`Client`_ | `TelegramClient`_):
@@ -38,8 +44,62 @@ class PyTgCalls(Methods, Scaffold):
         overload_quiet_mode (``bool``):
             Disable overload cpu messages by setting true
 
+        transport (``str``, **optional**):
+            How to talk with the NodeJS core, ``stdio`` (default)
+            uses the process pipes, ``uds`` a Unix domain socket,
+            leaving the core stdout to diagnostics
+
+        socket_buffer_size (``int``, **optional**):
+            Send and receive buffer size of the ``uds`` transport
+
+        node_workers (``int``, **optional**):
+            Number of NodeJS cores to spawn, every group call
+            is pinned to one of them
+
+        node_threads (``int``, **optional**):
+            Number of worker processes of each NodeJS core running
+            the media pipelines, by default they run in the
+            core process itself
+
+        progress_interval (``float``, **optional**):
+            Seconds between the playback progress updates pushed
+            by the NodeJS core, read by
+            :meth:`~pytgcalls.PyTgCalls.played_time` and
+            :meth:`~pytgcalls.PyTgCalls.stream_progress`, 0 to
+            disable them
+
+        handler_workers (``int``, **optional**):
+            Number of handlers running at the same time, the
+            handlers of the same chat always run in order, one
+            at a time
+
+        handler_queue_size (``int``, **optional**):
+            Max number of events waiting for a handler worker
+
+        handler_overflow (``str``, **optional**):
+            What to do once the events queue is full,
+            ``drop_oldest`` (default), ``drop_new`` or ``wait``.
+            With ``wait`` the updates of the MtProto client wait
+            for room in the queue, the ones of the NodeJS core
+            are queued as soon as there is room without holding
+            up the core
+
+        participants_window (``float``, **optional**):
+            Seconds the participant changes of a chat are
+            collected for, keeping the latest state of every user,
+            handlers of :meth:`~pytgcalls.PyTgCalls.on_participants_change`
+            then get a single :obj:`~pytgcalls.types.ParticipantsBatch`.
+            0 (default) delivers every change on its own
+
+        stream_plan_ttl (``float``, **optional**):
+            Seconds the checked and probed streams are kept, so
+            playing again the same stream skips the checks, 0
+            (default) checks every stream when played
+
     Raises:
         InvalidMtProtoClient: You set an invalid MtProto client
+        InvalidTransport: You set an unsupported transport
+        InvalidOverflowPolicy: You set an unknown overflow policy
 
     """
 
@@ -48,11 +108,22 @@ class PyTgCalls(Methods, Scaffold):
         app: Any,
         cache_duration: int = 120,
         overload_quiet_mode: bool = False,
+        transport: str = Binding.STDIO,
+        socket_buffer_size: int = None,
+        node_workers: int = 1,
+        node_threads: int = 0,
+        progress_interval: float = 1.0,
+        handler_workers: int = 32,
+        handler_queue_size: int = 10000,
+        handler_overflow: str = EventDispatcher.DROP_OLDEST,
+        participants_window: float = 0,
+        stream_plan_ttl: float = 0,
     ):
         super().__init__()
         self._app = MtProtoClient(
             cache_duration,
             app,
+            participants_window,
         )
         self._is_running = False
         self._env_checker = Environment(
@@ -62,15 +133,34 @@ class PyTgCalls(Methods, Scaffold):
             self._app.client,
         )
         self._call_holder = CallHolder()
+        self._stream_plans = StreamPlanCache(stream_plan_ttl)
         self._cache_user_peer = Cache()
-        self._wait_result = UpdateSolver()
-        self._on_event_update = HandlersHolder()
-        self._binding = Binding(
-            overload_quiet_mode,
+        self._on_event_update = HandlersHolder(
+            handler_workers,
+            handler_queue_size,
+            handler_overflow,
         )
+        if node_workers > 1:
+            self._binding = BindingPool(
+                node_workers,
+                overload_quiet_mode,
+                transport,
+                socket_buffer_size,
+                node_threads,
+                progress_interval,
+            )
+        else:
+            self._binding = Binding(
+                overload_quiet_mode,
+                transport,
+                socket_buffer_size,
+                node_threads,
+                progress_interval,
+            )
 
         def cleanup():
             if self._async_core is not None:
                 self._async_core.cancel()
 
         atexit.register(cleanup)
+        loop_thread.add_client(self)
@@ -1,8 +1,8 @@
 import asyncio
 import re
 import sys
-
-from aiohttp import ClientConnectionError, ClientResponse, ClientSession
+from asyncio import Future
+from typing import Optional
 
 from .__version__ import __version__
 from .version_manager import VersionManager
@@ -10,6 +10,7 @@ from .version_manager import VersionManager
 
 class PyTgCallsSession:
     notice_displayed = False
+    _update_check: Optional[Future] = None
 
     async def start(self):
         if not self.notice_displayed:
@@ -20,38 +21,55 @@ class PyTgCallsSession:
                 "Licensed under the terms of the GNU Lesser "
                 "General Public License v3 or later (LGPLv3+)\n",
             )
-            try:
-                remote_stable_ver = await self._remote_version("master")
-                remote_dev_ver = await self._remote_version("dev")
-                remote_test_ver = remote_stable_ver + ".99"
-                if VersionManager.version_tuple(
-                    __version__
-                ) > VersionManager.version_tuple(remote_test_ver):
-                    remote_ver = remote_readable_ver = remote_dev_ver
-                    my_ver = __version__
+            # Nothing waits for the update notice, it is printed
+            # whenever GitHub answers
+            PyTgCallsSession._update_check = asyncio.ensure_future(
+                self._check_update(),
+            )
+
+    async def _check_update(self):
+        # aiohttp is slow to import, it is loaded off the startup path
+        from aiohttp import ClientError
+
+        try:
+            remote_stable_ver, remote_dev_ver = await asyncio.gather(
+                self._remote_version("master"),
+                self._remote_version("dev"),
+            )
+            remote_test_ver = remote_stable_ver + ".99"
+            if VersionManager.version_tuple(
+                __version__
+            ) > VersionManager.version_tuple(remote_test_ver):
+                remote_ver = remote_readable_ver = remote_dev_ver
+                my_ver = __version__
+            else:
+                remote_readable_ver = remote_stable_ver
+                remote_ver = remote_test_ver
+                my_ver = __version__ + ".99"
+            if VersionManager.version_tuple(
+                remote_ver
+            ) > VersionManager.version_tuple(my_ver):
+                text = (
+                    f"Update Available!\n"
+                    f"New PyTgCalls v{remote_readable_ver} "
+                    f"is now available!\n"
+                )
+                if not sys.platform.startswith("win"):
+                    print(f"\033[93m{text}\033[0m")
                 else:
-                    remote_readable_ver = remote_stable_ver
-                    remote_ver = remote_test_ver
-                    my_ver = __version__ + ".99"
-                if VersionManager.version_tuple(
-                    remote_ver
-                ) > VersionManager.version_tuple(my_ver):
-                    text = (
-                        f"Update Available!\n"
-                        f"New PyTgCalls v{remote_readable_ver} "
-                        f"is now available!\n"
-                    )
-                    if not sys.platform.startswith("win"):
-                        print(f"\033[93m{text}\033[0m")
-                    else:
-                        print(text)
-            except asyncio.exceptions.TimeoutError:
-                pass
-            except ClientConnectionError:
-                pass
+                    print(text)
+        except asyncio.exceptions.TimeoutError:
+            pass
+        except ClientError:
+            pass
+        except ValueError:
+            # An answer that can't be decoded, the notice is skipped
+            pass
 
     @staticmethod
     async def _remote_version(branch: str):
+        from aiohttp import ClientResponse, ClientSession
+
         async def get_async(url) -> str:
             session = ClientSession()
             try:
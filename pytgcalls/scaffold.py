@@ -1,5 +1,5 @@
 from asyncio import Future
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 
 class Scaffold:
@@ -16,15 +16,15 @@ class Scaffold:
         self._env_checker = None
         self._call_holder = None
         self._cache_user_peer = None
-        self._wait_result = None
         self._cache_local_peer = None
         self._on_event_update = None
         self._binding = None
+        self._stream_plans = None
 
     def _handle_mtproto(self):
         pass
 
-    async def _start_binding(self):
+    async def _start_binding(self, user_id: Union[int, Future]):
         pass
 
     async def _init_mtproto(self):
@@ -45,5 +45,28 @@ class Scaffold:
     async def _set_video_call_status(self, params: dict):
         pass
 
+    async def _solve_request(self, action: str, payload: dict):
+        pass
+
+    async def _solve_requests(self, action: str, payloads: List[dict]):
+        pass
+
+    async def _solve_bulk_request(
+        self,
+        action: str,
+        chats: Dict[Union[int, str], Any],
+        build_request: Optional[Callable] = None,
+    ):
+        pass
+
+    async def _change_stream_request(self, chat_id: int, stream):
+        pass
+
+    def _update_call_status(self, obj):
+        pass
+
+    async def _recover_calls(self, chat_ids: Optional[List[int]] = None):
+        pass
+
     async def start(self):
         pass
@@ -0,0 +1,91 @@
+import json
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _msgpack_dumps(obj: Any) -> bytes:
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False)
+
+
+class Serializer:
+    # Every payload starts with the id of the codec used to encode it,
+    # so both ends can switch codec without losing in-flight messages
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+    _CODECS: Dict[str, Tuple[int, Callable, Callable]] = {
+        JSON: (0, _json_dumps, _json_loads),
+        MSGPACK: (1, _msgpack_dumps, _msgpack_loads),
+    }
+    _DECODERS: Dict[int, Callable] = {tag: loads for tag, _, loads in _CODECS.values()}
+
+    def __init__(self):
+        self._name = self.JSON
+        self._tag = bytes((0,))
+        self._dumps = _json_dumps
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @staticmethod
+    def available() -> List[str]:
+        # Sorted by preference, orjson is faster than msgpack on
+        # the Python side while the stdlib json module is slower
+        codecs = [Serializer.JSON]
+        if msgpack is not None:
+            if orjson is None:
+                codecs.insert(0, Serializer.MSGPACK)
+            else:
+                codecs.append(Serializer.MSGPACK)
+        return codecs
+
+    def negotiate(self, remote_codecs: List[str]) -> str:
+        for codec in self.available():
+            if codec in remote_codecs:
+                self.use(codec)
+                break
+        return self._name
+
+    def use(self, name: str):
+        tag, dumps, _ = self._CODECS[name]
+        self._name = name
+        self._tag = bytes((tag,))
+        self._dumps = dumps
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._tag + self._dumps(obj)
+
+    @classmethod
+    def loads(cls, payload: bytes) -> Any:
+        if not payload:
+            raise ValueError("Empty frame")
+        decoder = cls._DECODERS.get(payload[0])
+        if decoder is None:
+            raise ValueError(f"Unknown codec id {payload[0]}")
+        return decoder(payload[1:])
@@ -0,0 +1,249 @@
+import logging
+import os
+import shlex
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional, Tuple
+
+from .batch_cache import headers_key
+from .file_manager import FileManager
+from .types.input_stream import (
+    AudioImagePiped,
+    AudioPiped,
+    AudioVideoPiped,
+    CaptureAudioDevice,
+    CaptureAVDesktop,
+    CaptureAVDeviceDesktop,
+    CaptureVideoDesktop,
+    InputStream,
+    VideoPiped,
+)
+from .types.input_stream.video_tools import check_support
+
+py_logger = logging.getLogger("pytgcalls")
+
+
+def _join_parameters(parameters: str) -> str:
+    return ":_cmd_:".join(shlex.split(parameters))
+
+
+def _params_key(parameters: Any) -> Optional[tuple]:
+    if parameters is None:
+        return None
+    return tuple(sorted(vars(parameters).items()))
+
+
+class StreamPlan:
+    """What the core needs to play a stream, checked and built
+    from its descriptor by :meth:`compile`
+    """
+
+    HEADER_TYPES = (
+        AudioImagePiped,
+        AudioPiped,
+        AudioVideoPiped,
+        VideoPiped,
+    )
+    PIPE_TYPES = HEADER_TYPES + (
+        CaptureVideoDesktop,
+        CaptureAudioDevice,
+    )
+
+    def __init__(
+        self,
+        lip_sync: bool,
+        stream_audio: Optional[dict],
+        stream_video: Optional[dict],
+        audio_header: bool,
+        video_header: bool,
+    ):
+        self.lip_sync = lip_sync
+        self.stream_audio = stream_audio
+        self.stream_video = stream_video
+        self.audio_header = audio_header
+        self.video_header = video_header
+
+    @property
+    def width(self) -> Optional[int]:
+        if self.stream_video is None:
+            return None
+        return self.stream_video["width"]
+
+    @property
+    def height(self) -> Optional[int]:
+        if self.stream_video is None:
+            return None
+        return self.stream_video["height"]
+
+    def request(self, chat_id: int, **kwargs) -> dict:
+        # Requests are kept to restart the calls, every one of
+        # them gets its own copy of the streams
+        request = {
+            "chat_id": chat_id,
+            **kwargs,
+            "lip_sync": self.lip_sync,
+        }
+        if self.stream_audio is not None:
+            request["stream_audio"] = dict(self.stream_audio)
+        if self.stream_video is not None:
+            request["stream_video"] = dict(self.stream_video)
+        return request
+
+    @classmethod
+    async def compile(cls, stream: InputStream) -> "StreamPlan":
+        headers = None
+        if isinstance(stream, cls.HEADER_TYPES):
+            headers = stream.raw_headers
+        if stream.stream_video is not None:
+            if not stream.stream_video.path.startswith("screen://"):
+                await FileManager.check_file_exist(
+                    stream.stream_video.path.replace(
+                        "fifo://",
+                        "",
+                    ).replace(
+                        "image:",
+                        "",
+                    ),
+                    headers,
+                )
+        if stream.stream_audio is not None:
+            if not stream.stream_audio.path.startswith("device://"):
+                await FileManager.check_file_exist(
+                    stream.stream_audio.path.replace(
+                        "fifo://",
+                        "",
+                    ).replace(
+                        "image:",
+                        "",
+                    ),
+                    headers,
+                )
+        audio_f_parameters = ""
+        video_f_parameters = ""
+        if isinstance(stream, cls.PIPE_TYPES):
+            await stream.check_pipe()
+            if stream.stream_audio:
+                if stream.stream_audio.header_enabled:
+                    audio_f_parameters = stream.headers
+            audio_f_parameters += _join_parameters(stream.ffmpeg_parameters)
+            if stream.stream_video:
+                if stream.stream_video.header_enabled:
+                    video_f_parameters = stream.headers
+            video_f_parameters += _join_parameters(stream.ffmpeg_parameters)
+        elif isinstance(stream, CaptureAVDeviceDesktop):
+            audio_f_parameters += _join_parameters(stream.audio_ffmpeg)
+            video_f_parameters += _join_parameters(stream.video_ffmpeg)
+        elif isinstance(stream, CaptureAVDesktop):
+            await stream.check_pipe()
+            if stream.stream_audio:
+                if stream.stream_audio.header_enabled:
+                    audio_f_parameters = stream.headers
+            audio_f_parameters += _join_parameters(stream.audio_ffmpeg)
+            video_f_parameters += _join_parameters(stream.video_ffmpeg)
+        stream_audio = stream.stream_audio
+        stream_video = stream.stream_video
+        audio_request = None
+        video_request = None
+        if stream_audio is not None:
+            audio_request = {
+                "path": stream_audio.path,
+                "bitrate": stream_audio.parameters.bitrate,
+                "ffmpeg_parameters": audio_f_parameters,
+            }
+        if stream_video is not None:
+            video_parameters = stream_video.parameters
+            if video_parameters.frame_rate % 5 != 0 and not isinstance(
+                stream, AudioImagePiped
+            ):
+                py_logger.warning(
+                    "For better experience the "
+                    "video frame rate must be a multiple of 5",
+                )
+            video_request = {
+                "path": stream_video.path,
+                "width": video_parameters.width,
+                "height": video_parameters.height,
+                "framerate": video_parameters.frame_rate,
+                "ffmpeg_parameters": video_f_parameters,
+            }
+        return StreamPlan(
+            stream.lip_sync,
+            audio_request,
+            video_request,
+            stream_audio is not None and stream_audio.header_enabled,
+            stream_video is not None and stream_video.header_enabled,
+        )
+
+
+class StreamPlanCache:
+    """Plans of a client, cached by the content of their descriptor
+
+    Playing again the same descriptor, or an equal one in many chats,
+    skips the file checks, the probes and the parsing of the FFmpeg
+    parameters. Local files are also keyed by their modification time
+    and size, so a file replaced or deleted at the same path is
+    checked again. Plans expire after ``ttl`` seconds, 0 disables the
+    cache
+    """
+
+    def __init__(self, ttl: float = 0, max_size: int = 256):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._plans: "OrderedDict[Hashable, Tuple[float, StreamPlan]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _source_key(path: Optional[str]) -> Optional[tuple]:
+        if path is None:
+            return None
+        path = path.replace("fifo://", "").replace("image:", "")
+        if check_support(path) or "://" in path:
+            return path, None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return path, None
+        return path, stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _key(cls, stream: InputStream) -> Hashable:
+        stream_audio = stream.stream_audio
+        stream_video = stream.stream_video
+        return (
+            type(stream),
+            stream.lip_sync,
+            cls._source_key(stream_audio.path if stream_audio else None),
+            _params_key(stream_audio.parameters if stream_audio else None),
+            cls._source_key(stream_video.path if stream_video else None),
+            _params_key(stream_video.parameters if stream_video else None),
+            getattr(stream, "ffmpeg_parameters", None),
+            getattr(stream, "audio_ffmpeg", None),
+            getattr(stream, "video_ffmpeg", None),
+            headers_key(getattr(stream, "raw_headers", None)),
+        )
+
+    async def compile(self, stream: InputStream) -> StreamPlan:
+        if self._ttl <= 0:
+            return await StreamPlan.compile(stream)
+        key = self._key(stream)
+        entry = self._plans.get(key)
+        if entry is not None:
+            expiry_time, plan = entry
+            if expiry_time > monotonic():
+                self._plans.move_to_end(key)
+                return plan
+            del self._plans[key]
+        plan = await StreamPlan.compile(stream)
+        # Probing may resize the video of the descriptor, the plan
+        # is found both with the sizes given and the ones probed
+        expiry_time = monotonic() + self._ttl
+        for plan_key in {key, self._key(stream)}:
+            self._plans[plan_key] = (expiry_time, plan)
+            self._plans.move_to_end(plan_key)
+        while len(self._plans) > self._max_size:
+            self._plans.popitem(last=False)
+        return plan
+
+    def clear(self):
+        self._plans.clear()
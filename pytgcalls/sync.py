@@ -1,18 +1,146 @@
 import asyncio
+import atexit
 import functools
 import inspect
 import threading
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Coroutine, Deque, Optional, Tuple
 
-from .custom_api import CustomApi
-from .media_devices import MediaDevices
 from .methods import Methods
 from .methods.utilities import idle as idle_module
 from .mtproto import MtProtoClient
 
 
+class LoopThread:
+    """Event loop of the sync API, run on its own thread
+
+    The loop is the one of the main thread, so clients created
+    there keep working on it. It is moved to a background thread
+    by :meth:`start`, or by the first sync call made from another
+    thread while nothing is running it. Sync calls made from any
+    thread are queued and handed to the loop together, waking it
+    up once per batch instead of once per call
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._queue: Deque[Tuple[Coroutine, Future]] = deque()
+        self._clients: "weakref.WeakSet[Methods]" = weakref.WeakSet()
+
+    def add_client(self, client: Methods):
+        self._clients.add(client)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def adopt(self, loop: asyncio.AbstractEventLoop):
+        with self._lock:
+            if not self.is_running():
+                self._loop = loop
+
+    def start(self):
+        with self._lock:
+            if self.is_running() or self._loop.is_running():
+                return
+            if self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="pytgcalls-loop",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._queue.append((coroutine, future))
+            wake_up = len(self._queue) == 1
+        if wake_up:
+            self._loop.call_soon_threadsafe(self._drain)
+        return future
+
+    def _drain(self):
+        with self._lock:
+            queue = self._queue
+            self._queue = deque()
+        for coroutine, future in queue:
+            if not future.set_running_or_notify_cancel():
+                coroutine.close()
+                continue
+            task = self._loop.create_task(coroutine)
+            task.add_done_callback(functools.partial(_copy_result, future))
+            future.add_done_callback(functools.partial(self._cancel, task))
+
+    def _cancel(self, task: asyncio.Task, future: Future):
+        if future.cancelled():
+            self._loop.call_soon_threadsafe(task.cancel)
+
+    def run(self, coroutine: Coroutine) -> Any:
+        return self.submit(coroutine).result()
+
+    def stop(self, timeout: Optional[float] = 5):
+        """Stop the clients, cancel what is still running on the
+        loop thread and wait for the thread to end
+
+        The loop is left open, it can be run again by the main
+        thread or by another :meth:`start`
+        """
+        if not self.is_running():
+            return
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("The loop thread can't stop itself")
+
+        async def cancel_tasks():
+            # The NodeJS cores outlive the loop if the clients
+            # aren't stopped first
+            await asyncio.gather(
+                *(client.stop() for client in list(self._clients)),
+                return_exceptions=True,
+            )
+            current = asyncio.current_task()
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            self.run(cancel_tasks())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def _copy_result(future: Future, task: asyncio.Task):
+    if future.done():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+loop_thread = LoopThread(asyncio.get_event_loop())
+atexit.register(loop_thread.stop)
+
+
 def async_to_sync(obj, name):
     function = getattr(obj, name)
-    main_loop = asyncio.get_event_loop()
 
     async def consume_generator(coroutine):
         return [i async for i in coroutine]
@@ -20,51 +148,37 @@ def async_to_sync(obj, name):
     @functools.wraps(function)
     def async_to_sync_wrap(*args, **kwargs):
         coroutine = function(*args, **kwargs)
+        loop = loop_thread.loop
 
         try:
-            loop = asyncio.get_event_loop()
+            running_loop = asyncio.get_running_loop()
         except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            running_loop = None
 
-        if threading.current_thread() is threading.main_thread():
-            if loop.is_running():
+        if running_loop is not None:
+            if (
+                running_loop is not loop
+                and threading.current_thread() is threading.main_thread()
+            ):
+                # Clients used from a loop of the main thread live on
+                # it, calls from other threads are sent there
+                loop_thread.adopt(running_loop)
+                loop = loop_thread.loop
+            if running_loop is loop or inspect.isasyncgen(coroutine):
                 return coroutine
-            else:
-                if inspect.iscoroutine(coroutine):
-                    return loop.run_until_complete(coroutine)
-
-                if inspect.isasyncgen(coroutine):
-                    return loop.run_until_complete(
-                        consume_generator(coroutine),
-                    )
-        else:
-            if inspect.iscoroutine(coroutine):
-                if loop.is_running():
-
-                    async def coro_wrapper():
-                        return await asyncio.wrap_future(
-                            asyncio.run_coroutine_threadsafe(
-                                coroutine,
-                                main_loop,
-                            ),
-                        )
-
-                    return coro_wrapper()
-                else:
-                    return asyncio.run_coroutine_threadsafe(
-                        coroutine,
-                        main_loop,
-                    ).result()
-
-            if inspect.isasyncgen(coroutine):
-                if loop.is_running():
-                    return coroutine
-                else:
-                    return asyncio.run_coroutine_threadsafe(
-                        consume_generator(coroutine),
-                        main_loop,
-                    ).result()
+            # The client lives on the loop of the sync API, the
+            # loop of another thread only waits for the result
+            if not loop.is_running():
+                loop_thread.start()
+            return asyncio.wrap_future(loop_thread.submit(coroutine))
+
+        if inspect.isasyncgen(coroutine):
+            coroutine = consume_generator(coroutine)
+        if not loop_thread.is_running() and not loop.is_running():
+            if threading.current_thread() is threading.main_thread():
+                return loop.run_until_complete(coroutine)
+            loop_thread.start()
+        return loop_thread.run(coroutine)
 
     setattr(obj, name, async_to_sync_wrap)
 
@@ -82,8 +196,15 @@ def wrap(source):
 
 # Wrap all Client's relevant methods
 wrap(Methods)
-wrap(CustomApi)
 wrap(MtProtoClient)
-wrap(MediaDevices)
 async_to_sync(idle_module, "idle")
-idle = getattr(idle_module, "idle")
+_idle = getattr(idle_module, "idle")
+
+
+@functools.wraps(_idle)
+def idle():
+    # Signals only reach the main thread, even while the
+    # loop thread is the one idling
+    if threading.current_thread() is threading.main_thread():
+        idle_module.handle_signals()
+    return _idle()
@@ -1,5 +1,8 @@
+from .binding_stats import ActionStats, BindingStats, LatencyStats
 from .browsers import Browsers
 from .cache import Cache
+from .core_recovered import CoreRecovered
+from .dispatcher_stats import DispatcherStats
 from .groups import (
     AlreadyJoined,
     ErrorDuringJoin,
@@ -11,6 +14,7 @@ from .groups import (
     LeftVoiceChat,
     MutedCall,
     NotInGroupCall,
+    ParticipantsBatch,
     UpdatedGroupCallParticipant,
     UpgradeNeeded,
 )
@@ -44,6 +48,7 @@ from .stream import (
     ResumedStream,
     StreamAudioEnded,
     StreamDeleted,
+    StreamProgress,
     StreamVideoEnded,
     UnMutedStream,
 )
@@ -55,9 +60,13 @@ __all__ = (
     "AudioImagePiped",
     "AudioPiped",
     "AudioVideoPiped",
+    "ActionStats",
+    "BindingStats",
     "Browsers",
     "Cache",
     "ChangedStream",
+    "CoreRecovered",
+    "DispatcherStats",
     "ErrorDuringJoin",
     "GroupCall",
     "GroupCallParticipant",
@@ -68,6 +77,7 @@ __all__ = (
     "InputVideoStream",
     "JoinedGroupCallParticipant",
     "JoinedVoiceChat",
+    "LatencyStats",
     "LowQualityAudio",
     "LowQualityVideo",
     "LeftGroupCallParticipant",
@@ -76,10 +86,12 @@ __all__ = (
     "MediumQualityAudio",
     "MediumQualityVideo",
     "NotInGroupCall",
+    "ParticipantsBatch",
     "PausedStream",
     "ResumedStream",
     "StreamAudioEnded",
     "StreamDeleted",
+    "StreamProgress",
     "StreamVideoEnded",
     "UnMutedStream",
     "UpdatedGroupCallParticipant",
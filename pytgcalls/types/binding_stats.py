@@ -0,0 +1,120 @@
+from typing import Dict
+
+from pytgcalls.types.py_object import PyObject
+
+
+class LatencyStats(PyObject):
+    """Distribution of the latest latency samples
+
+    Attributes:
+        count (``int``):
+            Number of samples.
+        mean (``float``):
+            Mean latency in milliseconds.
+        p50 (``float``):
+            Median latency in milliseconds.
+        p90 (``float``):
+            90th percentile in milliseconds.
+        p99 (``float``):
+            99th percentile in milliseconds.
+        max (``float``):
+            Highest latency in milliseconds.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        mean: float,
+        p50: float,
+        p90: float,
+        p99: float,
+        max_value: float,
+    ):
+        self.count: int = count
+        self.mean: float = mean
+        self.p50: float = p50
+        self.p90: float = p90
+        self.p99: float = p99
+        self.max: float = max_value
+
+
+class ActionStats(PyObject):
+    """Latency of the requests of an action sent to the NodeJS core
+
+    Attributes:
+        total (:obj:`~pytgcalls.types.LatencyStats`):
+            From the call to its answer, as seen by Python.
+        send (:obj:`~pytgcalls.types.LatencyStats`):
+            Spent by Python queueing and writing the request.
+        core (:obj:`~pytgcalls.types.LatencyStats`):
+            Spent by the NodeJS core from reading the request
+            to answering it, queueing behind the other
+            requests of the same chat included.
+    """
+
+    def __init__(
+        self,
+        total: LatencyStats,
+        send: LatencyStats,
+        core: LatencyStats,
+    ):
+        self.total: LatencyStats = total
+        self.send: LatencyStats = send
+        self.core: LatencyStats = core
+
+
+class BindingStats(PyObject):
+    """Metrics of the connection with the NodeJS core
+
+    What is left of ``total`` once ``send`` and ``core`` are
+    taken away is spent in the pipe and waiting for the event
+    loops of both ends.
+
+    Attributes:
+        rtt (:obj:`~pytgcalls.types.LatencyStats`):
+            Round trip time of the pings.
+        actions (``Dict[str, ActionStats]``):
+            Latency of the requests by action.
+        sent_bytes (``float``):
+            Bytes per second sent to the core.
+        sent_messages (``float``):
+            Messages per second sent to the core.
+        received_bytes (``float``):
+            Bytes per second received from the core.
+        received_messages (``float``):
+            Messages per second received from the core.
+        outstanding_requests (``int``):
+            Requests waiting for an answer of the core.
+        oldest_request_age (``float``):
+            Milliseconds the oldest outstanding request has
+            been waiting for, 0 if there are none.
+        timed_out_requests (``int``):
+            Requests the core didn't answer before their
+            deadline.
+        restarts (``int``):
+            Number of times the core has been restarted.
+    """
+
+    def __init__(
+        self,
+        rtt: LatencyStats,
+        actions: Dict[str, ActionStats],
+        sent_bytes: float,
+        sent_messages: float,
+        received_bytes: float,
+        received_messages: float,
+        outstanding_requests: int,
+        oldest_request_age: float,
+        timed_out_requests: int,
+        restarts: int,
+    ):
+        self.rtt: LatencyStats = rtt
+        self.actions: Dict[str, ActionStats] = actions
+        self.sent_bytes: float = sent_bytes
+        self.sent_messages: float = sent_messages
+        self.received_bytes: float = received_bytes
+        self.received_messages: float = received_messages
+        self.outstanding_requests: int = outstanding_requests
+        self.oldest_request_age: float = oldest_request_age
+        self.timed_out_requests: int = timed_out_requests
+        self.restarts: int = restarts
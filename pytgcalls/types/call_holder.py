@@ -1,8 +1,10 @@
-from typing import Dict
+from time import monotonic
+from typing import Dict, Optional, Tuple
 
 from ..exceptions import GroupCallNotFound
 from .groups import GroupCall
 from .list import List
+from .stream import StreamProgress
 
 
 class CallHolder:
@@ -12,13 +14,123 @@ class CallHolder:
 
     def __init__(self):
         self._calls: Dict[int, int] = {}
+        self._streams: Dict[int, dict] = {}
+        # Played seconds until the last status change and since when
+        # the stream is playing, used to resume it after a core restart
+        self._clocks: Dict[int, Tuple[float, Optional[float]]] = {}
+        # Latest progress pushed by the core and when it arrived
+        self._progress: Dict[int, Tuple[StreamProgress, int, float]] = {}
+        # Seconds skipped by the seek of a recovered stream, the core
+        # counts its progress from there
+        self._offsets: Dict[int, float] = {}
 
     def set_status(
         self,
         chat_id: int,
         status: int,
     ):
+        previous = self._calls.get(chat_id)
         self._calls[chat_id] = status
+        if chat_id in self._clocks and previous != status:
+            played, since = self._clocks[chat_id]
+            now = monotonic()
+            if since is not None:
+                played += now - since
+            self._clocks[chat_id] = (
+                played,
+                now if status == self.PLAYING else None,
+            )
+
+    def get_status(
+        self,
+        chat_id: int,
+    ) -> Optional[int]:
+        return self._calls.get(chat_id)
+
+    def set_stream(
+        self,
+        chat_id: int,
+        request: dict,
+        played_time: float = 0,
+        offset: float = 0,
+    ):
+        self._streams[chat_id] = request
+        # The progress of the previous stream is stale until the
+        # core pushes the one of the new stream
+        self._progress.pop(chat_id, None)
+        self._offsets[chat_id] = offset
+        self._clocks[chat_id] = (
+            played_time,
+            None if self._calls.get(chat_id) == self.PAUSED else monotonic(),
+        )
+
+    def get_stream(
+        self,
+        chat_id: int,
+    ) -> Optional[dict]:
+        return self._streams.get(chat_id)
+
+    @property
+    def streams(self):
+        return list(self._streams)
+
+    def played_time(
+        self,
+        chat_id: int,
+    ) -> float:
+        if chat_id not in self._clocks:
+            return 0
+        played, since = self._clocks[chat_id]
+        if since is not None:
+            played += monotonic() - since
+        return played
+
+    def seek_offset(
+        self,
+        chat_id: int,
+    ) -> float:
+        return self._offsets.get(chat_id, 0)
+
+    def set_progress(
+        self,
+        entries: list,
+    ):
+        now = monotonic()
+        for chat_id, played, buffered, status in entries:
+            if chat_id in self._calls:
+                self._progress[chat_id] = (
+                    StreamProgress(chat_id, played, buffered, status),
+                    status,
+                    now,
+                )
+
+    def get_progress(
+        self,
+        chat_id: int,
+    ) -> Optional[StreamProgress]:
+        if chat_id not in self._progress:
+            return None
+        progress, status, received_at = self._progress[chat_id]
+        offset = round(self.seek_offset(chat_id) * 1000)
+        if progress.status != "playing":
+            return StreamProgress(
+                chat_id,
+                progress.played + offset,
+                progress.buffered,
+                status,
+            )
+        # Between two ticks a playing stream keeps going, as far
+        # as what it had buffered allows
+        elapsed = min(
+            round((monotonic() - received_at) * 1000),
+            progress.buffered,
+        )
+        return StreamProgress(
+            chat_id,
+            progress.played + offset + elapsed,
+            progress.buffered - elapsed,
+            self.PLAYING,
+        )
 
     @property
     def active_calls(self):
@@ -57,3 +169,7 @@ class CallHolder:
     ):
         if chat_id in self._calls:
             del self._calls[chat_id]
+        self._streams.pop(chat_id, None)
+        self._clocks.pop(chat_id, None)
+        self._progress.pop(chat_id, None)
+        self._offsets.pop(chat_id, None)
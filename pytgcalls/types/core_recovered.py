@@ -0,0 +1,41 @@
+from typing import List
+
+from pytgcalls.types.py_object import PyObject
+
+
+class CoreRecovered(PyObject):
+    """Raised when a NodeJS core has been restarted
+    and its calls have been joined again
+
+    Attributes:
+        restarts (``int``):
+            Number of times the NodeJS core has been restarted.
+        recovered_calls (List of ``int``):
+            Chats joined again, resuming their stream.
+        failed_calls (List of ``int``):
+            Chats that couldn't be joined again.
+        recovery_time (``float``):
+            Seconds spent joining the calls again.
+
+    Parameters:
+        restarts (``int``):
+            Number of times the NodeJS core has been restarted.
+        recovered_calls (List of ``int``):
+            Chats joined again, resuming their stream.
+        failed_calls (List of ``int``):
+            Chats that couldn't be joined again.
+        recovery_time (``float``):
+            Seconds spent joining the calls again.
+    """
+
+    def __init__(
+        self,
+        restarts: int,
+        recovered_calls: List[int],
+        failed_calls: List[int],
+        recovery_time: float,
+    ):
+        self.restarts = restarts
+        self.recovered_calls = recovered_calls
+        self.failed_calls = failed_calls
+        self.recovery_time = recovery_time
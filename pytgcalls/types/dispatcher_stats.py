@@ -0,0 +1,28 @@
+from pytgcalls.types.py_object import PyObject
+
+
+class DispatcherStats(PyObject):
+    """Counters of the handlers dispatcher
+
+    Attributes:
+        queued (``int``):
+            Events waiting for a worker.
+        running (``int``):
+            Events whose handlers are running.
+        dropped (``int``):
+            Events dropped because the queue was full.
+        handled (``int``):
+            Events whose handlers have been run.
+    """
+
+    def __init__(
+        self,
+        queued: int,
+        running: int,
+        dropped: int,
+        handled: int,
+    ):
+        self.queued: int = queued
+        self.running: int = running
+        self.dropped: int = dropped
+        self.handled: int = handled
@@ -8,6 +8,7 @@ from .left_group_call_participant import LeftGroupCallParticipant
 from .left_voice_chat import LeftVoiceChat
 from .muted_call import MutedCall
 from .not_in_group_call import NotInGroupCall
+from .participants_batch import ParticipantsBatch
 from .updated_group_call_participant import UpdatedGroupCallParticipant
 from .upgrade_needed import UpgradeNeeded
 
@@ -21,6 +22,7 @@ __all__ = (
     "LeftGroupCallParticipant",
     "LeftVoiceChat",
     "NotInGroupCall",
+    "ParticipantsBatch",
     "UpdatedGroupCallParticipant",
     "UpgradeNeeded",
     "MutedCall",
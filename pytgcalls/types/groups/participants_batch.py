@@ -0,0 +1,32 @@
+from typing import List
+
+from ...types.update import Update
+
+
+class ParticipantsBatch(Update):
+    """Participants changed in a Group Call, collected over the
+    participants window
+
+    Attributes:
+        chat_id (``int``):
+            Unique identifier of chat.
+        updates (``List[Update]``):
+            Latest change of every participant, as
+            :obj:`~pytgcalls.types.JoinedGroupCallParticipant`,
+            :obj:`~pytgcalls.types.LeftGroupCallParticipant` or
+            :obj:`~pytgcalls.types.UpdatedGroupCallParticipant`
+
+    Parameters:
+        chat_id (``int``):
+            Unique identifier of chat.
+        updates (``List[Update]``):
+            Latest change of every participant
+    """
+
+    def __init__(
+        self,
+        chat_id: int,
+        updates: List[Update],
+    ):
+        super().__init__(chat_id)
+        self.updates = updates
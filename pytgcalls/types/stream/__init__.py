@@ -4,6 +4,7 @@ from .paused_stream import PausedStream
 from .resumed_stream import ResumedStream
 from .stream_audio_endend import StreamAudioEnded
 from .stream_deleted import StreamDeleted
+from .stream_progress import StreamProgress
 from .stream_time import StreamTime
 from .stream_video_endend import StreamVideoEnded
 from .unmuted_stream import UnMutedStream
@@ -15,6 +16,7 @@ __all__ = (
     "ResumedStream",
     "StreamAudioEnded",
     "StreamDeleted",
+    "StreamProgress",
     "StreamVideoEnded",
     "UnMutedStream",
     "StreamTime",
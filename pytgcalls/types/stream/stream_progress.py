@@ -0,0 +1,44 @@
+from pytgcalls.types.py_object import PyObject
+
+
+class StreamProgress(PyObject):
+    """Playback progress of a stream, pushed by the NodeJS core
+
+    Attributes:
+        chat_id (``int``):
+            Unique identifier of chat.
+        played (``int``):
+            Played time of the stream in milliseconds.
+        buffered (``int``):
+            Milliseconds of the stream ready to be played.
+        status (``str``):
+            Status of Stream
+
+    Parameters:
+        chat_id (``int``):
+            Unique identifier of chat.
+        played (``int``):
+            Played time of the stream in milliseconds.
+        buffered (``int``):
+            Milliseconds of the stream ready to be played.
+        binary_status (``int``):
+            PyTgCalls API parameter.
+    """
+
+    def __init__(
+        self,
+        chat_id: int,
+        played: int,
+        buffered: int,
+        binary_status: int,
+    ):
+        self.chat_id: int = chat_id
+        self.played: int = played
+        self.buffered: int = buffered
+        self.status: str = "unknown"
+        if binary_status == 1:
+            self.status = "playing"
+        elif binary_status == 2:
+            self.status = "paused"
+        elif binary_status == 3:
+            self.status = "not_playing"
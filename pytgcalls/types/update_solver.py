@@ -1,27 +1,102 @@
 import asyncio
-from asyncio import Future
-from typing import Any, Dict
+from asyncio import Future, TimerHandle
+from typing import Any, Dict, Hashable, Optional, Type, Union
+
+
+class _PendingUpdate:
+    __slots__ = ("future", "created_at", "deadline")
+
+    def __init__(
+        self,
+        future: Future,
+        created_at: float,
+        deadline: Optional[TimerHandle],
+    ):
+        self.future = future
+        self.created_at = created_at
+        self.deadline = deadline
 
 
 class UpdateSolver:
     def __init__(self):
-        self._list_pending_update: Dict[str, Future] = {}
+        self._list_pending_update: Dict[Hashable, _PendingUpdate] = {}
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._list_pending_update)
 
-    async def wait_future_update(
+    def create_future_update(
         self,
-        update_id: str,
-    ) -> Any:
+        update_id: Hashable,
+        timeout: Optional[float] = None,
+        timeout_error: Union[Exception, Type[Exception]] = asyncio.TimeoutError,
+    ) -> Future:
         loop = asyncio.get_event_loop()
-        self._list_pending_update[update_id] = loop.create_future()
-        return await self._list_pending_update[update_id]
+        future = loop.create_future()
+        deadline = None
+        # The entry goes away when its deadline is due, even if
+        # nobody is awaiting the future anymore
+        if timeout is not None:
+            deadline = loop.call_later(
+                timeout,
+                self._expire,
+                update_id,
+                timeout_error,
+            )
+        self._list_pending_update[update_id] = _PendingUpdate(
+            future,
+            loop.time(),
+            deadline,
+        )
+        return future
+
+    def _expire(
+        self,
+        update_id: Hashable,
+        timeout_error: Union[Exception, Type[Exception]],
+    ):
+        pending = self._list_pending_update.pop(update_id, None)
+        if pending is not None and not pending.future.done():
+            self.expired += 1
+            pending.future.set_exception(timeout_error)
 
     def resolve_future_update(
         self,
-        update_id: str,
+        update_id: Hashable,
         update: Any,
     ) -> bool:
-        if update_id in self._list_pending_update:
-            self._list_pending_update[update_id].set_result(update)
-            del self._list_pending_update[update_id]
+        pending = self._list_pending_update.pop(update_id, None)
+        if pending is None:
+            return False
+        if pending.deadline is not None:
+            pending.deadline.cancel()
+        if not pending.future.done():
+            pending.future.set_result(update)
             return True
         return False
+
+    def discard_future_update(
+        self,
+        update_id: Hashable,
+    ):
+        pending = self._list_pending_update.pop(update_id, None)
+        if pending is not None and pending.deadline is not None:
+            pending.deadline.cancel()
+
+    def oldest_age(self) -> float:
+        # Entries are kept in creation order, the first is the oldest
+        for pending in self._list_pending_update.values():
+            return pending.future.get_loop().time() - pending.created_at
+        return 0.0
+
+    def reject_all(
+        self,
+        exception: Union[Exception, Type[Exception]],
+    ):
+        pending_updates = self._list_pending_update
+        self._list_pending_update = {}
+        for pending in pending_updates.values():
+            if pending.deadline is not None:
+                pending.deadline.cancel()
+            if not pending.future.done():
+                pending.future.set_exception(exception)
@@ -387,6 +387,10 @@ if __name__ == "__main__":
             "screeninfo>=0.8.1",
         ],
         extras_require={
+            "speedups": [
+                "msgpack>=1.0.0",
+                "orjson>=3.8.0",
+            ],
             "dev": [
                 "pytest>=7.0.0",
                 "pytest-asyncio>=0.21.0",
@@ -1,121 +1,261 @@
 import { EventEmitter } from 'events';
+import * as fs from 'fs';
+import * as net from 'net';
 import * as process from "process";
-import {LogLevel, uuid} from "./utils";
+import { Writable } from 'stream';
+import {isMediaWorker, LogLevel, now, uuid} from "./utils";
+import {FrameDecoder} from "./framing";
+import {Serializer} from "./serializer";
 
 export class Binding extends EventEmitter {
     private connected = false;
     public overload_quiet = false;
     private readonly ssid: string;
     private readonly promises = new Map<string, CallableFunction>();
-    private readonly listPendingUpdates = new Map<number, Map<string, any>>();
-    private readonly activeUpdates = new Map<number, boolean>();
+    // Requests of the same chat run one at a time in arrival order,
+    // the next one starts as soon as the previous is resolved
+    private readonly listPendingUpdates = new Map<number, Array<any>>();
+    private readonly activeUpdates = new Map<number, any>();
+    private lastUpdateId = 0;
+    // Batched requests run concurrently, one per chat, and are
+    // answered with a single reply once all of them are resolved
+    private readonly batches = new Map<number, {
+        call_id: string,
+        received_at: number,
+        results: Array<any>,
+        resolved: Array<boolean>,
+        pending: number,
+    }>();
+    private lastBatchId = 0;
+    // Latest playback progress of every chat, sent to Python with
+    // a single message per tick
+    private readonly pendingProgress = new Map<number, Array<number>>();
+    private readonly decoder = new FrameDecoder();
+    private static readonly serializer = new Serializer();
+    private static output?: Writable;
+    private static readonly pendingOutput: Array<Buffer> = [];
+    private static corkedBytes = -1;
+    private static readonly MAX_BATCH_SIZE = 256 * 1024;
+    // Lowest level Python is going to print, set at the handshake
+    // and whenever the level of the pytgcalls logger changes
+    private static logLevel: number = LogLevel.DEBUG;
+    private static readonly throttled = new Map<string, {since: number, count: number}>();
+    private static readonly THROTTLE_INTERVAL = 5000;
 
     constructor() {
         super();
-        process.stdin.on('data', (chunk: boolean) => {
-            try {
-                const list_data = chunk.toString().split('}{').join('}\n{').split('\n');
-                for(let i = 0; i < list_data.length; i++){
-                    const data = JSON.parse(list_data[i]);
-                    if (data.try_connect == 'connected') {
-                        this.connected = true;
-                        this.overload_quiet = data.overload_quiet;
-                        Binding.sendInternalUpdate({
-                            ping: true,
-                        });
-                        setInterval(
-                            () =>
-                                Binding.sendInternalUpdate({
-                                    ping: true,
-                                }),
-                            10000,
-                        );
-                        setInterval(
-                            () => {
-                                this.listPendingUpdates.forEach((value, chat_id) => {
-                                        value.forEach((update_saved, update_id) => {
-                                            if(!this.activeUpdates.get(chat_id)){
-                                                this.activeUpdates.set(
-                                                    chat_id,
-                                                    true,
-                                                );
-                                                this.emit('request', update_saved, update_id);
-                                            }
-                                        });
-                                    }
-                                );
-                            }, 50
-                        );
-                        this.emit('connect', data.user_id);
-                    } else if (data.ping_with_response) {
-                        Binding.sendInternalUpdate({
-                            ping_with_response: true,
-                            sid: data.sid,
-                        });
-                    } else if (data.ssid == this.ssid) {
-                        if (data.uid !== undefined) {
-                            const promise = this.promises.get(data.uid);
-                            if (promise) {
-                                if (data.data !== undefined) {
-                                    promise(data.data);
-                                } else {
-                                    promise(null);
-                                }
-                            }
-                        } else {
-                            this.appendUpdate(data.data);
-                        }
-                    }
-                }
+        this.ssid = uuid(12);
+        const socketIndex = process.argv.indexOf('--socket');
+        if (socketIndex !== -1) {
+            this.listen(process.argv[socketIndex + 1]);
+        } else {
+            process.stdin.on('data', (chunk: Buffer) => this.onData(chunk));
+            this.attach(process.stdout);
+        }
+    }
+
+    private listen(path: string) {
+        try {
+            fs.unlinkSync(path);
+        } catch (e) {}
+        const server = net.createServer((socket: net.Socket) => {
+            // Only the Python client that spawned the core is served,
+            // the core exits as soon as it goes away
+            server.close();
+            socket.on('data', (chunk: Buffer) => this.onData(chunk));
+            socket.on('error', () => {});
+            socket.on('close', () => process.exit(0));
+            this.attach(socket);
+        });
+        server.listen(path);
+    }
+
+    private attach(output: Writable) {
+        Binding.output = output;
+        Binding.sendInternalUpdate({
+            try_connect: this.ssid,
+            codecs: Serializer.available(),
+        });
+        const pending = Binding.pendingOutput.splice(0);
+        for (let i = 0; i < pending.length; i++) {
+            output.write(pending[i]);
+        }
+    }
 
+    private onData(chunk: Buffer) {
+        let frames: Array<Buffer>;
+        try {
+            frames = this.decoder.push(chunk);
+        } catch (e) {
+            Binding.log('Invalid Binding Frame: ' + e, LogLevel.ERROR);
+            return;
+        }
+        for (let i = 0; i < frames.length; i++) {
+            try {
+                this.onMessage(Serializer.decode(frames[i]));
             } catch (e) {
-                console.log(e);
                 Binding.log('Invalid Binding Update', LogLevel.ERROR);
             }
+        }
+    }
+
+    private onMessage(data: any) {
+        if (data.try_connect == 'connected') {
+            this.connected = true;
+            this.overload_quiet = data.overload_quiet;
+            Binding.serializer.use(data.codec);
+            this.setLogLevel(data.log_level);
+            this.emit('progress_interval', data.progress_interval ?? 0);
+            Binding.sendInternalUpdate({
+                ping: true,
+            });
+            setInterval(
+                () =>
+                    Binding.sendInternalUpdate({
+                        ping: true,
+                    }),
+                10000,
+            );
+            this.emit('connect', data.user_id);
+            this.listPendingUpdates.forEach((_, chat_id) => {
+                this.dispatchUpdate(chat_id);
+            });
+        } else if (data.ping_with_response) {
+            Binding.sendInternalUpdate({
+                ping_with_response: true,
+                sid: data.sid,
+            });
+        } else if (data.log_level !== undefined) {
+            this.setLogLevel(data.log_level);
+        } else if (data.uid !== undefined) {
+            const promise = this.promises.get(data.uid);
+            if (promise) {
+                if (data.data !== undefined) {
+                    promise(data.data);
+                } else {
+                    promise(null);
+                }
+            }
+        } else if (data.data !== undefined) {
+            this.appendUpdate(data.data);
+        }
+    }
+
+    private setLogLevel(level?: number) {
+        if (level !== undefined) {
+            Binding.setLogLevel(level);
+            this.emit('log_level', level);
+        }
+    }
+
+    private appendUpdate(update: any) {
+        const chat_id = update.chat_id;
+        if (update.call_id !== undefined) {
+            update.received_at = now();
+        }
+        if (update.action === 'batch') {
+            this.appendBatch(update);
+            return;
+        }
+        const pending_updates = this.listPendingUpdates.get(chat_id);
+        if (pending_updates === undefined) {
+            this.listPendingUpdates.set(chat_id, [update]);
+        } else {
+            pending_updates.push(update);
+        }
+        if (this.connected && !this.activeUpdates.has(chat_id)) {
+            this.dispatchUpdate(chat_id);
+        }
+    }
+
+    private appendBatch(batch: any) {
+        const requests: Array<any> = batch.requests ?? [];
+        const batch_id = ++this.lastBatchId;
+        this.batches.set(batch_id, {
+            call_id: batch.call_id,
+            received_at: batch.received_at,
+            results: new Array(requests.length).fill(null),
+            resolved: new Array(requests.length).fill(false),
+            pending: requests.length,
         });
-        this.ssid = uuid(12);
+        if (requests.length == 0) {
+            this.replyBatch(batch_id);
+            return;
+        }
+        for (let i = 0; i < requests.length; i++) {
+            this.appendUpdate({
+                ...requests[i],
+                batch_id,
+                batch_index: i,
+            });
+        }
+    }
+
+    private resolveBatch(request: any, update: any) {
+        const batch = this.batches.get(request.batch_id);
+        if (batch === undefined || batch.resolved[request.batch_index]) {
+            return;
+        }
+        batch.resolved[request.batch_index] = true;
+        batch.results[request.batch_index] = update;
+        batch.pending--;
+        if (batch.pending == 0) {
+            this.replyBatch(request.batch_id);
+        }
+    }
+
+    private replyBatch(batch_id: number) {
+        const batch = this.batches.get(batch_id)!;
+        this.batches.delete(batch_id);
         Binding.sendInternalUpdate({
-            try_connect: this.ssid,
+            call_id: batch.call_id,
+            data: {
+                results: batch.results,
+            },
+            core_time: now() - batch.received_at,
         });
     }
 
-    private appendUpdate(update: any){
-        const chat_id = update.chat_id;
-        let pending_updates = this.listPendingUpdates.get(
-            chat_id,
-        )
-        const updateID = uuid(12);
-        if(!pending_updates){
-            pending_updates = new Map<string, any>();
-            pending_updates.set(
-                updateID,
-                update,
-            )
-            this.listPendingUpdates.set(
-                chat_id,
-                pending_updates,
-            )
-        }else{
-            pending_updates.set(
-                updateID,
-                update,
-            )
-        }
-    }
-
-    resolveUpdate(chat_id: number, update_id: string){
-        let pending_updates = this.listPendingUpdates.get(
-            chat_id,
-        )
-        pending_updates?.delete(update_id);
-        if(pending_updates?.size == 0){
-            this.listPendingUpdates.delete(
-                chat_id,
-            )
-        }
-        this.activeUpdates.delete(
-            chat_id,
-        );
+    private dispatchUpdate(chat_id: number) {
+        const pending_updates = this.listPendingUpdates.get(chat_id);
+        const update = pending_updates?.shift();
+        if (update === undefined) {
+            this.listPendingUpdates.delete(chat_id);
+            return;
+        }
+        if (pending_updates!.length == 0) {
+            this.listPendingUpdates.delete(chat_id);
+        }
+        this.activeUpdates.set(chat_id, update);
+        this.emit('request', update, String(++this.lastUpdateId));
+    }
+
+    resolveUpdate(chat_id: number, _update_id: string) {
+        const update = this.activeUpdates.get(chat_id);
+        this.activeUpdates.delete(chat_id);
+        if (update?.batch_id !== undefined) {
+            // A batched request that failed without replying still
+            // has to release its batch, its result is left empty
+            this.resolveBatch(update, null);
+        }
+        this.dispatchUpdate(chat_id);
+    }
+
+    // Entries are [chat_id, played ms, buffered ms, status]
+    pushProgress(entries: Array<Array<number>>) {
+        for (let i = 0; i < entries.length; i++) {
+            this.pendingProgress.set(entries[i][0], entries[i]);
+        }
+    }
+
+    flushProgress() {
+        if (!this.connected || this.pendingProgress.size == 0) {
+            return;
+        }
+        Binding.sendInternalUpdate({
+            progress: Array.from(this.pendingProgress.values()),
+        });
+        this.pendingProgress.clear();
     }
 
     async sendUpdate(update: any): Promise<any> {
@@ -124,7 +264,6 @@ export class Binding extends EventEmitter {
             Binding.sendInternalUpdate({
                 uid,
                 data: update,
-                ssid: this.ssid,
             });
             return new Promise(resolve => {
                 this.promises.set(uid, (data: any) => {
@@ -137,7 +276,67 @@ export class Binding extends EventEmitter {
         }
     }
 
+    async reply(request: any, update: any): Promise<any> {
+        // Requests made through Binding.call are answered directly,
+        // the others are still dispatched to the Python update handler
+        if (request.batch_id !== undefined) {
+            this.resolveBatch(request, update);
+            return;
+        }
+        if (request.call_id === undefined) {
+            return this.sendUpdate(update);
+        }
+        Binding.sendInternalUpdate({
+            call_id: request.call_id,
+            data: update,
+            core_time: now() - request.received_at,
+        });
+    }
+
+    static setLogLevel(level: number) {
+        Binding.logLevel = level;
+    }
+
+    static isEnabled(verbose_mode: number): boolean {
+        return verbose_mode >= Binding.logLevel;
+    }
+
+    // Returns how many times the event happened since it was last
+    // reported, or 0 if it was already reported in this interval
+    static throttle(key: string): number {
+        const now = Date.now();
+        const entry = Binding.throttled.get(key);
+        if (entry === undefined) {
+            Binding.throttled.set(key, {since: now, count: 0});
+            return 1;
+        }
+        entry.count++;
+        if (now - entry.since < Binding.THROTTLE_INTERVAL) {
+            return 0;
+        }
+        const count = entry.count;
+        entry.since = now;
+        entry.count = 0;
+        return count;
+    }
+
+    static forgetThrottle(key: string) {
+        Binding.throttled.delete(key);
+    }
+
     static log(message: string, verbose_mode: number) {
+        if (verbose_mode < Binding.logLevel) {
+            return;
+        }
+        if (isMediaWorker) {
+            // Media workers have no binding, the main process logs for them
+            process.send?.({
+                action: 'log',
+                message,
+                verbose_mode,
+            });
+            return;
+        }
         Binding.sendInternalUpdate({
             log_message: message,
             verbose_mode: verbose_mode,
@@ -145,7 +344,31 @@ export class Binding extends EventEmitter {
     }
 
     private static sendInternalUpdate(update: any) {
-        console.log(JSON.stringify(update));
+        const frame = Binding.serializer.encode(update);
+        const output = Binding.output;
+        if (output === undefined) {
+            Binding.pendingOutput.push(frame);
+            return;
+        }
+        // Frames written during the same tick are corked and leave
+        // with a single writev, a full batch is released right away
+        if (Binding.corkedBytes < 0) {
+            Binding.corkedBytes = 0;
+            output.cork();
+            setImmediate(Binding.uncork);
+        }
+        output.write(frame);
+        Binding.corkedBytes += frame.length;
+        if (Binding.corkedBytes >= Binding.MAX_BATCH_SIZE) {
+            Binding.uncork();
+        }
+    }
+
+    private static uncork() {
+        if (Binding.corkedBytes >= 0) {
+            Binding.corkedBytes = -1;
+            Binding.output?.uncork();
+        }
     }
 }
 export class MultiCoreBinding{
@@ -162,6 +385,19 @@ export class MultiCoreBinding{
         }
     }
 
+    async reply(request: any, update: any): Promise<any> {
+        this.process_multicore.postMessage({
+            action: 'reply',
+            request: {
+                call_id: request.call_id,
+                received_at: request.received_at,
+                batch_id: request.batch_id,
+                batch_index: request.batch_index,
+            },
+            update,
+        });
+    }
+
     async sendUpdate(update: any): Promise<any> {
         const uid = uuid(12);
         this.process_multicore.postMessage({
@@ -68,7 +68,9 @@ export class FFmpegReader {
     }
     private start_conversion(params: Array<string>) {
         params = params.filter(e => e);
-        Binding.log('RUNNING_FFMPEG_COMMAND -> ffmpeg ' + params.join(' '), LogLevel.INFO);
+        if (Binding.isEnabled(LogLevel.INFO)) {
+            Binding.log('RUNNING_FFMPEG_COMMAND -> ffmpeg ' + params.join(' '), LogLevel.INFO);
+        }
         this.fifo_reader = spawn('ffmpeg', params);
         this.fifo_reader.stdout.on('data', this.dataListener);
         this.fifo_reader.stderr.on('data', async (chunk: any) => {
@@ -0,0 +1,43 @@
+// Every message exchanged with Python is prefixed by its length as an
+// unsigned 32 bit big endian integer, followed by the id of the codec
+// used to encode it
+const HEADER_SIZE = 4;
+const MAX_FRAME_SIZE = 64 * 1024 * 1024;
+
+export function encodeFrame(codecId: number, body: string | Uint8Array): Buffer {
+    const bodyLength = typeof body === 'string' ? Buffer.byteLength(body) : body.length;
+    const frame = Buffer.allocUnsafe(HEADER_SIZE + 1 + bodyLength);
+    frame.writeUInt32BE(bodyLength + 1, 0);
+    frame[HEADER_SIZE] = codecId;
+    if (typeof body === 'string') {
+        frame.write(body, HEADER_SIZE + 1);
+    } else {
+        frame.set(body, HEADER_SIZE + 1);
+    }
+    return frame;
+}
+
+export class FrameDecoder {
+    private pending?: Buffer;
+
+    push(chunk: Buffer): Array<Buffer> {
+        const buffer = this.pending === undefined ? chunk : Buffer.concat([this.pending, chunk]);
+        const frames: Array<Buffer> = [];
+        let offset = 0;
+        while (buffer.length - offset >= HEADER_SIZE) {
+            const size = buffer.readUInt32BE(offset);
+            if (size > MAX_FRAME_SIZE) {
+                this.pending = undefined;
+                throw new Error('Frame of ' + size + ' bytes exceeds the maximum frame size');
+            }
+            const end = offset + HEADER_SIZE + size;
+            if (end > buffer.length) {
+                break;
+            }
+            frames.push(buffer.subarray(offset + HEADER_SIZE, end));
+            offset = end;
+        }
+        this.pending = offset < buffer.length ? buffer.subarray(offset) : undefined;
+        return frames;
+    }
+}
@@ -1,202 +1,108 @@
 import { RTCConnection } from './rtc-connection';
-import { Binding } from './binding';
+import { Binding, MultiCoreBinding } from './binding';
 import * as process from "process";
-import { isMainThread } from "worker_threads";
-import { getErrorMessage, LogLevel } from "./utils";
+import { collectProgress, handleRequest } from './request_handler';
+import { isMediaWorker, LogLevel } from './utils';
+import { WorkerPool } from './worker_pool';
 
-if (isMainThread) {
+if (!isMediaWorker) {
     const binding = new Binding();
     const connections = new Map<number, RTCConnection>();
+    // With --threads N the connections live in a pool of N media
+    // worker processes, so their audio and video ticks don't share
+    // this loop
+    const threadsIndex = process.argv.indexOf('--threads');
+    const threads = threadsIndex !== -1 ? parseInt(process.argv[threadsIndex + 1]) : 0;
+    const pool = threads > 0 ? new WorkerPool(binding, threads, __filename) : undefined;
 
+    // stdout is reserved to the binding frames, diagnostics go to stderr
     const logInfo = (msg: string) => {
         if (process.platform === 'win32') {
-            console.log(msg);
+            console.error(msg);
         } else {
-            console.log('\x1b[32m', msg, '\x1b[0m');
+            console.error('\x1b[32m', msg, '\x1b[0m');
         }
     };
 
-    const sendNotInCall = async (chatId: number, solverId: string) => {
-        await binding.sendUpdate({
-            action: 'update_request',
-            result: 'NOT_IN_GROUP_CALL',
-            chat_id: chatId,
-            solver_id: solverId,
-        });
-    };
-
     binding.on('connect', async (userId: number) => {
         logInfo(`[${userId}] Started Node.js core!`);
     });
 
-    binding.on('request', async (data: any, update_id: string) => {
-        Binding.log('REQUEST: ' + JSON.stringify(data), LogLevel.INFO);
-        let connection = connections.get(data.chat_id);
-
-        try {
-            switch (data.action) {
-                case 'join_call':
-                    if (!connection) {
-                        connection = new RTCConnection(
-                            data.chat_id,
-                            binding,
-                            data.buffer_length,
-                            data.invite_hash,
-                            data.stream_audio,
-                            data.stream_video,
-                            data.lip_sync,
-                        );
-                        connections.set(data.chat_id, connection);
-
-                        try {
-                            await connection.joinCall();
-                            await binding.sendUpdate({
-                                action: 'update_request',
-                                result: 'JOINED_VOICE_CHAT',
-                                chat_id: data.chat_id,
-                                solver_id: data.solver_id,
-                            });
-                        } catch (err: any) {
-                            connections.delete(data.chat_id);
-                            await binding.sendUpdate({
-                                action: 'update_request',
-                                result: getErrorMessage(err.message),
-                                chat_id: data.chat_id,
-                                solver_id: data.solver_id,
-                            });
-                        }
-                    } else {
-                        await binding.sendUpdate({
-                            action: 'update_request',
-                            result: 'ALREADY_JOINED',
-                            chat_id: data.chat_id,
-                            solver_id: data.solver_id,
-                        });
-                    }
-                    break;
-
-                case 'leave_call':
-                    if (!connection) {
-                        await sendNotInCall(data.chat_id, data.solver_id);
-                        break;
-                    }
-                    if (data.type === 'kicked_from_group') {
-                        connection.stop();
-                        connections.delete(data.chat_id);
-                        break;
-                    }
-                    const result = await connection.leave_call();
-                    connections.delete(data.chat_id);
-                    await binding.sendUpdate({
-                        action: 'update_request',
-                        result: 'LEFT_VOICE_CHAT',
-                        error: result?.result !== 'OK' ? result?.result : undefined,
-                        chat_id: data.chat_id,
-                        solver_id: data.solver_id,
-                    });
-                    break;
-
-                case 'pause':
-                case 'resume':
-                    if (!connection) {
-                        await sendNotInCall(data.chat_id, data.solver_id);
-                        break;
-                    }
-                    try {
-                        if (data.action === 'pause') {
-                            await connection.pause();
-                            await binding.sendUpdate({
-                                action: 'update_request',
-                                result: 'PAUSED_STREAM',
-                                chat_id: data.chat_id,
-                                solver_id: data.solver_id,
-                            });
-                        } else {
-                            await connection.resume();
-                            await binding.sendUpdate({
-                                action: 'update_request',
-                                result: 'RESUMED_STREAM',
-                                chat_id: data.chat_id,
-                                solver_id: data.solver_id,
-                            });
-                        }
-                    } catch (err) {
-                        Binding.log(`Error on ${data.action}: ${err}`, LogLevel.ERROR);
-                    }
-                    break;
-
-                case 'change_stream':
-                    if (!connection) {
-                        await sendNotInCall(data.chat_id, data.solver_id);
-                        break;
-                    }
-                    try {
-                        await connection.changeStream(
-                            data.stream_audio,
-                            data.stream_video,
-                            data.lip_sync,
-                        );
-                        await binding.sendUpdate({
-                            action: 'update_request',
-                            result: 'CHANGED_STREAM',
-                            chat_id: data.chat_id,
-                            solver_id: data.solver_id,
-                        });
-                    } catch (err) {
-                        await binding.sendUpdate({
-                            action: 'update_request',
-                            result: 'STREAM_DELETED',
-                            chat_id: data.chat_id,
-                            solver_id: data.solver_id,
-                        });
-                    }
-                    break;
+    binding.on('log_level', (level: number) => {
+        pool?.setLogLevel(level);
+    });
 
-                case 'mute_stream':
-                case 'unmute_stream':
-                    if (!connection) {
-                        await sendNotInCall(data.chat_id, data.solver_id);
-                        break;
-                    }
-                    if (data.action === 'mute_stream') {
-                        connection.mute();
-                        await binding.sendUpdate({
-                            action: 'update_request',
-                            result: 'MUTED_STREAM',
-                            chat_id: data.chat_id,
-                            solver_id: data.solver_id,
-                        });
-                    } else {
-                        connection.unmute();
-                        await binding.sendUpdate({
-                            action: 'update_request',
-                            result: 'UNMUTED_STREAM',
-                            chat_id: data.chat_id,
-                            solver_id: data.solver_id,
-                        });
-                    }
-                    break;
+    // Media workers push their progress on their own timer, the
+    // main thread sends whatever it has at every tick
+    let progressTimer: any;
+    binding.on('progress_interval', (interval: number) => {
+        pool?.setProgressInterval(interval);
+        clearInterval(progressTimer);
+        if (interval > 0) {
+            progressTimer = setInterval(() => {
+                if (pool === undefined) {
+                    binding.pushProgress(collectProgress(connections));
+                }
+                binding.flushProgress();
+            }, interval);
+        }
+    });
 
-                case 'played_time':
-                    if (connection) {
-                        await binding.sendUpdate({
-                            action: 'update_request',
-                            result: 'PLAYED_TIME',
-                            time: connection.getTime(),
-                            chat_id: data.chat_id,
-                            solver_id: data.solver_id,
-                        });
-                    } else {
-                        await sendNotInCall(data.chat_id, data.solver_id);
-                    }
-                    break;
+    binding.on('request', async (data: any, update_id: string) => {
+        if (Binding.isEnabled(LogLevel.INFO)) {
+            Binding.log('REQUEST: ' + JSON.stringify(data), LogLevel.INFO);
+        }
+        try {
+            if (pool !== undefined) {
+                await pool.request(data);
+            } else {
+                await handleRequest(binding, connections, data);
             }
-        } catch (err) {
-            Binding.log(`Unhandled error on ${data.action}: ${getErrorMessage((err as any).message)}`, LogLevel.ERROR);
         } finally {
             binding.resolveUpdate(data.chat_id, update_id);
         }
     });
+} else if (process.send !== undefined) {
+    const port = {
+        postMessage: (message: any) => process.send!(message),
+    };
+    const binding = new MultiCoreBinding(port);
+    const connections = new Map<number, RTCConnection>();
+    let progressTimer: any;
+
+    // A worker doesn't outlive the core that spawned it
+    process.on('disconnect', () => process.exit(0));
+    process.on('message', async (message: any) => {
+        switch (message.action) {
+            case 'request':
+                await handleRequest(binding, connections, message.data);
+                port.postMessage({
+                    action: 'request_done',
+                    request_id: message.request_id,
+                    active: connections.has(message.data.chat_id),
+                });
+                break;
+            case 'binding_update_result':
+                binding.resolveUpdate(message);
+                break;
+            case 'log_level':
+                Binding.setLogLevel(message.level);
+                break;
+            case 'progress_interval':
+                clearInterval(progressTimer);
+                if (message.interval > 0) {
+                    progressTimer = setInterval(() => {
+                        if (connections.size > 0) {
+                            port.postMessage({
+                                action: 'progress',
+                                entries: collectProgress(connections),
+                            });
+                        }
+                    }, message.interval);
+                }
+                break;
+        }
+    });
 }
 
 
@@ -0,0 +1,199 @@
+import { RTCConnection } from './rtc-connection';
+import { Binding, MultiCoreBinding } from './binding';
+import { getErrorMessage, LogLevel } from './utils';
+
+export function collectProgress(connections: Map<number, RTCConnection>): Array<Array<number>> {
+    const entries: Array<Array<number>> = [];
+    connections.forEach((connection) => {
+        entries.push(connection.getProgress());
+    });
+    return entries;
+}
+
+// Shared by the main thread and the media workers, the binding
+// either talks to Python or forwards to the main thread
+export async function handleRequest(
+    binding: Binding | MultiCoreBinding,
+    connections: Map<number, RTCConnection>,
+    data: any,
+) {
+    const sendNotInCall = async (data: any) => {
+        await binding.reply(data, {
+            action: 'update_request',
+            result: 'NOT_IN_GROUP_CALL',
+            chat_id: data.chat_id,
+        });
+    };
+
+    // Python waits for an answer to every request, failures
+    // included, until its call times out
+    const sendError = async (data: any, err: any) => {
+        Binding.log(`Error on ${data.action}: ${err}`, LogLevel.ERROR);
+        await binding.reply(data, {
+            action: 'update_request',
+            result: 'REQUEST_ERROR',
+            error: `${err}`,
+            chat_id: data.chat_id,
+        });
+    };
+
+    let connection = connections.get(data.chat_id);
+
+    try {
+        switch (data.action) {
+            case 'join_call':
+                if (!connection) {
+                    connection = new RTCConnection(
+                        data.chat_id,
+                        binding,
+                        data.buffer_length,
+                        data.invite_hash,
+                        data.stream_audio,
+                        data.stream_video,
+                        data.lip_sync,
+                    );
+                    connections.set(data.chat_id, connection);
+
+                    try {
+                        await connection.joinCall();
+                        await binding.reply(data, {
+                            action: 'update_request',
+                            result: 'JOINED_VOICE_CHAT',
+                            chat_id: data.chat_id,
+                        });
+                    } catch (err: any) {
+                        connections.delete(data.chat_id);
+                        await binding.reply(data, {
+                            action: 'update_request',
+                            result: getErrorMessage(err.message),
+                            chat_id: data.chat_id,
+                        });
+                    }
+                } else {
+                    await binding.reply(data, {
+                        action: 'update_request',
+                        result: 'ALREADY_JOINED',
+                        chat_id: data.chat_id,
+                    });
+                }
+                break;
+
+            case 'leave_call':
+                if (!connection) {
+                    await sendNotInCall(data);
+                    break;
+                }
+                if (data.type === 'kicked_from_group') {
+                    connection.stop();
+                    connections.delete(data.chat_id);
+                    break;
+                }
+                const result = await connection.leave_call();
+                connections.delete(data.chat_id);
+                await binding.reply(data, {
+                    action: 'update_request',
+                    result: 'LEFT_VOICE_CHAT',
+                    error: result?.result !== 'OK' ? result?.result : undefined,
+                    chat_id: data.chat_id,
+                });
+                break;
+
+            case 'pause':
+            case 'resume':
+                if (!connection) {
+                    await sendNotInCall(data);
+                    break;
+                }
+                try {
+                    if (data.action === 'pause') {
+                        await connection.pause();
+                        await binding.reply(data, {
+                            action: 'update_request',
+                            result: 'PAUSED_STREAM',
+                            chat_id: data.chat_id,
+                        });
+                    } else {
+                        await connection.resume();
+                        await binding.reply(data, {
+                            action: 'update_request',
+                            result: 'RESUMED_STREAM',
+                            chat_id: data.chat_id,
+                        });
+                    }
+                } catch (err) {
+                    await sendError(data, err);
+                }
+                break;
+
+            case 'change_stream':
+                if (!connection) {
+                    await sendNotInCall(data);
+                    break;
+                }
+                try {
+                    await connection.changeStream(
+                        data.stream_audio,
+                        data.stream_video,
+                        data.lip_sync,
+                    );
+                    await binding.reply(data, {
+                        action: 'update_request',
+                        result: 'CHANGED_STREAM',
+                        chat_id: data.chat_id,
+                    });
+                } catch (err) {
+                    await binding.reply(data, {
+                        action: 'update_request',
+                        result: 'STREAM_DELETED',
+                        chat_id: data.chat_id,
+                    });
+                }
+                break;
+
+            case 'mute_stream':
+            case 'unmute_stream':
+                if (!connection) {
+                    await sendNotInCall(data);
+                    break;
+                }
+                if (data.action === 'mute_stream') {
+                    connection.mute();
+                    await binding.reply(data, {
+                        action: 'update_request',
+                        result: 'MUTED_STREAM',
+                        chat_id: data.chat_id,
+                    });
+                } else {
+                    connection.unmute();
+                    await binding.reply(data, {
+                        action: 'update_request',
+                        result: 'UNMUTED_STREAM',
+                        chat_id: data.chat_id,
+                    });
+                }
+                break;
+
+            case 'played_time':
+                if (connection) {
+                    await binding.reply(data, {
+                        action: 'update_request',
+                        result: 'PLAYED_TIME',
+                        time: connection.getTime(),
+                        chat_id: data.chat_id,
+                    });
+                } else {
+                    await sendNotInCall(data);
+                }
+                break;
+
+            default:
+                await sendError(data, `unknown action ${data.action}`);
+        }
+    } catch (err) {
+        try {
+            await sendError(data, err);
+        } catch (replyErr) {
+            Binding.log(`Unable to answer ${data.action}: ${replyErr}`, LogLevel.ERROR);
+        }
+    }
+}
@@ -64,6 +64,8 @@ export class RTCConnection {
         this.videoStream.setLipSyncStatus(lipSync);
         this.audioStream.setOverloadQuietStatus(overloadQuiet);
         this.videoStream.setOverloadQuietStatus(overloadQuiet);
+        this.audioStream.setChatId(chatId);
+        this.videoStream.setChatId(chatId);
 
         this.tgcalls.joinVoiceCall = async (payload: any) => {
             payload = {
@@ -267,6 +269,24 @@ export class RTCConnection {
         return Math.round(time / 10000000);
     }
 
+    // [chat_id, played ms, buffered ms, status], the status uses
+    // the codes of the Python call holder
+    getProgress(): Array<number> {
+        const stream = this.audioParams != undefined ? this.audioStream : this.videoStream;
+        let status = 1;
+        if (stream.finished) {
+            status = 3;
+        } else if (stream.paused) {
+            status = 2;
+        }
+        return [
+            this.chatId,
+            Math.round(stream.getPlayedMs()),
+            Math.round(stream.getBufferedMs()),
+            status,
+        ];
+    }
+
     async resume() {
         this.audioStream.resume();
         this.videoStream.resume();
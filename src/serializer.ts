@@ -0,0 +1,47 @@
+import {encodeFrame} from './framing';
+
+let msgpack: any;
+try {
+    msgpack = require('@msgpack/msgpack');
+} catch (e) {
+    msgpack = undefined;
+}
+
+const JSON_ID = 0;
+const MSGPACK_ID = 1;
+
+export class Serializer {
+    static readonly JSON = 'json';
+    static readonly MSGPACK = 'msgpack';
+    private codecId: number = JSON_ID;
+
+    static available(): Array<string> {
+        if (msgpack !== undefined) {
+            return [Serializer.MSGPACK, Serializer.JSON];
+        }
+        return [Serializer.JSON];
+    }
+
+    use(name: string) {
+        this.codecId = name === Serializer.MSGPACK && msgpack !== undefined ? MSGPACK_ID : JSON_ID;
+    }
+
+    encode(update: any): Buffer {
+        if (this.codecId === MSGPACK_ID) {
+            return encodeFrame(MSGPACK_ID, msgpack.encode(update, {ignoreUndefined: true}));
+        }
+        return encodeFrame(JSON_ID, JSON.stringify(update));
+    }
+
+    static decode(payload: Buffer): any {
+        switch (payload[0]) {
+            case JSON_ID:
+                return JSON.parse(payload.toString('utf8', 1));
+            case MSGPACK_ID:
+                if (msgpack !== undefined) {
+                    return msgpack.decode(payload.subarray(1));
+                }
+        }
+        throw new Error('Unsupported codec id ' + payload[0]);
+    }
+}
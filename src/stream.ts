@@ -35,6 +35,7 @@ export class Stream extends EventEmitter {
     private lipSync: boolean = false;
     private bytesLength: number = 0;
     private overloadQuiet: boolean = false;
+    private chatId: number = 0;
     remotePlayingTime?: RemotePlayingTimeCallback;
     remoteLagging?: RemoteLaggingCallback;
 
@@ -68,6 +69,14 @@ export class Stream extends EventEmitter {
         this.overloadQuiet = status;
     }
 
+    public setChatId(chatId: number){
+        this.chatId = chatId;
+    }
+
+    private lagKey(): string {
+        return 'STREAM_LAG:' + this.chatId + ':' + (this.isVideo ? 'VIDEO':'AUDIO');
+    }
+
     setReadable(readable?: FFmpegReader | FileReader) {
         this.finished = true;
         this.finishedLoading = false;
@@ -101,7 +110,7 @@ export class Stream extends EventEmitter {
 
     private endListener = (() => {
         this.finishedLoading = true;
-        if(this.readable !== undefined){
+        if(this.readable !== undefined && Binding.isEnabled(LogLevel.DEBUG)){
             Binding.log(
                 'COMPLETED_BUFFERING -> ' + new Date().getTime() +
                             ' -> ' + (this.isVideo ? 'VIDEO':'AUDIO'),
@@ -197,6 +206,7 @@ export class Stream extends EventEmitter {
     stop() {
         this.finish();
         this.stopped = true;
+        Binding.forgetThrottle(this.lagKey());
     }
     restart(readable?: FFmpegReader | FileReader) {
         this.stopped = true;
@@ -328,46 +338,46 @@ export class Stream extends EventEmitter {
                         samples,
                     });
                 }
-            } else if (checkLag) {
-                this.notifyOverloadCpu((cpuPercentage: number) => {
-                    if(cpuPercentage >= 90){
-                        Binding.log(
-                            'CPU_OVERLOAD_DETECTED -> ' + new Date().getTime() +
-                            ' -> ' + (this.isVideo ? 'VIDEO':'AUDIO'),
-                            !this.overloadQuiet ? LogLevel.WARNING:LogLevel.DEBUG,
-                        );
-                    }else{
-                        Binding.log(
-                            'STREAM_LAG -> ' + new Date().getTime() +
-                            ' -> ' + (this.isVideo ? 'VIDEO':'AUDIO'),
-                            LogLevel.DEBUG,
-                        );
-                    }
-                    Binding.log(
-                        'BYTES_STREAM_CACHE_LENGTH -> ' + this.cache.length +
-                        ' -> ' + (this.isVideo ? 'VIDEO':'AUDIO'),
-                        LogLevel.DEBUG,
-                    );
-                    Binding.log(
-                        'BYTES_LOADED -> ' +
-                        this.bytesLoaded +
-                        'OF -> ' +
-                        this.readable?.fileSize() +
-                        ' -> ' + (this.isVideo ? 'VIDEO':'AUDIO'),
-                        LogLevel.DEBUG,
-                    );
-                });
+            } else if (
+                checkLag &&
+                Binding.isEnabled(this.overloadQuiet ? LogLevel.DEBUG:LogLevel.WARNING)
+            ) {
+                // A lagging stream stays behind for many frames, so lags
+                // are reported at most once per interval for each chat
+                const lagCount = Binding.throttle(this.lagKey());
+                if (lagCount > 0) {
+                    this.notifyOverloadCpu((cpuPercentage: number) => {
+                        const overload = cpuPercentage >= 90;
+                        const level = overload && !this.overloadQuiet ? LogLevel.WARNING:LogLevel.DEBUG;
+                        if (Binding.isEnabled(level)) {
+                            Binding.log(
+                                (overload ? 'CPU_OVERLOAD_DETECTED':'STREAM_LAG') +
+                                ' -> ' + new Date().getTime() +
+                                ' -> ' + this.chatId +
+                                ' -> ' + (this.isVideo ? 'VIDEO':'AUDIO') +
+                                ' -> LAGS -> ' + lagCount +
+                                ' -> CPU -> ' + cpuPercentage +
+                                ' -> BYTES_STREAM_CACHE_LENGTH -> ' + this.cache.length +
+                                ' -> BYTES_LOADED -> ' + this.bytesLoaded +
+                                ' OF -> ' + this.readable?.fileSize(),
+                                level,
+                            );
+                        }
+                    });
+                }
             }
 
             if (!this.finishedLoading) {
                 if (fileSize === this.lastBytesLoaded) {
                     if (this.equalCount >= 4) {
                         this.equalCount = 0;
-                        Binding.log(
-                            'NOT_ENOUGH_BYTES -> ' + oldTime +
-                        ' -> ' + (this.isVideo ? 'VIDEO':'AUDIO'),
-                            LogLevel.DEBUG,
-                        );
+                        if (Binding.isEnabled(LogLevel.DEBUG)) {
+                            Binding.log(
+                                'NOT_ENOUGH_BYTES -> ' + oldTime +
+                            ' -> ' + (this.isVideo ? 'VIDEO':'AUDIO'),
+                                LogLevel.DEBUG,
+                            );
+                        }
                         this.finishedBytes = true;
                         this.readable?.resume();
                     } else {
@@ -453,6 +463,24 @@ export class Stream extends EventEmitter {
         return Math.ceil((this.playedBytes/this.bytesLength) / (0.0001 / this.frameTime()))
     }
 
+    private frameDuration(): number{
+        return this.isVideo ? this.videoFramerate:10;
+    }
+
+    getPlayedMs(): number{
+        if (this.bytesLength == 0) {
+            return 0;
+        }
+        return (this.playedBytes / this.bytesLength) * this.frameDuration();
+    }
+
+    getBufferedMs(): number{
+        if (this.bytesLength == 0) {
+            return 0;
+        }
+        return (this.cache.length / this.bytesLength) * this.frameDuration();
+    }
+
     currentPlayedTime(): number | undefined{
         if(this.readable === undefined || this.finished){
             return undefined;
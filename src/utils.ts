@@ -1,10 +1,17 @@
 import {Commands, CommandsInfo, Sdp} from './types';
 import {webcrypto} from 'crypto';
+import {performance} from 'perf_hooks';
+
+// Set on the child processes spawned by the WorkerPool
+export const isMediaWorker = process.argv.indexOf('--media-worker') !== -1;
 
 export const second = <T>(_: any, s: T) => s;
 
 export const uuid = (t=21) => webcrypto.getRandomValues(new Uint8Array(t)).reduce(((t,e)=>t+=(e&=63)<36?e.toString(36):e<62?(e-26).toString(36).toUpperCase():e>62?"-":"_"),"");
 
+// Milliseconds with the same origin in every process of the core
+export const now = () => performance.timeOrigin + performance.now();
+
 export function parseSdp(sdp: string): Sdp {
     let lines = sdp.split('\r\n');
 
@@ -0,0 +1,202 @@
+import { ChildProcess, fork } from 'child_process';
+import { Binding } from './binding';
+import { LogLevel } from './utils';
+
+interface PendingRequest {
+    index: number;
+    data: any;
+    resolve: CallableFunction;
+}
+
+// Media workers are child processes rather than worker threads, wrtc
+// is a native addon that can't be loaded by more than one thread
+export class WorkerPool {
+    private readonly workers: Array<ChildProcess> = [];
+    private readonly load: Array<number> = [];
+    private readonly pinned = new Map<number, number>();
+    private readonly pending = new Map<number, PendingRequest>();
+    private lastRequestId = 0;
+    private logLevel?: number;
+    private progressInterval?: number;
+
+    constructor(private binding: Binding, size: number, private entry: string) {
+        for (let i = 0; i < size; i++) {
+            this.workers.push(this.spawn(i));
+            this.load.push(0);
+        }
+    }
+
+    private spawn(index: number): ChildProcess {
+        // stdout carries the binding frames, the workers write to stderr
+        const worker = fork(this.entry, ['--media-worker'], {
+            stdio: ['ignore', 2, 2, 'ipc'],
+            serialization: 'advanced',
+        });
+        worker.on('message', (message: any) => this.onMessage(index, message));
+        worker.on('error', (err: Error) => {
+            Binding.log('Media worker error: ' + err.message, LogLevel.ERROR);
+        });
+        worker.on('exit', (code: number | null, signal: string | null) => {
+            this.onExit(index, worker, code ?? signal);
+        });
+        // A respawned worker starts with the settings of the old one
+        if (this.logLevel !== undefined) {
+            this.send(worker, {
+                action: 'log_level',
+                level: this.logLevel,
+            });
+        }
+        if (this.progressInterval !== undefined) {
+            this.send(worker, {
+                action: 'progress_interval',
+                interval: this.progressInterval,
+            });
+        }
+        return worker;
+    }
+
+    private send(worker: ChildProcess, message: any) {
+        // A worker that is gone is handled by its exit handler
+        if (!worker.connected) {
+            return;
+        }
+        worker.send(message, (err: Error | null) => {
+            if (err) {
+                Binding.log('Unable to reach a media worker: ' + err.message, LogLevel.ERROR);
+            }
+        });
+    }
+
+    private async onExit(index: number, worker: ChildProcess, reason: number | string | null) {
+        if (this.workers[index] !== worker) {
+            return;
+        }
+        Binding.log(`Media worker ${index} exited (${reason}), respawning`, LogLevel.ERROR);
+        this.workers[index] = this.spawn(index);
+        // The calls of the worker are gone with it
+        const lostCalls: Array<number> = [];
+        this.pinned.forEach((pin, chatId) => {
+            if (pin === index) {
+                lostCalls.push(chatId);
+            }
+        });
+        lostCalls.forEach(chatId => this.unpin(chatId));
+        const requests: Array<PendingRequest> = [];
+        this.pending.forEach((request, requestId) => {
+            if (request.index === index) {
+                this.pending.delete(requestId);
+                requests.push(request);
+            }
+        });
+        for (const request of requests) {
+            try {
+                await this.binding.reply(request.data, {
+                    action: 'update_request',
+                    result: 'NOT_IN_GROUP_CALL',
+                    chat_id: request.data.chat_id,
+                });
+            } catch (err: any) {
+                Binding.log('Unable to reply to a request of a dead worker: ' + err.message, LogLevel.ERROR);
+            }
+            request.resolve(false);
+        }
+        // Python joins the lost calls again, from where they were
+        if (lostCalls.length > 0) {
+            this.binding.sendUpdate({
+                action: 'media_worker_restarted',
+                chat_ids: lostCalls,
+            }).catch((err: any) => {
+                Binding.log('Unable to report the calls of a dead worker: ' + err.message, LogLevel.ERROR);
+            });
+        }
+    }
+
+    async request(data: any): Promise<void> {
+        const chatId = data.chat_id;
+        let index = this.pinned.get(chatId);
+        if (index === undefined) {
+            // New calls go to the least loaded worker and stay there
+            index = this.load.indexOf(Math.min(...this.load));
+            if (data.action === 'join_call') {
+                this.pin(chatId, index);
+            }
+        }
+        const requestId = ++this.lastRequestId;
+        const active: boolean = await new Promise(resolve => {
+            this.pending.set(requestId, {
+                index: index!,
+                data,
+                resolve,
+            });
+            this.send(this.workers[index!], {
+                action: 'request',
+                request_id: requestId,
+                data,
+            });
+        });
+        if (!active) {
+            this.unpin(chatId);
+        }
+    }
+
+    setLogLevel(level: number) {
+        this.logLevel = level;
+        for (let i = 0; i < this.workers.length; i++) {
+            this.send(this.workers[i], {
+                action: 'log_level',
+                level,
+            });
+        }
+    }
+
+    setProgressInterval(interval: number) {
+        this.progressInterval = interval;
+        for (let i = 0; i < this.workers.length; i++) {
+            this.send(this.workers[i], {
+                action: 'progress_interval',
+                interval,
+            });
+        }
+    }
+
+    private pin(chatId: number, index: number) {
+        this.pinned.set(chatId, index);
+        this.load[index]++;
+    }
+
+    private unpin(chatId: number) {
+        const index = this.pinned.get(chatId);
+        if (index !== undefined) {
+            this.pinned.delete(chatId);
+            this.load[index]--;
+        }
+    }
+
+    private async onMessage(index: number, message: any) {
+        switch (message.action) {
+            case 'request_done':
+                const request = this.pending.get(message.request_id);
+                if (request) {
+                    this.pending.delete(message.request_id);
+                    request.resolve(message.active);
+                }
+                break;
+            case 'reply':
+                await this.binding.reply(message.request, message.update);
+                break;
+            case 'binding_update':
+                this.send(this.workers[index], {
+                    action: 'binding_update_result',
+                    uid: message.uid,
+                    result: await this.binding.sendUpdate(message.update),
+                });
+                break;
+            case 'progress':
+                this.binding.pushProgress(message.entries);
+                break;
+            case 'log':
+                Binding.log(message.message, message.verbose_mode);
+                break;
+        }
+    }
+}
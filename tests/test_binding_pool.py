@@ -0,0 +1,37 @@
+from pytgcalls.binding_pool import BindingPool
+
+
+def test_chats_keep_their_core():
+    pool = BindingPool(4, False)
+    for chat_id in range(-1001000000000, -1001000000100, -1):
+        assert pool._route("pause", chat_id) == pool._route("played_time", chat_id)
+
+
+def test_chats_spread_over_the_cores():
+    pool = BindingPool(4, False)
+    cores = {
+        pool._route("pause", chat_id)
+        for chat_id in range(-1001000000000, -1001000000100, -1)
+    }
+    assert cores == {0, 1, 2, 3}
+
+
+def test_joins_go_to_the_least_loaded_core():
+    pool = BindingPool(3, False)
+    assert [pool._route("join_call", chat_id) for chat_id in (1, 2, 3, 4)] == [
+        0,
+        1,
+        2,
+        0,
+    ]
+    pool._unpin(2)
+    assert pool._route("join_call", 5) == 1
+
+
+def test_calls_stay_pinned():
+    pool = BindingPool(3, False)
+    index = pool._route("join_call", 1)
+    for action in ("pause", "change_stream", "leave_call"):
+        assert pool._route(action, 1) == index
+    pool._unpin(1)
+    assert 1 not in pool._pinned
@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from pytgcalls.exceptions import InvalidOverflowPolicy
+from pytgcalls.handlers import EventDispatcher
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+        self.release = asyncio.Event()
+
+    async def record(self, name):
+        self.events.append(name)
+
+    async def block(self, name):
+        self.events.append(name)
+        await self.release.wait()
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def busy_dispatcher(overflow: str):
+    # One worker held by a blocking event, with room for two more
+    dispatcher = EventDispatcher(1, 2, overflow)
+    recorder = Recorder()
+    await dispatcher.submit(1, [recorder.block], ("blocking",), {})
+    await settle()
+    return dispatcher, recorder
+
+
+@pytest.mark.asyncio
+async def test_order_of_chat():
+    dispatcher = EventDispatcher(4)
+    recorder = Recorder()
+
+    async def slow(name):
+        await asyncio.sleep(0.01)
+        recorder.events.append(name)
+
+    await dispatcher.submit(1, [slow], ("first",), {})
+    await dispatcher.submit(1, [recorder.record], ("second",), {})
+    await dispatcher.submit(1, [recorder.record, recorder.record], ("third",), {})
+    await asyncio.sleep(0.05)
+    assert recorder.events == ["first", "second", "third", "third"]
+    assert dispatcher.handled == 3
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_chats_run_concurrently():
+    dispatcher = EventDispatcher(2)
+    recorder = Recorder()
+    await dispatcher.submit(1, [recorder.block], ("blocking",), {})
+    await dispatcher.submit(2, [recorder.record], ("other chat",), {})
+    await settle()
+    assert recorder.events == ["blocking", "other chat"]
+    assert dispatcher.running == 1
+    recorder.release.set()
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_handler_error_is_logged(caplog):
+    dispatcher = EventDispatcher(1)
+    recorder = Recorder()
+
+    async def failing(name):
+        raise RuntimeError(name)
+
+    await dispatcher.submit(1, [failing, recorder.record], ("event",), {})
+    await settle()
+    assert recorder.events == ["event"]
+    assert "Unhandled error in handler failing" in caplog.text
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    dispatcher, recorder = await busy_dispatcher(EventDispatcher.DROP_OLDEST)
+    for name in ("a", "b", "c"):
+        await dispatcher.submit(1, [recorder.record], (name,), {})
+    assert dispatcher.dropped == 1
+    recorder.release.set()
+    await settle()
+    assert recorder.events == ["blocking", "b", "c"]
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_of_another_chat():
+    dispatcher, recorder = await busy_dispatcher(EventDispatcher.DROP_OLDEST)
+    for name in ("a", "b"):
+        await dispatcher.submit(1, [recorder.record], (name,), {})
+    # The new chat has nothing waiting, its own event is dropped
+    await dispatcher.submit(2, [recorder.record], ("c",), {})
+    assert dispatcher.dropped == 1
+    recorder.release.set()
+    await settle()
+    assert recorder.events == ["blocking", "a", "b"]
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_drop_new():
+    dispatcher, recorder = await busy_dispatcher(EventDispatcher.DROP_NEW)
+    for name in ("a", "b", "c"):
+        await dispatcher.submit(1, [recorder.record], (name,), {})
+    assert dispatcher.dropped == 1
+    recorder.release.set()
+    await settle()
+    assert recorder.events == ["blocking", "a", "b"]
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_wait():
+    dispatcher, recorder = await busy_dispatcher(EventDispatcher.WAIT)
+    for name in ("a", "b"):
+        await dispatcher.submit(1, [recorder.record], (name,), {})
+    waiting = asyncio.ensure_future(
+        dispatcher.submit(1, [recorder.record], ("c",), {}),
+    )
+    await settle()
+    assert not waiting.done()
+    recorder.release.set()
+    await waiting
+    await settle()
+    assert recorder.events == ["blocking", "a", "b", "c"]
+    assert dispatcher.dropped == 0
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_later_does_not_wait():
+    dispatcher, recorder = await busy_dispatcher(EventDispatcher.WAIT)
+    for name in ("a", "b", "c"):
+        dispatcher.submit_later(1, [recorder.record], (name,), {})
+    await settle()
+    assert dispatcher.queued == 2
+    recorder.release.set()
+    await settle()
+    assert recorder.events == ["blocking", "a", "b", "c"]
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop():
+    dispatcher, recorder = await busy_dispatcher(EventDispatcher.DROP_NEW)
+    await dispatcher.submit(1, [recorder.record], ("dropped",), {})
+    await dispatcher.stop()
+    assert dispatcher.queued == 0
+    assert recorder.events == ["blocking"]
+    # The next event starts the workers again
+    await dispatcher.submit(1, [recorder.record], ("after",), {})
+    await settle()
+    assert recorder.events == ["blocking", "after"]
+    await dispatcher.stop()
+
+
+def test_invalid_policy():
+    with pytest.raises(InvalidOverflowPolicy):
+        EventDispatcher(overflow="unknown")
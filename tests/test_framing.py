@@ -0,0 +1,49 @@
+import pytest
+
+from pytgcalls.framing import HEADER, MAX_FRAME_SIZE, FrameDecoder, encode_frame
+
+
+def test_round_trip():
+    decoder = FrameDecoder()
+    payloads = [b"first", b"second", b"x" * 70000]
+    data = b"".join(encode_frame(payload) for payload in payloads)
+    assert decoder.feed(data) == payloads
+
+
+def test_empty_frame():
+    decoder = FrameDecoder()
+    assert decoder.feed(encode_frame(b"") + encode_frame(b"next")) == [
+        b"",
+        b"next",
+    ]
+
+
+def test_partial_frames():
+    decoder = FrameDecoder()
+    data = encode_frame(b"hello") + encode_frame(b"world")
+    frames = []
+    for i in range(len(data)):
+        frames += decoder.feed(data[i : i + 1])
+    assert frames == [b"hello", b"world"]
+
+
+def test_partial_header():
+    decoder = FrameDecoder()
+    data = encode_frame(b"payload")
+    assert decoder.feed(data[:2]) == []
+    assert decoder.feed(data[2:]) == [b"payload"]
+
+
+def test_leftover_is_kept():
+    decoder = FrameDecoder()
+    first = encode_frame(b"first")
+    second = encode_frame(b"second")
+    assert decoder.feed(first + second[:3]) == [b"first"]
+    assert decoder.feed(second[3:]) == [b"second"]
+    assert decoder.feed(b"") == []
+
+
+def test_oversized_frame():
+    decoder = FrameDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(HEADER.pack(MAX_FRAME_SIZE + 1))
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from pytgcalls.mtproto.participants_batcher import ParticipantsBatcher
+from pytgcalls.types.groups import GroupCallParticipant
+
+
+def participant(user_id: int) -> GroupCallParticipant:
+    return GroupCallParticipant(
+        user_id,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        100,
+    )
+
+
+async def collect(window: float, changes: list) -> dict:
+    batches = {}
+
+    async def on_batch(chat_id, batch):
+        batches[chat_id] = [
+            (change.user_id, just_joined, just_left)
+            for change, just_joined, just_left in batch
+        ]
+
+    batcher = ParticipantsBatcher(window, on_batch)
+    for chat_id, user_id, just_joined, just_left in changes:
+        batcher.add(chat_id, participant(user_id), just_joined, just_left)
+    await asyncio.sleep(window * 2)
+    return batches
+
+
+@pytest.mark.asyncio
+async def test_latest_state_is_kept():
+    batches = await collect(
+        0.01,
+        [
+            (1, 10, True, False),
+            (1, 10, False, False),
+            (1, 20, False, False),
+        ],
+    )
+    assert batches == {1: [(10, True, False), (20, False, False)]}
+
+
+@pytest.mark.asyncio
+async def test_joined_and_left_is_not_reported():
+    batches = await collect(
+        0.01,
+        [
+            (1, 10, True, False),
+            (1, 10, False, True),
+            (1, 20, False, True),
+        ],
+    )
+    assert batches == {1: [(20, False, True)]}
+
+
+@pytest.mark.asyncio
+async def test_chats_are_batched_apart():
+    batches = await collect(
+        0.01,
+        [
+            (1, 10, True, False),
+            (2, 10, False, True),
+        ],
+    )
+    assert batches == {1: [(10, True, False)], 2: [(10, False, True)]}
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from pytgcalls.mtproto.peer_cache import PeerCache
+
+
+def test_usernames_are_normalized():
+    cache = PeerCache()
+    cache.put("@SomeChat", -100)
+    assert cache.get("somechat") == -100
+    assert cache.get("@SOMECHAT") == -100
+
+
+def test_least_recently_used_is_evicted():
+    cache = PeerCache(max_size=2)
+    cache.put("first", 1)
+    cache.put("second", 2)
+    cache.get("first")
+    cache.put("third", 3)
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+
+def test_expired_entries():
+    cache = PeerCache(ttl=-1)
+    cache.put("chat", 1)
+    assert cache.get("chat") is None
+    assert len(cache) == 0
+
+
+def test_drop():
+    cache = PeerCache()
+    cache.put("chat", 1)
+    cache.put("alias", 1)
+    cache.put("other", 2)
+    cache.drop(1)
+    assert len(cache) == 1
+    assert cache.get("other") == 2
+
+
+@pytest.mark.asyncio
+async def test_resolutions_are_shared():
+    cache = PeerCache()
+    calls = []
+
+    async def resolver(username: str) -> int:
+        calls.append(username)
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(
+        cache.resolve("chat", resolver),
+        cache.resolve("@Chat", resolver),
+    )
+    assert results == [42, 42]
+    assert calls == ["chat"]
+    assert await cache.resolve("chat", resolver) == 42
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_resolution_is_not_cached():
+    cache = PeerCache()
+
+    async def resolver(username: str) -> int:
+        raise ValueError(username)
+
+    with pytest.raises(ValueError):
+        await cache.resolve("chat", resolver)
+    assert cache.get("chat") is None
@@ -0,0 +1,48 @@
+import pytest
+
+from pytgcalls.serializer import Serializer
+
+MESSAGE = {
+    "action": "update_request",
+    "chat_id": -1001185324811,
+    "entries": [[1, 2000, 0, 1]],
+    "text": "café",
+    "nothing": None,
+}
+
+
+def test_json_round_trip():
+    serializer = Serializer()
+    assert serializer.name == Serializer.JSON
+    assert Serializer.loads(serializer.dumps(MESSAGE)) == MESSAGE
+
+
+def test_msgpack_round_trip():
+    pytest.importorskip("msgpack")
+    serializer = Serializer()
+    serializer.use(Serializer.MSGPACK)
+    assert Serializer.loads(serializer.dumps(MESSAGE)) == MESSAGE
+
+
+def test_negotiate():
+    serializer = Serializer()
+    assert serializer.negotiate(["json"]) == Serializer.JSON
+    assert serializer.negotiate(["unknown"]) == Serializer.JSON
+
+
+def test_codec_switch_keeps_old_payloads():
+    pytest.importorskip("msgpack")
+    serializer = Serializer()
+    sent = serializer.dumps(MESSAGE)
+    serializer.use(Serializer.MSGPACK)
+    assert Serializer.loads(sent) == MESSAGE
+
+
+def test_empty_frame():
+    with pytest.raises(ValueError):
+        Serializer.loads(b"")
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        Serializer.loads(bytes((255,)) + b"{}")
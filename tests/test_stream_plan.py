@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from pytgcalls.stream_plan import StreamPlan, StreamPlanCache
+from pytgcalls.types import AudioParameters
+from pytgcalls.types.input_stream import AudioPiped
+
+
+@pytest.fixture
+def compiled(monkeypatch):
+    # The checks and probes of the plans need FFmpeg, only the
+    # streams that reach them are recorded
+    streams = []
+
+    async def compile(stream):
+        streams.append(stream)
+        return StreamPlan(False, {"path": stream.stream_audio.path}, None, True, False)
+
+    monkeypatch.setattr(StreamPlan, "compile", compile)
+    return streams
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(b"audio")
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_disabled_by_default(compiled, audio_file):
+    cache = StreamPlanCache()
+    await cache.compile(AudioPiped(audio_file))
+    await cache.compile(AudioPiped(audio_file))
+    assert len(compiled) == 2
+
+
+@pytest.mark.asyncio
+async def test_equal_streams_share_the_plan(compiled, audio_file):
+    cache = StreamPlanCache(60)
+    first = await cache.compile(AudioPiped(audio_file))
+    second = await cache.compile(AudioPiped(audio_file))
+    assert first is second
+    assert len(compiled) == 1
+
+
+@pytest.mark.asyncio
+async def test_parameters_are_part_of_the_key(compiled, audio_file):
+    cache = StreamPlanCache(60)
+    await cache.compile(AudioPiped(audio_file))
+    await cache.compile(AudioPiped(audio_file, AudioParameters(bitrate=24000)))
+    await cache.compile(AudioPiped(audio_file, additional_ffmpeg_parameters="-ss 10"))
+    assert len(compiled) == 3
+
+
+@pytest.mark.asyncio
+async def test_replaced_file_is_checked_again(compiled, audio_file):
+    cache = StreamPlanCache(60)
+    await cache.compile(AudioPiped(audio_file))
+    with open(audio_file, "wb") as f:
+        f.write(b"another audio")
+    await cache.compile(AudioPiped(audio_file))
+    assert len(compiled) == 2
+
+
+@pytest.mark.asyncio
+async def test_deleted_file_is_checked_again(compiled, audio_file):
+    cache = StreamPlanCache(60)
+    await cache.compile(AudioPiped(audio_file))
+    os.remove(audio_file)
+    await cache.compile(AudioPiped(audio_file))
+    assert len(compiled) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_plans(compiled, audio_file, monkeypatch):
+    cache = StreamPlanCache(60)
+    await cache.compile(AudioPiped(audio_file))
+    monkeypatch.setattr("pytgcalls.stream_plan.monotonic", lambda: 1e12)
+    await cache.compile(AudioPiped(audio_file))
+    assert len(compiled) == 2
+
+
+@pytest.mark.asyncio
+async def test_max_size(compiled, tmp_path):
+    cache = StreamPlanCache(60, max_size=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        paths.append(str(path))
+        await cache.compile(AudioPiped(str(path)))
+    await cache.compile(AudioPiped(paths[0]))
+    assert len(compiled) == 4
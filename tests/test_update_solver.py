@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from pytgcalls.exceptions import NodeJSNotRunning, NodeJSTimeout
+from pytgcalls.types.update_solver import UpdateSolver
+
+
+@pytest.mark.asyncio
+async def test_resolve():
+    solver = UpdateSolver()
+    future = solver.create_future_update(1, timeout=1)
+    assert solver.resolve_future_update(1, "result")
+    assert await future == "result"
+    assert len(solver) == 0
+    assert not solver.resolve_future_update(1, "again")
+
+
+@pytest.mark.asyncio
+async def test_deadline():
+    solver = UpdateSolver()
+    future = solver.create_future_update(1, 0.01, NodeJSTimeout("pause"))
+    with pytest.raises(NodeJSTimeout):
+        await future
+    assert len(solver) == 0
+    assert solver.expired == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_without_waiter():
+    solver = UpdateSolver()
+    future = solver.create_future_update(1, 0.01)
+    future.cancel()
+    await asyncio.sleep(0.02)
+    assert len(solver) == 0
+    assert solver.expired == 0
+
+
+@pytest.mark.asyncio
+async def test_resolve_cancels_deadline():
+    solver = UpdateSolver()
+    future = solver.create_future_update(1, 0.01)
+    solver.resolve_future_update(1, "result")
+    await asyncio.sleep(0.02)
+    assert await future == "result"
+    assert solver.expired == 0
+
+
+@pytest.mark.asyncio
+async def test_discard():
+    solver = UpdateSolver()
+    solver.create_future_update(1, 0.01)
+    solver.discard_future_update(1)
+    await asyncio.sleep(0.02)
+    assert len(solver) == 0
+    assert solver.expired == 0
+
+
+@pytest.mark.asyncio
+async def test_reject_all():
+    solver = UpdateSolver()
+    futures = [solver.create_future_update(i, 1) for i in range(3)]
+    solver.reject_all(NodeJSNotRunning)
+    for future in futures:
+        with pytest.raises(NodeJSNotRunning):
+            await future
+    assert len(solver) == 0
+
+
+@pytest.mark.asyncio
+async def test_oldest_age():
+    solver = UpdateSolver()
+    assert solver.oldest_age() == 0.0
+    solver.create_future_update(1)
+    await asyncio.sleep(0.01)
+    solver.create_future_update(2)
+    assert solver.oldest_age() >= 0.01